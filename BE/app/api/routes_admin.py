@@ -0,0 +1,98 @@
+"""
+VibeCurator Admin API
+관리 라우터 (무중단 핫 리로드)
+"""
+
+import hmac
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Request
+from pydantic import ValidationError
+
+from ..schemas.admin import ReloadRequest, ReloadStatusResponse
+from ..schemas.common import ErrorResponse
+from ..core.startup import start_reload
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def _check_token(state, token: Optional[str]) -> None:
+    """관리 토큰 확인 (ADMIN_TOKEN 미설정 시 관리 API 비활성화)"""
+    expected = state.config.ADMIN_TOKEN
+    if not expected:
+        raise HTTPException(status_code=403, detail="Admin API disabled (ADMIN_TOKEN not set)")
+    if token is None or not hmac.compare_digest(token, expected):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+def _reload_status(state) -> ReloadStatusResponse:
+    loading = state.reload_loading
+    task = state.reload_task
+    return ReloadStatusResponse(
+        generation=state.generation,
+        engine_version=state.config.ENGINE_VERSION,
+        reloading=task is not None and not task.done(),
+        phase=loading.phase if loading is not None else None,
+        elapsed_sec=loading.elapsed_sec if loading is not None else None,
+        resources=loading.progress() if loading is not None else {},
+        error=state.reload_error
+    )
+
+
+@router.post(
+    "/reload",
+    response_model=ReloadStatusResponse,
+    status_code=202,
+    responses={
+        401: {"model": ErrorResponse, "description": "Invalid admin token"},
+        403: {"model": ErrorResponse, "description": "Admin API disabled"},
+        409: {"model": ErrorResponse, "description": "Loading or reload in progress"},
+        422: {"model": ErrorResponse, "description": "Invalid settings"}
+    }
+)
+async def reload_engine(
+    request: Request,
+    body: Optional[ReloadRequest] = None,
+    x_admin_token: Optional[str] = Header(default=None)
+) -> ReloadStatusResponse:
+    """
+    엔진 아티팩트 핫 리로드 (이 워커만, 멀티 워커는 워커별 호출 또는 SIGHUP)
+    
+    - 환경변수 / .env를 다시 읽고 overrides를 덮어쓴 설정으로 새 리소스 / 엔진을 백그라운드 로드
+    - 완료되면 한 번에 교체, 그동안 기존 엔진이 계속 응답 (진행 상황은 GET /admin/reload)
+    - 캐시 키가 ENGINE_VERSION으로 구분되므로 버전을 올리면 flush 없이 새 결과로 전환
+    """
+    state = request.app.state
+    _check_token(state, x_admin_token)
+    
+    overrides = body.overrides if body is not None else {}
+    try:
+        started = start_reload(state, overrides)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if not started:
+        raise HTTPException(status_code=409, detail="Loading or reload already in progress")
+    
+    logger.info(f"Reload requested (overrides={sorted(overrides)})")
+    return _reload_status(state)
+
+
+@router.get(
+    "/reload",
+    response_model=ReloadStatusResponse,
+    responses={
+        401: {"model": ErrorResponse, "description": "Invalid admin token"},
+        403: {"model": ErrorResponse, "description": "Admin API disabled"}
+    }
+)
+async def reload_status(
+    request: Request,
+    x_admin_token: Optional[str] = Header(default=None)
+) -> ReloadStatusResponse:
+    """현재 세대 및 마지막 리로드 진행 상황"""
+    state = request.app.state
+    _check_token(state, x_admin_token)
+    return _reload_status(state)
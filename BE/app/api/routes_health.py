@@ -4,8 +4,11 @@ VibeCurator Health Check API
 """
 
 from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Dict, Optional
+
+from ..utils.memory import is_memory_mapped, rss_breakdown
 
 router = APIRouter(tags=["health"])
 
@@ -13,6 +16,12 @@ router = APIRouter(tags=["health"])
 class HealthResponse(BaseModel):
     """헬스 체크 응답"""
     status: str
+    ready: bool = False
+    loading_phase: str = "loading"  # loading / ready / failed
+    loading_elapsed_sec: float = 0.0
+    resources: Dict[str, Dict[str, Any]] = {}  # 리소스별 {status, elapsed_sec, error}
+    generation: int = 1  # 서빙 중인 세대 (핫 리로드 성공마다 +1)
+    reloading: bool = False
     engine_version: str
     audio_model: str
     demo_mode: bool
@@ -21,9 +30,58 @@ class HealthResponse(BaseModel):
     meta_audio_loaded: bool
     meta_audio_count: int
     item2vec_loaded: bool
+    cf_vocab_count: int = 0
+    cf_servable_count: int = 0
     audio_loaded: bool
     audio_model_type: Optional[str] = None
     redis_connected: bool
+    engine_executor: Dict[str, Any] = {}  # 엔진 실행 백엔드 {backend, workers, pending, rejected, timeouts, ...}
+    local_cache: Dict[str, Any] = {}  # 프로세스 내 1차 캐시 {entries, bytes, hits, misses, hit_rate, expirations, evictions, ...}
+    single_flight: Dict[str, Any] = {}  # 동시 미스 합치기 {inflight, computed, coalesced, remote_coalesced, duplicates_avoided, ...}
+    cache_refresher: Dict[str, Any] = {}  # 캐시 신선도 {stale_sec, refreshing, stale_hits, early_refreshes, refreshes, refresh_errors, ...}
+    memory_mode: str = "private"  # shared / mixed / private
+    residency: Dict[str, str] = {}  # 리소스별 shared(파일 memmap) / private(워커 전용 사본)
+    snapshot_path: Optional[str] = None
+    rss_mb: float = 0.0
+    rss_shared_mb: float = 0.0
+    rss_private_mb: float = 0.0
+
+
+class ReadinessResponse(BaseModel):
+    """준비 상태 응답"""
+    ready: bool
+    phase: str
+    elapsed_sec: float
+
+
+def _array_residency(arr: Any) -> str:
+    return "shared" if is_memory_mapped(arr) else "private"
+
+
+def _resource_residency(state: Any) -> Dict[str, str]:
+    """리소스별 메모리 상주 형태 (shared: 파일 memmap으로 워커 간 공유, private: 워커 전용 사본)"""
+    residency: Dict[str, str] = {}
+    
+    meta = getattr(state, 'meta_full', None)
+    if meta is not None and meta.catalog is not None:
+        residency["meta"] = _array_residency(meta.catalog.song_ids)
+    
+    engine = getattr(state, 'engine', None)
+    cf_index = engine.cf_index if engine is not None else None
+    if cf_index is not None:
+        # 양자화 인덱스는 codes, 그 외는 float32 벡터 행렬
+        matrix = getattr(cf_index, "matrix", None)
+        residency["cf"] = _array_residency(matrix.codes if matrix is not None else cf_index.vectors)
+    
+    neighbor_table = getattr(state, 'neighbor_table', None)
+    if neighbor_table is not None:
+        residency["cf_neighbors"] = _array_residency(neighbor_table.ids)
+    
+    audio = getattr(state, 'audio_bundle', None)
+    if audio is not None:
+        residency["audio"] = _array_residency(getattr(audio.embeddings, "codes", audio.embeddings))
+    
+    return residency
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -33,10 +91,14 @@ async def health_check(request: Request) -> HealthResponse:
     
     - 엔진 버전 및 오디오 모델 정보
     - 리소스 로드 상태 (메타, Item2Vec, 오디오 임베딩)
+    - CF 검색 대상 vocab 크기 (전체 / 메타와 교집합)
     - Redis 연결 상태
+    - 메모리 상주 형태 (공유 스냅샷 attach 여부, 리소스별 shared / private, RSS 공유 / 전용 분해)
+    - 백그라운드 로드 진행 상황 (리소스별 pending / loading / loaded / skipped / failed, 로드 중에도 즉시 응답)
     """
     state = request.app.state
     config = state.config
+    loading = state.loading
     
     # 메타 상태 (song_meta.json)
     meta_full_loaded = getattr(state, 'meta_full_loaded', False)
@@ -49,6 +111,11 @@ async def health_check(request: Request) -> HealthResponse:
     # Item2Vec 상태
     item2vec_loaded = getattr(state, 'item2vec_loaded', False)
     
+    # CF 검색 대상 (vocab 전체 / vocab ∩ 메타)
+    engine = getattr(state, 'engine', None)
+    cf_vocab_count = engine.cf_vocab_size if engine is not None else 0
+    cf_servable_count = engine.cf_servable_size if engine is not None else 0
+    
     # 오디오 임베딩 상태
     audio_loaded = getattr(state, 'audio_loaded', False)
     audio_model_type = state.audio_bundle.model_type if state.audio_bundle is not None else None
@@ -56,16 +123,35 @@ async def health_check(request: Request) -> HealthResponse:
     # Redis 상태
     redis_connected = False
     if state.redis_cache is not None:
-        redis_connected = state.redis_cache.ping()
+        redis_connected = await state.redis_cache.ping()
+    local_cache = getattr(state, 'local_cache', None)
+    engine_executor = getattr(state, 'engine_executor', None)
+    single_flight = getattr(state, 'single_flight', None)
+    cache_refresher = getattr(state, 'cache_refresher', None)
+    
+    # 메모리 상주 형태
+    residency = _resource_residency(state)
+    modes = set(residency.values())
+    memory_mode = "mixed" if len(modes) > 1 else (modes.pop() if modes else "private")
+    snapshot = getattr(state, 'snapshot', None)
+    rss = rss_breakdown()
     
     # 전체 상태 결정 (meta_full이 필수)
-    if meta_full_loaded:
+    if not loading.finished:
+        status = "loading"
+    elif meta_full_loaded:
         status = "ok"
     else:
         status = "degraded"
     
     return HealthResponse(
         status=status,
+        ready=loading.ready,
+        loading_phase=loading.phase,
+        loading_elapsed_sec=loading.elapsed_sec,
+        resources=loading.progress(),
+        generation=state.generation,
+        reloading=state.reload_task is not None and not state.reload_task.done(),
         engine_version=config.ENGINE_VERSION,
         audio_model=config.AUDIO_MODEL,
         demo_mode=config.DEMO_MODE,
@@ -74,8 +160,40 @@ async def health_check(request: Request) -> HealthResponse:
         meta_audio_loaded=meta_audio_loaded,
         meta_audio_count=meta_audio_count,
         item2vec_loaded=item2vec_loaded,
+        cf_vocab_count=cf_vocab_count,
+        cf_servable_count=cf_servable_count,
         audio_loaded=audio_loaded,
         audio_model_type=audio_model_type,
-        redis_connected=redis_connected
+        redis_connected=redis_connected,
+        local_cache=local_cache.stats() if local_cache is not None else {},
+        engine_executor=engine_executor.stats() if engine_executor is not None else {},
+        single_flight=single_flight.stats() if single_flight is not None else {},
+        cache_refresher=cache_refresher.stats() if cache_refresher is not None else {},
+        memory_mode=memory_mode,
+        residency=residency,
+        snapshot_path=snapshot.path if snapshot is not None else None,
+        rss_mb=round(rss.get("rss", 0) / 2**20, 1),
+        rss_shared_mb=round(rss.get("shared", 0) / 2**20, 1),
+        rss_private_mb=round(rss.get("private", 0) / 2**20, 1)
     )
 
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "Engine not ready"}}
+)
+async def readiness_check(request: Request):
+    """
+    준비 상태 확인 (로드밸런서 / 오케스트레이터 readiness probe용)
+    
+    - 추천 엔진이 생성된 뒤에만 200
+    - 로드 중이면 503 + Retry-After, 엔진 없이 로드가 끝났으면 503
+    """
+    state = request.app.state
+    loading = state.loading
+    body = ReadinessResponse(ready=loading.ready, phase=loading.phase, elapsed_sec=loading.elapsed_sec)
+    if loading.ready:
+        return body
+    headers = {} if loading.finished else {"Retry-After": str(state.config.NOT_READY_RETRY_AFTER_SEC)}
+    return JSONResponse(status_code=503, content=body.model_dump(), headers=headers)
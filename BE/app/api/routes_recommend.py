@@ -4,23 +4,113 @@ VibeCurator Recommendation API
 """
 
 import logging
+from typing import List, Optional
 from fastapi import APIRouter, Request, HTTPException, Query
 
-from ..schemas.recommend import RecommendResponse, SeedInfo, RecommendItem
+from ..schemas.recommend import (
+    RecommendResponse,
+    SeedInfo,
+    RecommendItem,
+    BatchRecommendRequest,
+    BatchRecommendResult,
+    BatchRecommendResponse,
+    PlaylistRecommendRequest,
+    PlaylistRecommendResponse
+)
 from ..schemas.common import ErrorResponse
-from ..core.cache import make_recommend_cache_key, get_json, set_json
+from ..core.engine import RecommendationEngine
+from ..core.executor import EngineBusyError, EngineExecutor, EngineTimeoutError
+from ..core.cache import (
+    make_recommend_cache_key,
+    make_playlist_cache_key,
+    recommend_cache_depth,
+    get_or_compute,
+    get_or_compute_many
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["recommend"])
 
 
+def _require_engine(state) -> RecommendationEngine:
+    """
+    엔진 준비 확인 (백그라운드 로드 중이면 Retry-After와 함께 503, 로드가 끝났는데 엔진이 없으면 503)
+    
+    요청 동안은 반환된 엔진만 사용 (핫 리로드로 state.engine이 교체되어도 진행 중 요청은 이전 엔진으로 완료)
+    """
+    engine = state.engine
+    if engine is not None:
+        return engine
+    if not state.loading.finished:
+        raise HTTPException(
+            status_code=503,
+            detail="Recommendation engine loading",
+            headers={"Retry-After": str(state.config.NOT_READY_RETRY_AFTER_SEC)}
+        )
+    raise HTTPException(status_code=503, detail="Recommendation engine not initialized")
+
+
+async def _call_engine(
+    engine_executor: Optional[EngineExecutor],
+    engine: RecommendationEngine,
+    method: str,
+    **kwargs
+):
+    """
+    엔진 호출 (ENGINE_BACKEND 실행기 경유, 이벤트 루프 밖에서 계산)
+    
+    대기열 초과는 503 + Retry-After, 요청별 타임아웃은 504
+    엔진 예외(ValueError / RuntimeError 등)는 그대로 전달
+    """
+    if engine_executor is None:
+        return getattr(engine, method)(**kwargs)
+    try:
+        return await engine_executor.run(engine, method, **kwargs)
+    except EngineBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except EngineTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+
+
+def _cached_recommendation(data: dict) -> dict:
+    """
+    캐시 JSON -> 1차 캐시 항목 (시드 추천)
+    
+    응답 모델로 한 번만 검증해 보관하고, 이후 적중은 모델 인스턴스를 그대로 재사용 (json.loads / 재검증 없음)
+    """
+    return {
+        "method": data.get("method", "unknown"),
+        "seed": SeedInfo(**data["seed"]),
+        "items": [RecommendItem(**item) for item in data["items"]]
+    }
+
+
+def _top_k(items: List[RecommendItem], k: int) -> List[RecommendItem]:
+    """
+    캐시 깊이까지 계산된 순위 목록 -> 상위 k개 (rank 필드는 그대로)
+    
+    메타 없는 곡은 rank를 건너뛰므로 위치가 아니라 rank <= k 기준으로 자름
+    """
+    return [item for item in items[:k] if item.rank <= k]
+
+
+def _cached_playlist(data: dict) -> dict:
+    """캐시 JSON -> 1차 캐시 항목 (플레이리스트 추천)"""
+    return {
+        "method": data.get("method", "unknown"),
+        "seeds": [SeedInfo(**seed) for seed in data["seeds"]],
+        "items": [RecommendItem(**item) for item in data["items"]]
+    }
+
+
 @router.get(
     "/recommend",
     response_model=RecommendResponse,
     responses={
         404: {"model": ErrorResponse, "description": "Seed not found"},
-        503: {"model": ErrorResponse, "description": "Resources not loaded"}
+        503: {"model": ErrorResponse, "description": "Resources not loaded / engine queue full"},
+        504: {"model": ErrorResponse, "description": "Engine timeout"}
     }
 )
 async def recommend(
@@ -34,39 +124,50 @@ async def recommend(
     - seed_id: 시드 곡 ID
     - k: 추천 개수 (1~100, 기본값 20)
     
-    캐시가 있으면 캐시에서 반환, 없으면 엔진으로 계산 후 캐시 저장
+    캐시가 있으면 캐시에서 반환 (프로세스 내 1차 캐시 -> Redis), 없으면 엔진으로 계산 후 두 캐시에 저장
+    soft TTL(CACHE_TTL_SEC)이 지난 항목은 CACHE_STALE_SEC 동안 그대로 응답하고 백그라운드에서 재계산
+    캐시는 k와 무관하게 시드당 CACHE_MAX_K개까지 저장하고 앞부분을 잘라 응답 (k=10 / 20 / 50이 한 항목 공유)
     """
     state = request.app.state
     config = state.config
     
-    # 엔진 확인
-    if state.engine is None:
-        raise HTTPException(status_code=503, detail="Recommendation engine not initialized")
+    # 엔진 확인 (로드 중이면 즉시 503 + Retry-After)
+    # config / engine / 캐시는 요청 시작 시 한 번만 읽음 (핫 리로드 중에도 같은 세대로 처리)
+    engine = _require_engine(state)
+    engine_executor = state.engine_executor
+    redis_cache = state.redis_cache
+    local_cache = state.local_cache
+    single_flight = state.single_flight
+    cache_refresher = state.cache_refresher
     
-    # 캐시 키 생성
+    # 캐시 키 생성 (k 대신 캐시 깊이)
+    depth = recommend_cache_depth(k, config.CACHE_MAX_K)
     cache_key = make_recommend_cache_key(
         engine_version=config.ENGINE_VERSION,
         audio_model=config.AUDIO_MODEL,
         seed_id=seed_id,
-        k=k
+        k=depth
     )
     
-    # 캐시 조회
-    cached_data = get_json(state.redis_cache, cache_key)
-    if cached_data is not None:
-        logger.debug(f"Cache hit: {cache_key}")
-        return RecommendResponse(
-            engine_version=config.ENGINE_VERSION,
-            audio_model=config.AUDIO_MODEL,
-            cached=True,
-            method=cached_data.get("method", "unknown"),
-            seed=SeedInfo(**cached_data["seed"]),
-            items=[RecommendItem(**item) for item in cached_data["items"]]
-        )
+    # 추천 실행 (캐시 깊이까지) -> (1차에 보관할 검증된 모델, Redis에 저장할 JSON, 둘 다 캐시 깊이 전체)
+    async def compute() -> tuple:
+        result = await _call_engine(engine_executor, engine, "recommend", seed_id=seed_id, k=depth)
+        cache_data = {
+            "method": result["method"],
+            "seed": result["seed"],
+            "items": result["items"]
+        }
+        return _cached_recommendation(result), cache_data
     
-    # 추천 실행
+    # 캐시 조회 (1차 적중이면 네트워크 I/O 없음, soft TTL이 지난 항목은 바로 응답하고 백그라운드 재계산)
+    # 미스면 계산 후 저장 (같은 키의 동시 미스는 1회만 계산하고 결과 공유)
     try:
-        result = state.engine.recommend(seed_id=seed_id, k=k)
+        cached, from_cache = await get_or_compute(
+            single_flight, cache_refresher, local_cache, redis_cache,
+            cache_key, _cached_recommendation, compute, config.CACHE_TTL_SEC
+        )
+    except HTTPException:
+        raise
     except ValueError as e:
         # 시드 없음
         raise HTTPException(status_code=404, detail=str(e))
@@ -77,23 +178,205 @@ async def recommend(
         logger.error(f"Recommendation error: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
     
-    # 응답 생성
-    response = RecommendResponse(
+    # 응답 생성 (캐시 적중, 또는 다른 워커가 계산해 캐시에 쓴 결과를 받았으면 cached=True)
+    return RecommendResponse(
         engine_version=config.ENGINE_VERSION,
         audio_model=config.AUDIO_MODEL,
-        cached=False,
-        method=result["method"],
-        seed=SeedInfo(**result["seed"]),
-        items=[RecommendItem(**item) for item in result["items"]]
+        cached=from_cache,
+        method=cached["method"],
+        seed=cached["seed"],
+        items=_top_k(cached["items"], k)
     )
-    
-    # 캐시 저장
-    cache_data = {
-        "method": result["method"],
-        "seed": result["seed"],
-        "items": result["items"]
+
+
+
+@router.post(
+    "/recommend/batch",
+    response_model=BatchRecommendResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Too many seeds"},
+        503: {"model": ErrorResponse, "description": "Resources not loaded / engine queue full"},
+        504: {"model": ErrorResponse, "description": "Engine timeout"}
     }
-    set_json(state.redis_cache, cache_key, cache_data, config.CACHE_TTL_SEC)
+)
+async def recommend_batch(request: Request, body: BatchRecommendRequest) -> BatchRecommendResponse:
+    """
+    곡 일괄 추천
+    
+    - seed_ids: 시드 곡 ID 목록 (최대 BATCH_MAX_SEEDS개)
+    - k: 시드당 추천 개수 (1~100, 기본값 20)
+    
+    캐시는 1차 미스 키만 MGET 1회로 조회하고, 미스 시드만 엔진에서 일괄 계산 후 1차 + 파이프라인으로 저장
+    시드별 결과는 GET /recommend와 동일하며 입력 순서대로 반환
+    """
+    state = request.app.state
+    config = state.config
+    
+    # 엔진 확인 (로드 중이면 즉시 503 + Retry-After)
+    engine = _require_engine(state)
+    engine_executor = state.engine_executor
+    redis_cache = state.redis_cache
+    local_cache = state.local_cache
+    single_flight = state.single_flight
+    cache_refresher = state.cache_refresher
+    
+    if len(body.seed_ids) > config.BATCH_MAX_SEEDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many seeds: {len(body.seed_ids)} > {config.BATCH_MAX_SEEDS}"
+        )
     
-    return response
+    # 캐시 키 생성 + 일괄 조회 (GET /recommend와 같은 캐시 깊이 키 공유)
+    depth = recommend_cache_depth(body.k, config.CACHE_MAX_K)
+    cache_keys = [
+        make_recommend_cache_key(
+            engine_version=config.ENGINE_VERSION,
+            audio_model=config.AUDIO_MODEL,
+            seed_id=seed_id,
+            k=depth
+        )
+        for seed_id in body.seed_ids
+    ]
+    
+    # 미스 시드만 엔진에서 일괄 계산 (중복 시드는 1회) -> {키: (1차 캐시 객체, Redis 저장 JSON) 또는 시드별 예외}
+    seed_by_key = dict(zip(cache_keys, body.seed_ids))
+    
+    async def compute(keys: List[str]) -> dict:
+        outputs = await _call_engine(
+            engine_executor, engine, "recommend_batch", seed_ids=[seed_by_key[key] for key in keys], k=depth
+        )
+        return {
+            key: result if isinstance(result, Exception) else (
+                _cached_recommendation(result),
+                {"method": result["method"], "seed": result["seed"], "items": result["items"]}
+            )
+            for key, result in zip(keys, outputs)
+        }
+    
+    # 1차 미스 키만 MGET 1회, stale 항목은 응답 후 백그라운드 재계산, 다른 요청이 계산 중인 시드는 그 결과에 합류
+    try:
+        outcomes = await get_or_compute_many(
+            single_flight, cache_refresher, local_cache, redis_cache,
+            cache_keys, _cached_recommendation, compute, config.CACHE_TTL_SEC
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch recommendation error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    # 결과 조립 (입력 순서)
+    results = []
+    for seed_id, (entry, from_cache) in zip(body.seed_ids, outcomes):
+        if isinstance(entry, Exception):
+            if isinstance(entry, HTTPException):
+                status, detail = entry.status_code, str(entry.detail)
+            elif isinstance(entry, ValueError):
+                status, detail = 404, str(entry)
+            elif isinstance(entry, RuntimeError):
+                status, detail = 503, str(entry)
+            else:
+                status, detail = 500, str(entry)
+            results.append(BatchRecommendResult(seed_id=seed_id, status=status, detail=detail))
+            continue
+        
+        results.append(BatchRecommendResult(
+            seed_id=seed_id,
+            status=200,
+            cached=from_cache,
+            method=entry["method"],
+            seed=entry["seed"],
+            items=_top_k(entry["items"], body.k)
+        ))
+    
+    return BatchRecommendResponse(
+        engine_version=config.ENGINE_VERSION,
+        audio_model=config.AUDIO_MODEL,
+        results=results
+    )
+
 
+@router.post(
+    "/recommend/playlist",
+    response_model=PlaylistRecommendResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Too many seeds"},
+        404: {"model": ErrorResponse, "description": "Seed not found"},
+        503: {"model": ErrorResponse, "description": "Resources not loaded / engine queue full"},
+        504: {"model": ErrorResponse, "description": "Engine timeout"}
+    }
+)
+async def recommend_playlist(request: Request, body: PlaylistRecommendRequest) -> PlaylistRecommendResponse:
+    """
+    플레이리스트 이어듣기 추천 (다중 시드)
+    
+    - seed_ids: 플레이리스트 곡 ID 목록 (최대 PLAYLIST_MAX_SEEDS개, 순서 무관)
+    - k: 추천 개수 (1~100, 기본값 20)
+    - fusion: 시드 결합 방식 (mean: 벡터 평균 / max: 최대 유사도 / sum: 유사도 합)
+    
+    시드 자신들은 결과에서 제외
+    """
+    state = request.app.state
+    config = state.config
+    
+    # 엔진 확인 (로드 중이면 즉시 503 + Retry-After)
+    engine = _require_engine(state)
+    engine_executor = state.engine_executor
+    redis_cache = state.redis_cache
+    local_cache = state.local_cache
+    single_flight = state.single_flight
+    cache_refresher = state.cache_refresher
+    
+    if len(body.seed_ids) > config.PLAYLIST_MAX_SEEDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many seeds: {len(body.seed_ids)} > {config.PLAYLIST_MAX_SEEDS}"
+        )
+    
+    # 캐시 키 생성 (정렬된 시드 집합 + 캐시 깊이 기준)
+    depth = recommend_cache_depth(body.k, config.CACHE_MAX_K)
+    cache_key = make_playlist_cache_key(
+        engine_version=config.ENGINE_VERSION,
+        audio_model=config.AUDIO_MODEL,
+        seed_ids=body.seed_ids,
+        k=depth,
+        fusion=body.fusion
+    )
+    
+    # 추천 실행 (캐시 깊이 전체 저장)
+    async def compute() -> tuple:
+        result = await _call_engine(
+            engine_executor, engine, "recommend_playlist", seed_ids=body.seed_ids, k=depth, fusion=body.fusion
+        )
+        cache_data = {
+            "method": result["method"],
+            "seeds": result["seeds"],
+            "items": result["items"]
+        }
+        return _cached_playlist(result), cache_data
+    
+    # 캐시 조회 -> 미스면 계산 후 저장 (GET /recommend와 동일)
+    try:
+        cached, from_cache = await get_or_compute(
+            single_flight, cache_refresher, local_cache, redis_cache,
+            cache_key, _cached_playlist, compute, config.CACHE_TTL_SEC
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Playlist recommendation error: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+    
+    return PlaylistRecommendResponse(
+        engine_version=config.ENGINE_VERSION,
+        audio_model=config.AUDIO_MODEL,
+        cached=from_cache,
+        method=cached["method"],
+        fusion=body.fusion,
+        seeds=cached["seeds"],
+        items=_top_k(cached["items"], body.k)
+    )
@@ -4,8 +4,9 @@ VibeCurator Songs API
 """
 
 from fastapi import APIRouter, Request, HTTPException, Query
-from typing import List
+from typing import Any, Iterable, List
 
+from ..core.autocomplete import MAX_LIMIT as AUTOCOMPLETE_MAX_LIMIT
 from ..schemas.songs import SongItem, SongResponse, SearchResponse
 
 router = APIRouter(tags=["songs"])
@@ -19,11 +20,12 @@ async def get_song(request: Request, song_id: int) -> SongResponse:
     - song_id: 조회할 곡 ID
     """
     state = request.app.state
+    meta_full = state.meta_full
     
-    if state.meta_registry is None:
+    if meta_full is None:
         raise HTTPException(status_code=503, detail="Metadata not loaded")
     
-    meta = state.meta_registry.songs.get(song_id)
+    meta = meta_full.songs.get(song_id)
     if meta is None:
         raise HTTPException(status_code=404, detail=f"Song not found: {song_id}")
     
@@ -47,36 +49,59 @@ async def search_songs(
     """
     곡 검색 (곡명 + 아티스트)
     
-    - q: 검색어 (대소문자 무시)
+    - q: 검색어 (대소문자 무시, 부분 문자열 매칭)
     - limit: 최대 결과 개수 (1~100)
+    
+    trigram 인덱스로 후보를 찾고 곡명 일치 > 곡명 접두 > 아티스트 접두 > 그 외 순으로 정렬
     """
     state = request.app.state
+    meta_full = state.meta_full
     
-    if state.meta_registry is None:
+    if meta_full is None or meta_full.search is None:
         raise HTTPException(status_code=503, detail="Metadata not loaded")
     
-    # 검색어 정규화
-    query_lower = q.lower().strip()
+    return _search_response(q, meta_full, meta_full.search.search(q, limit))
+
+
+@router.get("/search/autocomplete", response_model=SearchResponse)
+async def autocomplete_songs(
+    request: Request,
+    q: str = Query(..., min_length=1, description="입력 중인 검색어 (완성 음절 / 초성 / 자모)"),
+    limit: int = Query(default=10, ge=1, le=AUTOCOMPLETE_MAX_LIMIT, description="결과 개수")
+) -> SearchResponse:
+    """
+    곡명 / 아티스트 자동완성 (키 입력마다 호출)
+    
+    - q: "방탄" / "ㅂㅌㅅ"(초성) / "방ㅌ"(입력 중인 자모) 모두 "방탄소년단"과 매칭, 대소문자 / 공백 무시
+    - limit: 최대 결과 개수 (1~100)
     
-    # 검색 인덱스에서 매칭
+    곡명 또는 아티스트가 q로 시작하는 곡을 인기도(Item2Vec vocab 빈도) 순으로
+    """
+    state = request.app.state
+    meta_full = state.meta_full
+    
+    if meta_full is None or meta_full.autocomplete is None:
+        raise HTTPException(status_code=503, detail="Autocomplete index not loaded")
+    
+    return _search_response(q, meta_full, meta_full.autocomplete.complete(q, limit))
+
+
+def _search_response(query: str, meta_full: Any, song_ids: Iterable[int]) -> SearchResponse:
+    """song_id 목록 -> 검색 응답 (메타에 없는 곡은 제외)"""
     results: List[SongItem] = []
-    for song_id, search_text in state.meta_registry.search_index:
-        if query_lower in search_text:
-            meta = state.meta_registry.songs.get(song_id)
-            if meta:
-                results.append(SongItem(
-                    song_id=meta.song_id,
-                    song_name=meta.song_name,
-                    artist=meta.artist,
-                    genre=meta.genre,
-                    issue_year=meta.issue_year
-                ))
-                if len(results) >= limit:
-                    break
+    for song_id in song_ids:
+        meta = meta_full.songs.get(song_id)
+        if meta:
+            results.append(SongItem(
+                song_id=meta.song_id,
+                song_name=meta.song_name,
+                artist=meta.artist,
+                genre=meta.genre,
+                issue_year=meta.issue_year
+            ))
     
     return SearchResponse(
-        query=q,
+        query=query,
         total=len(results),
         items=results
     )
-
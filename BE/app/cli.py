@@ -0,0 +1,914 @@
+"""
+VibeCurator Backend CLI
+오프라인 빌드/운영 명령어
+
+사용법 (BE 디렉터리에서):
+    python -m app.cli build-neighbors --out data/cf_neighbors
+    python -m app.cli build-ann --space cf --out data/cf_ivf.npz
+    python -m app.cli ann-report --space cf --nprobe 1,2,4,8,16,32
+    python -m app.cli quantize --space audio --dtype int8 --out data/audio_int8 --keep-full
+    python -m app.cli quant-report --space cf --dtypes float16,int8
+    python -m app.cli build-snapshot --out data/catalog.snap
+    python -m app.cli export-kv --out data/item2vec.kv
+    python -m app.cli bench-meta-load --kind melon --repeat 3
+    python -m app.cli bench-search --sizes 100000,1000000
+    python -m app.cli build-search-prior --out data/search_prior.npz
+    python -m app.cli bench-autocomplete --sizes 100000,1000000
+    python -m app.cli replay-cache --log logs/access.log --capacity 10000
+    python -m app.cli bench-redis --requests 5000 --concurrency 64
+    python -m app.cli bench-serving --url http://localhost:8000 --requests 3000 --concurrency 32
+    python -m app.cli warm-cache --source vocab --limit 50000
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import multiprocessing as mp
+import os
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .core.config import get_settings
+from .core.cache import LocalCache, RedisCache, make_recommend_cache_key, recommend_cache_depth
+from .core.loaders import (
+    export_item2vec_vectors,
+    keyed_vector_counts,
+    load_audio_embeddings,
+    load_audio_song_meta,
+    load_item2vec_model,
+    load_song_meta_melon
+)
+from .core.retrieval import ItemVectorIndex
+from .core.neighbors import build_neighbor_table
+from .core.ann import IVFFlatIndex, recall_report
+from .core.snapshot import build_snapshot_from_sources, load_snapshot
+from .core.search import SongSearchIndex, scan_search
+from .core.startup import init_resource_state, load_resources
+from .core.warmup import WARMUP_SOURCES, format_progress, recommend_traffic, warm_cache, warmup_seeds
+from .core.autocomplete import (
+    AutocompleteIndex,
+    align_prior,
+    choseong_key,
+    is_choseong_query,
+    jamo_key,
+    keystroke_prefixes,
+    save_search_prior
+)
+from .core.quantization import (
+    QUANT_DTYPES,
+    QuantizedMatrix,
+    QuantizedVectorIndex,
+    accuracy_report,
+    load_quantized_index,
+    save_quantized
+)
+from .utils.logging import setup_logging
+from .utils.memory import current_rss_bytes, peak_rss_bytes
+
+logger = logging.getLogger(__name__)
+
+
+def _load_servable_index(meta_path: str, item2vec_path: str) -> ItemVectorIndex:
+    """메타 + Item2Vec 로드 후 vocab ∩ 메타 인덱스 생성"""
+    meta = load_song_meta_melon(meta_path, demo_mode=False)
+    model = load_item2vec_model(item2vec_path)
+    if model is None:
+        raise RuntimeError(f"Item2Vec 모델을 로드할 수 없습니다: {item2vec_path}")
+    index = ItemVectorIndex.from_keyed_vectors(model)
+    return index.restrict_to(np.asarray(meta.song_ids, dtype=np.int64))
+
+
+def _load_space_index(args: argparse.Namespace) -> ItemVectorIndex:
+    """--space 인자에 맞는 exact 인덱스 로드 (cf: vocab ∩ 메타, audio: 오디오 임베딩)"""
+    config = get_settings()
+    if args.space == "cf":
+        return _load_servable_index(
+            args.song_meta or config.SONG_META_PATH,
+            args.item2vec or config.ITEM2VEC_PATH
+        )
+    bundle = load_audio_embeddings(
+        audio_model=config.AUDIO_MODEL,
+        myna_path=config.AUDIO_EMB_MYNA_PATH,
+        cnn_path=config.AUDIO_EMB_CNN_PATH
+    )
+    if bundle is None:
+        raise RuntimeError(f"오디오 임베딩을 로드할 수 없습니다 ({config.AUDIO_MODEL})")
+    return ItemVectorIndex(bundle.song_ids, bundle.embeddings, normalized=True)
+
+
+def cmd_build_neighbors(args: argparse.Namespace) -> int:
+    """전체 vocab top-N 이웃 테이블 빌드"""
+    config = get_settings()
+    index = _load_servable_index(
+        args.song_meta or config.SONG_META_PATH,
+        args.item2vec or config.ITEM2VEC_PATH
+    )
+
+    start = time.perf_counter()
+    n = build_neighbor_table(
+        index,
+        prefix=args.out,
+        topn=args.topn or config.CANDIDATE_TOPN,
+        block_size=args.block_size,
+        workers=args.workers
+    )
+    elapsed = time.perf_counter() - start
+    logger.info(f"빌드 완료: {n:,}곡, {elapsed:.1f}s ({n / max(elapsed, 1e-9):,.0f} seeds/s)")
+    return 0
+
+
+def cmd_build_ann(args: argparse.Namespace) -> int:
+    """IVF 인덱스 빌드 후 저장"""
+    config = get_settings()
+    exact = _load_space_index(args)
+    ivf = IVFFlatIndex.build(
+        exact,
+        nlist=args.nlist if args.nlist is not None else config.ANN_NLIST,
+        nprobe=args.nprobe or config.ANN_NPROBE
+    )
+    ivf.save(args.out)
+    return 0
+
+
+def cmd_ann_report(args: argparse.Namespace) -> int:
+    """exact 검색 대비 IVF recall@N / latency 리포트"""
+    config = get_settings()
+    exact = _load_space_index(args)
+    if args.index:
+        ivf = IVFFlatIndex.load(args.index)
+    else:
+        ivf = IVFFlatIndex.build(exact, nlist=args.nlist if args.nlist is not None else config.ANN_NLIST)
+
+    nprobes = [int(v) for v in args.nprobe.split(",") if v]
+    topn = args.topn or config.CANDIDATE_TOPN
+    report = recall_report(exact, ivf, nprobes, topn=topn, n_queries=args.queries)
+
+    print(f"space={args.space} N={len(exact):,} nlist={ivf.nlist} topn={topn} queries={args.queries}")
+    print(f"{'nprobe':>8} {'recall@N':>10} {'ann_ms':>10} {'exact_ms':>10}")
+    for row in report:
+        print(f"{row['nprobe']:>8} {row['recall']:>10.4f} {row['ann_ms']:>10.3f} {row['exact_ms']:>10.3f}")
+    return 0
+
+
+def cmd_quantize(args: argparse.Namespace) -> int:
+    """float32 임베딩을 float16 / int8(행별 scale)로 변환해 저장"""
+    exact = _load_space_index(args)
+    matrix = QuantizedMatrix.quantize(exact.vectors, args.dtype)
+    save_quantized(args.out, exact.song_ids, matrix, exact.vectors if args.keep_full else None)
+    logger.info(f"float32 {exact.vectors.nbytes / 2**20:.1f}MiB -> {args.dtype} {matrix.nbytes / 2**20:.1f}MiB")
+    return 0
+
+
+def cmd_quant_report(args: argparse.Namespace) -> int:
+    """float32 exact 대비 양자화 검색 Recall@N / NDCG@N 리포트"""
+    exact = _load_space_index(args)
+    candidates = {}
+    sizes = {"float32": exact.vectors.nbytes}
+    if args.index:
+        index = load_quantized_index(args.index, rescore_full=True)
+        if index is None:
+            raise RuntimeError(f"양자화 인덱스를 로드할 수 없습니다: {args.index}")
+        index = index.restrict_to(exact.song_ids)
+        name = index.matrix.dtype_name + ("+rescore" if index.rescore_full else "")
+        candidates[name] = index
+        sizes[name] = index.matrix.nbytes
+    else:
+        for dtype in [d for d in args.dtypes.split(",") if d]:
+            matrix = QuantizedMatrix.quantize(exact.vectors, dtype)
+            candidates[dtype] = QuantizedVectorIndex(exact.song_ids, matrix)
+            candidates[f"{dtype}+rescore"] = QuantizedVectorIndex(exact.song_ids, matrix, exact.vectors)
+            sizes[dtype] = sizes[f"{dtype}+rescore"] = matrix.nbytes
+
+    report = accuracy_report(exact, candidates, topn=args.topn, n_queries=args.queries)
+
+    n = args.topn
+    print(f"space={args.space} N={len(exact):,} dim={exact.dim} queries={args.queries}")
+    print(f"{'storage':>16} {'MiB':>8} {f'recall@{n}':>10} {'Δ':>8} {f'ndcg@{n}':>10} {'Δ':>8}")
+    print(f"{'float32':>16} {sizes['float32'] / 2**20:>8.1f} {1.0:>10.4f} {0.0:>8.4f} {1.0:>10.4f} {0.0:>8.4f}")
+    for row in report:
+        print(
+            f"{row['name']:>16} {sizes[row['name']] / 2**20:>8.1f} "
+            f"{row['recall']:>10.4f} {row['recall_delta']:>8.4f} {row['ndcg']:>10.4f} {row['ndcg_delta']:>8.4f}"
+        )
+    return 0
+
+
+def cmd_build_snapshot(args: argparse.Namespace) -> int:
+    """메타 / Item2Vec / 오디오 임베딩을 단일 스냅샷 파일로 컴파일"""
+    config = get_settings()
+    start = time.perf_counter()
+
+    audio_model = args.audio_model if args.audio_model is not None else config.AUDIO_MODEL
+
+    # 지정한 값은 빈 문자열도 그대로 사용 (공유 스냅샷 발행 시 fingerprint와 내용 일치)
+    build_snapshot_from_sources(
+        args.out,
+        song_meta_path=args.song_meta if args.song_meta is not None else config.SONG_META_PATH,
+        audio_meta_path=args.audio_meta if args.audio_meta is not None else config.SONG_META_AUDIO_PATH,
+        item2vec_path=args.item2vec if args.item2vec is not None else config.ITEM2VEC_PATH,
+        audio_model=audio_model,
+        myna_path=args.myna if args.myna is not None else config.AUDIO_EMB_MYNA_PATH,
+        cnn_path=args.cnn if args.cnn is not None else config.AUDIO_EMB_CNN_PATH,
+        engine_version=args.engine_version if args.engine_version is not None else config.ENGINE_VERSION
+    )
+    logger.info(f"스냅샷 빌드 완료: {time.perf_counter() - start:.1f}s")
+
+    # 검증: 다시 열어서 헤더 / 곡 수 확인
+    snapshot = load_snapshot(args.out, audio_model)
+    meta = snapshot.meta_registry("meta") if snapshot is not None else None
+    if meta is None or len(meta.songs) == 0:
+        logger.error("스냅샷 검증 실패")
+        return 1
+    logger.info(f"스냅샷 검증 완료: {len(meta.songs):,}곡")
+    return 0
+
+
+def cmd_export_kv(args: argparse.Namespace) -> int:
+    """학습용 Word2Vec 모델 -> 서빙 전용 KeyedVectors (정수 키, L2 정규화, mmap 로드용)"""
+    config = get_settings()
+    source = args.item2vec or config.ITEM2VEC_PATH
+    model = load_item2vec_model(source)
+    if model is None:
+        raise RuntimeError(f"Item2Vec 모델을 로드할 수 없습니다: {source}")
+    count = export_item2vec_vectors(model, args.out)
+
+    # 검증: mmap으로 다시 열어서 vocab 수 확인
+    exported = load_item2vec_model(args.out)
+    if exported is None or len(exported) != count:
+        logger.error("export 검증 실패")
+        return 1
+    return 0
+
+
+def _meta_load_probe(kind: str, path: str, streaming: bool, queue) -> None:
+    """메타 로드 1회 측정 (별도 프로세스에서 실행해 peak RSS가 다른 로더와 섞이지 않게 함)"""
+    loader = load_song_meta_melon if kind == "melon" else load_audio_song_meta
+    gc.collect()
+    base = current_rss_bytes()
+    start = time.perf_counter()
+    registry = loader(path, demo_mode=False, streaming=streaming)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    queue.put({
+        "songs": len(registry.songs),
+        "seconds": seconds,
+        "base": base,
+        "peak": peak_rss_bytes(),
+        "steady": current_rss_bytes()
+    })
+
+
+def cmd_bench_meta_load(args: argparse.Namespace) -> int:
+    """json.load + SongMeta dict(이전) vs 스트리밍 + 컬럼형 메타 로더의 시간 / peak RSS / steady RSS 비교"""
+    config = get_settings()
+    path = args.song_meta or (config.SONG_META_PATH if args.kind == "melon" else config.SONG_META_AUDIO_PATH)
+    ctx = mp.get_context("spawn")
+
+    print(f"kind={args.kind} path={path} repeat={args.repeat}")
+    print(f"{'loader':>10} {'songs':>10} {'load_s':>8} {'peak_MiB':>10} {'steady_MiB':>11} {'base_MiB':>9}")
+    for name, streaming in (("json.load", False), ("streaming", True)):
+        runs = []
+        for _ in range(args.repeat):
+            queue = ctx.Queue()
+            proc = ctx.Process(target=_meta_load_probe, args=(args.kind, path, streaming, queue))
+            proc.start()
+            runs.append(queue.get())
+            proc.join()
+        # RSS는 프로세스 기준값(인터프리터 + import) 차감 후 표시
+        base = statistics.median(r["base"] for r in runs)
+        print(
+            f"{name:>10} {runs[0]['songs']:>10,} {statistics.median(r['seconds'] for r in runs):>8.2f} "
+            f"{(max(r['peak'] for r in runs) - base) / 2**20:>10.1f} "
+            f"{(statistics.median(r['steady'] for r in runs) - base) / 2**20:>11.1f} {base / 2**20:>9.1f}"
+        )
+    return 0
+
+
+def _search_queries(fields: List[tuple], count: int, seed: int) -> List[str]:
+    """검색 벤치마크 질의: 곡명 / 아티스트 타이핑 접두(1~8글자) + 텍스트 중간 부분 문자열 + 없는 문자열"""
+    rnd = random.Random(seed)
+    queries = []
+    while len(queries) < count:
+        name, artist = rnd.choice(fields)
+        text = f"{name} {artist}"
+        kind = rnd.random()
+        if kind < 0.6:
+            source = name if rnd.random() < 0.7 else artist
+            queries.extend(source[:n] for n in range(1, min(len(source), 8) + 1))
+        elif kind < 0.95 and text:
+            length = rnd.randint(2, 8)
+            start = rnd.randint(0, max(0, len(text) - length))
+            queries.append(text[start:start + length])
+        else:
+            queries.append(f"zq{rnd.randint(0, 10**6)}x")
+    return [q for q in queries[:count] if q.strip()]
+
+
+def _latency_summary(seconds: List[float]) -> str:
+    ms = sorted(s * 1000 for s in seconds)
+    pick = lambda p: ms[min(len(ms) - 1, int(p * len(ms)))]
+    return f"{statistics.mean(ms):>8.3f} {pick(0.5):>8.3f} {pick(0.95):>8.3f} {pick(0.99):>8.3f}"
+
+
+def cmd_bench_search(args: argparse.Namespace) -> int:
+    """
+    /search 벤치마크: 선형 부분 문자열 스캔(이전) vs trigram 인덱스
+    
+    카탈로그를 --sizes 크기로 맞춰(부족하면 반복) 질의별 지연 시간과 인덱스 빌드 시간 / 크기를 측정하고,
+    --verify개 질의는 전체 매칭 집합이 스캔과 같은지 확인
+    """
+    config = get_settings()
+    meta = load_song_meta_melon(args.song_meta or config.SONG_META_PATH, demo_mode=False)
+    if len(meta.song_ids) == 0:
+        logger.error("메타가 비어 있습니다")
+        return 1
+    base_fields = [(m.song_name, m.artist) for m in (meta.songs[sid] for sid in meta.song_ids)]
+    del meta
+    queries = _search_queries(base_fields, args.queries, args.seed)
+    
+    print(f"queries={len(queries)} limit={args.limit} catalog={len(base_fields):,}")
+    print(f"{'songs':>10} {'method':>6} {'mean_ms':>8} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8}  notes")
+    failed = False
+    for size in (int(x) for x in args.sizes.split(",")):
+        fields = [base_fields[i % len(base_fields)] for i in range(size)]
+        start = time.perf_counter()
+        index = SongSearchIndex.build(np.arange(size, dtype=np.int64), fields)
+        build_seconds = time.perf_counter() - start
+        # 이전 방식 기준: 메모리에 올린 정규화 텍스트 리스트 선형 스캔
+        texts = list(index.texts)
+        del fields
+        
+        timings = {"scan": [], "index": []}
+        for query in queries:
+            start = time.perf_counter()
+            scan_search(texts, query, args.limit)
+            timings["scan"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            index.search(query, args.limit)
+            timings["index"].append(time.perf_counter() - start)
+        
+        mismatches = 0
+        for query in queries[:args.verify]:
+            expected = scan_search(texts, query, size)
+            got = index.search(query, size)
+            if sorted(got) != expected:
+                mismatches += 1
+        failed = failed or mismatches > 0
+        
+        print(f"{size:>10,} {'scan':>6} {_latency_summary(timings['scan'])}  file order")
+        print(
+            f"{size:>10,} {'index':>6} {_latency_summary(timings['index'])}  "
+            f"build={build_seconds:.2f}s size={index.nbytes / 2**20:.1f}MiB "
+            f"recall_mismatch={mismatches}/{min(args.verify, len(queries))}"
+        )
+        del index, texts
+        gc.collect()
+    return 1 if failed else 0
+
+
+def cmd_build_search_prior(args: argparse.Namespace) -> int:
+    """Item2Vec vocab 빈도 -> 자동완성 인기도 prior (.npz, 스냅샷 / 양자화 서빙에서 SEARCH_PRIOR_PATH로 사용)"""
+    config = get_settings()
+    source = args.item2vec or config.ITEM2VEC_PATH
+    model = load_item2vec_model(source)
+    if model is None:
+        raise RuntimeError(f"Item2Vec 모델을 로드할 수 없습니다: {source}")
+    counts = keyed_vector_counts(model)
+    if counts is None:
+        logger.error(f"vocab 빈도가 없는 모델입니다 (학습용 Word2Vec 모델 또는 빈도를 유지한 export 필요): {source}")
+        return 1
+    save_search_prior(args.out, *counts)
+    return 0
+
+
+def _autocomplete_queries(fields: List[tuple], count: int, seed: int) -> List[str]:
+    """자동완성 벤치마크 질의: 곡명 / 아티스트 입력 중간 상태(두벌식) + 초성 접두"""
+    rnd = random.Random(seed)
+    queries = []
+    while len(queries) < count:
+        name, artist = rnd.choice(fields)
+        source = (name if rnd.random() < 0.7 else artist) or ""
+        if rnd.random() < 0.75:
+            queries.extend(list(keystroke_prefixes(source[:6])))
+        else:
+            initials = choseong_key(source)[:5]
+            queries.extend(initials[:n] for n in range(1, len(initials) + 1))
+    return [q for q in queries[:count] if q.strip()]
+
+
+def _autocomplete_expected(keys: List[tuple], ranks: np.ndarray, query: str, limit: int) -> List[int]:
+    """전체 스캔 자동완성 (검증 기준, 결과 행 번호)"""
+    choseong = is_choseong_query(query)
+    prefix = choseong_key(query) if choseong else jamo_key(query)
+    rows = [
+        row for row, (name_jamo, artist_jamo, name_initials, artist_initials) in enumerate(keys)
+        if (name_initials if choseong else name_jamo).startswith(prefix)
+        or (artist_initials if choseong else artist_jamo).startswith(prefix)
+    ]
+    return sorted(rows, key=lambda row: ranks[row])[:limit]
+
+
+def cmd_bench_autocomplete(args: argparse.Namespace) -> int:
+    """
+    자동완성 벤치마크: 키 입력마다의 지연 시간 (최악값 포함) + 전체 스캔 대비 결과 검증
+    
+    카탈로그를 --sizes 크기로 맞추고(부족하면 반복) Item2Vec vocab 빈도가 있으면 prior로 사용
+    """
+    config = get_settings()
+    meta = load_song_meta_melon(args.song_meta or config.SONG_META_PATH, demo_mode=False)
+    if len(meta.song_ids) == 0:
+        logger.error("메타가 비어 있습니다")
+        return 1
+    base_ids = np.asarray(meta.song_ids, dtype=np.int64)
+    base_fields = [(m.song_name, m.artist) for m in (meta.songs[sid] for sid in meta.song_ids)]
+    del meta
+    model = load_item2vec_model(args.item2vec or config.ITEM2VEC_PATH)
+    counts = keyed_vector_counts(model) if model is not None else None
+    base_prior = align_prior(base_ids, *counts) if counts is not None else None
+    del model
+    queries = _autocomplete_queries(base_fields, args.queries, args.seed)
+    
+    print(f"queries={len(queries)} limit={args.limit} catalog={len(base_fields):,} prior={'yes' if counts is not None else 'no'}")
+    print(f"{'songs':>10} {'mean_ms':>8} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8} {'max_ms':>8}  notes")
+    failed = False
+    for size in (int(x) for x in args.sizes.split(",")):
+        fields = [base_fields[i % len(base_fields)] for i in range(size)]
+        prior = base_prior[np.arange(size) % len(base_fields)] if base_prior is not None else None
+        start = time.perf_counter()
+        index = AutocompleteIndex.build(np.arange(size, dtype=np.int64), fields, prior)
+        build_seconds = time.perf_counter() - start
+        
+        timings = []
+        for query in queries:
+            start = time.perf_counter()
+            index.complete(query, args.limit)
+            timings.append(time.perf_counter() - start)
+        
+        mismatches = 0
+        if args.verify:
+            keys = [
+                (jamo_key(name or ""), jamo_key(artist or ""), choseong_key(name or ""), choseong_key(artist or ""))
+                for name, artist in fields
+            ]
+            ranks = np.empty(size, dtype=np.int64)
+            ranks[index.rows_by_rank] = np.arange(size)
+            for query in queries[:args.verify]:
+                expected = _autocomplete_expected(keys, ranks, query, args.limit)
+                if index.complete_rows(query, args.limit).tolist() != expected:
+                    mismatches += 1
+            del keys
+        failed = failed or mismatches > 0
+        
+        print(
+            f"{size:>10,} {_latency_summary(timings)} {max(timings) * 1000:>8.3f}  "
+            f"build={build_seconds:.2f}s size={index.nbytes / 2**20:.1f}MiB "
+            f"mismatch={mismatches}/{min(args.verify, len(queries))}"
+        )
+        del index, fields
+        gc.collect()
+    return 1 if failed else 0
+
+
+def _synthetic_traffic(count: int, catalog: int, zipf_a: float, k_mix: str, seed: int) -> List[Tuple[int, int]]:
+    """Zipf 인기도 시드 + k 혼합 (예: "10:0.3,20:0.5,50:0.2") 합성 트래픽"""
+    rng = np.random.default_rng(seed)
+    ks, weights = zip(*((int(k), float(w)) for k, w in (part.split(":") for part in k_mix.split(","))))
+    popularity = rng.permutation(catalog)
+    ranks = np.minimum(rng.zipf(zipf_a, size=count), catalog) - 1
+    seeds = popularity[ranks] + 1
+    chosen = rng.choice(ks, size=count, p=np.asarray(weights) / sum(weights))
+    return list(zip(seeds.tolist(), chosen.tolist()))
+
+
+def cmd_replay_cache(args: argparse.Namespace) -> int:
+    """
+    추천 캐시 적중률 리플레이: k별 캐시 키 vs k 무관 캐시(CACHE_MAX_K까지 한 번 계산 후 잘라서 응답)
+    
+    실제 캐시 키 함수와 LRU(LocalCache, --capacity 항목)를 그대로 사용, TTL 만료는 무시
+    엔진 실행 수 = 미스 수, built_items = 미스마다 만든 응답 항목 수 합 (캐시 깊이), items = 캐시에 남은 항목 수 합
+    """
+    config = get_settings()
+    if args.log:
+        traffic = list(recommend_traffic(args.log))
+    else:
+        traffic = _synthetic_traffic(args.synthetic, args.catalog, args.zipf_a, args.k_mix, args.seed)
+    if not traffic:
+        logger.error("리플레이할 /recommend 요청이 없습니다")
+        return 1
+    
+    max_k = args.max_k if args.max_k is not None else config.CACHE_MAX_K
+    capacity = args.capacity or len(traffic)
+    print(
+        f"requests={len(traffic):,} seeds={len({seed_id for seed_id, _ in traffic}):,} "
+        f"(seed, k)={len(set(traffic)):,} capacity={capacity:,} source={args.log or 'synthetic'}"
+    )
+    print(f"{'policy':>14} {'hit_rate':>9} {'misses':>9} {'built_items':>11} {'entries':>9} {'items':>11}")
+    for label, policy_k in (("per-k", 0), (f"max_k={max_k}", max_k)):
+        cache = LocalCache(max_entries=capacity, max_bytes=0, ttl_sec=float("inf"))
+        computed = 0
+        for seed_id, k in traffic:
+            depth = recommend_cache_depth(k, policy_k)
+            key = make_recommend_cache_key(config.ENGINE_VERSION, config.AUDIO_MODEL, seed_id, depth)
+            if cache.get(key) is None:
+                cache.set(key, True, depth)
+                computed += depth
+        stats = cache.stats()
+        print(
+            f"{label:>14} {stats['hit_rate']:>9.2%} {stats['misses']:>9,} {computed:>11,} "
+            f"{stats['entries']:>9,} {stats['bytes']:>11,}"
+        )
+    return 0
+
+
+async def _redis_load(fetch, requests: int, concurrency: int, tick_sec: float) -> Tuple[float, List[float]]:
+    """
+    동시 요청 부하 + 이벤트 루프 지연 측정
+    
+    틱 코루틴이 tick_sec마다 깨어나며 예정보다 늦은 시간(루프가 막혀 있던 시간)을 기록
+    
+    Returns:
+        (부하 경과 시간, 틱별 지연 목록)
+    """
+    lags: List[float] = []
+    done = asyncio.Event()
+    
+    async def ticker() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(tick_sec)
+            lags.append(max(0.0, time.perf_counter() - start - tick_sec))
+    
+    remaining = iter(range(requests))
+    
+    async def worker() -> None:
+        for _ in remaining:
+            await fetch()
+    
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick_task
+    return elapsed, lags
+
+
+def cmd_bench_redis(args: argparse.Namespace) -> int:
+    """
+    Redis 캐시 조회 부하 테스트: 이전 동기 클라이언트(PING + GET) vs redis.asyncio 풀 (PING 없음)
+    
+    이벤트 루프에서 --concurrency개 코루틴이 같은 키를 조회하는 동안의 처리량과 루프 지연(stall) 비교
+    """
+    import redis
+    
+    config = get_settings()
+    url = args.url or config.REDIS_URL
+    key = "bench:redis:payload"
+    payload = json.dumps({"items": ["x" * 100] * max(1, args.payload_kb * 10)})
+    sync_client = redis.from_url(url, decode_responses=True, socket_connect_timeout=2, socket_timeout=2)
+    try:
+        sync_client.set(key, payload, ex=600)
+    except Exception as e:
+        logger.error(f"Redis에 연결할 수 없습니다: {url} ({e})")
+        return 1
+    
+    async def sync_fetch() -> None:
+        # 이전 get_json: is_connected의 PING + GET을 이벤트 루프에서 블로킹 호출
+        sync_client.ping()
+        json.loads(sync_client.get(key))
+    
+    async def run_async() -> Tuple[float, List[float]]:
+        cache = RedisCache(url, max_connections=args.pool, timeout_sec=config.REDIS_TIMEOUT_SEC)
+        
+        async def fetch() -> None:
+            json.loads(await cache.get(key))
+        
+        try:
+            return await _redis_load(fetch, args.requests, args.concurrency, args.tick_ms / 1000)
+        finally:
+            await cache.close()
+    
+    print(f"url={url} requests={args.requests:,} concurrency={args.concurrency} pool={args.pool} payload={len(payload) / 1024:.1f}KiB")
+    print(f"{'client':>8} {'req/s':>9} {'stall_ms':>9} {'stall_%':>8} {'lag_p50':>8} {'lag_p99':>8} {'lag_max':>8}")
+    runs = (
+        ("sync", lambda: _redis_load(sync_fetch, args.requests, args.concurrency, args.tick_ms / 1000)),
+        ("async", run_async),
+    )
+    for label, run in runs:
+        elapsed, lags = asyncio.run(run())
+        ms = sorted(lag * 1000 for lag in lags) or [0.0]
+        pick = lambda p: ms[min(len(ms) - 1, int(p * len(ms)))]
+        stall = sum(ms)
+        print(
+            f"{label:>8} {args.requests / elapsed:>9,.0f} {stall:>9.1f} {stall / (elapsed * 1000):>8.1%} "
+            f"{pick(0.5):>8.3f} {pick(0.99):>8.3f} {ms[-1]:>8.3f}"
+        )
+    sync_client.delete(key)
+    return 0
+
+
+def _serving_requests(fields: List[tuple], song_ids: List[int], args: argparse.Namespace) -> List[Tuple[str, str]]:
+    """
+    혼합 트래픽 (종류, 경로)
+    
+    - miss: 카탈로그 전체에서 고른 시드 추천 (대부분 캐시 미스 -> 엔진 계산)
+    - hit: 인기 시드 --hot개 추천 (첫 요청 후 캐시 적중)
+    - search: 곡명 앞 1~3글자 검색
+    - health: /health
+    """
+    rnd = random.Random(args.seed)
+    kinds, weights = zip(*((kind, float(w)) for kind, w in (part.split(":") for part in args.mix.split(","))))
+    hot = rnd.sample(song_ids, min(args.hot, len(song_ids)))
+    requests = []
+    for kind in rnd.choices(kinds, weights=weights, k=args.requests):
+        if kind == "miss":
+            path = f"/recommend?seed_id={rnd.choice(song_ids)}&k={rnd.choice((10, 20, 50))}"
+        elif kind == "hit":
+            path = f"/recommend?seed_id={rnd.choice(hot)}&k=20"
+        elif kind == "search":
+            name = rnd.choice(fields)[0] or "a"
+            path = f"/search?q={name[:rnd.randint(1, 3)]}&limit=20"
+        elif kind == "health":
+            path = "/health"
+        else:
+            raise ValueError(f"Unknown traffic kind: {kind}")
+        requests.append((kind, path))
+    return requests
+
+
+def cmd_bench_serving(args: argparse.Namespace) -> int:
+    """
+    실행 중인 서버에 혼합 트래픽 부하 (동시 --concurrency개): 처리량 + 종류별 p50 / p99 / 상태 코드
+    
+    ENGINE_BACKEND(inline / thread / process)를 바꿔 띄운 서버끼리 비교 (엔진 계산 중 /health / 검색 / 캐시 적중 지연)
+    """
+    import httpx
+    
+    config = get_settings()
+    meta = load_song_meta_melon(args.song_meta or config.SONG_META_PATH, demo_mode=False)
+    if len(meta.song_ids) == 0:
+        logger.error("메타가 비어 있습니다")
+        return 1
+    song_ids = [int(sid) for sid in meta.song_ids]
+    fields = [(meta.songs[sid].song_name, meta.songs[sid].artist) for sid in song_ids[:10000]]
+    del meta
+    requests = _serving_requests(fields, song_ids, args)
+    
+    async def run() -> Tuple[float, List[Tuple[str, int, float]]]:
+        results: List[Tuple[str, int, float]] = []
+        pending = iter(requests)
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limits) as client:
+            async def worker() -> None:
+                for kind, path in pending:
+                    start = time.perf_counter()
+                    try:
+                        status = (await client.get(path)).status_code
+                    except httpx.HTTPError:
+                        status = 0
+                    results.append((kind, status, time.perf_counter() - start))
+            
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+            return time.perf_counter() - start, results
+    
+    elapsed, results = asyncio.run(run())
+    print(f"url={args.url} requests={len(results):,} concurrency={args.concurrency} mix={args.mix}")
+    print(f"throughput={len(results) / elapsed:,.1f} req/s elapsed={elapsed:.1f}s")
+    print(f"{'kind':>8} {'count':>7} {'mean_ms':>8} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8}  status")
+    for kind in dict.fromkeys(kind for kind, _ in requests):
+        rows = [(status, seconds) for k, status, seconds in results if k == kind]
+        statuses = {}
+        for status, _ in rows:
+            statuses[status] = statuses.get(status, 0) + 1
+        status_text = " ".join(f"{code}={count}" for code, count in sorted(statuses.items()))
+        print(f"{kind:>8} {len(rows):>7,} {_latency_summary([seconds for _, seconds in rows])}  {status_text}")
+    return 0
+
+
+def cmd_warm_cache(args: argparse.Namespace) -> int:
+    """
+    추천 캐시 워밍업: 인기 시드 추천을 미리 계산해 Redis에 저장 (배포 / ENGINE_VERSION 변경 직후)
+    
+    서버와 같은 로더 / 엔진 / 캐시 키 / 저장 형식을 사용하고, 배치를 엔진 실행기 워커(기본 CPU 수)마다 1개씩 동시에 실행
+    process 백엔드는 스냅샷(SNAPSHOT_PATH / SHARED_SNAPSHOT_DIR)이 필요하며 없으면 thread로 실행
+    """
+    workers = args.workers or os.cpu_count() or 1
+    overrides = dict(
+        ENGINE_BACKEND=args.backend,
+        ENGINE_WORKERS=workers,
+        ENGINE_MAX_QUEUE=workers,
+        ENGINE_TIMEOUT_SEC=0,
+        CACHE_WARMUP_SEEDS=0
+    )
+    if args.redis_url:
+        overrides["REDIS_URL"] = args.redis_url
+    config = get_settings(**overrides)
+    
+    async def run() -> int:
+        state = SimpleNamespace(config=config)
+        init_resource_state(state)
+        await load_resources(state, config)
+        try:
+            if not state.loading.ready:
+                logger.error("추천 엔진을 만들 수 없습니다 (SONG_META_PATH / ITEM2VEC_PATH / SNAPSHOT_PATH 확인)")
+                return 1
+            if not await state.redis_cache.ping():
+                logger.error(f"Redis에 연결할 수 없습니다: {config.REDIS_URL}")
+                return 1
+            try:
+                seeds = warmup_seeds(state, args.source, args.limit, args.log)
+            except ValueError as e:
+                logger.error(str(e))
+                return 1
+            
+            engine_executor = state.engine_executor
+            concurrency = engine_executor.workers if engine_executor.backend != "inline" else 1
+            print(
+                f"source={args.source} seeds={len(seeds):,} backend={engine_executor.backend} workers={concurrency} "
+                f"batch={args.batch} namespace=rec:{config.ENGINE_VERSION}:{config.AUDIO_MODEL} url={config.REDIS_URL}"
+            )
+            stats = await warm_cache(
+                state,
+                seeds,
+                k=args.k,
+                batch_size=args.batch,
+                concurrency=concurrency,
+                skip_existing=not args.force,
+                progress=lambda progress: print(format_progress(progress), flush=True),
+                progress_sec=args.progress_sec
+            )
+            print(
+                f"done: computed={stats['computed']:,} skipped={stats['skipped']:,} errors={stats['errors']:,} "
+                f"batches={stats['batches']:,} elapsed={stats['elapsed_sec']:.1f}s ({stats['seeds_per_sec']:,.0f} seeds/s)"
+            )
+            return 1 if stats["errors"] and not stats["computed"] else 0
+        finally:
+            if state.engine_executor is not None:
+                state.engine_executor.shutdown()
+            if state.redis_cache is not None:
+                await state.redis_cache.close()
+    
+    return asyncio.run(run())
+
+
+def _add_space_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--space", choices=["cf", "audio"], default="cf", help="임베딩 공간")
+    p.add_argument("--song-meta", default="", help="song_meta.json 경로 (기본: SONG_META_PATH)")
+    p.add_argument("--item2vec", default="", help="Item2Vec 모델 경로 (기본: ITEM2VEC_PATH)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="VibeCurator 백엔드 CLI")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("build-neighbors", help="CF top-N 이웃 테이블 (.npy 쌍) 빌드")
+    p.add_argument("--out", required=True, help="출력 prefix ({out}.ids.npy / {out}.scores.npy)")
+    p.add_argument("--topn", type=int, default=None, help="시드당 이웃 수 (기본: CANDIDATE_TOPN)")
+    p.add_argument("--song-meta", default="", help="song_meta.json 경로 (기본: SONG_META_PATH)")
+    p.add_argument("--item2vec", default="", help="Item2Vec 모델 경로 (기본: ITEM2VEC_PATH)")
+    p.add_argument("--block-size", type=int, default=128, help="블록당 시드 행 수")
+    p.add_argument("--workers", type=int, default=None, help="스레드 수 (기본: CPU 코어 수)")
+    p.set_defaults(func=cmd_build_neighbors)
+
+    p = sub.add_parser("build-ann", help="IVF-Flat ANN 인덱스 빌드 (.npz)")
+    _add_space_args(p)
+    p.add_argument("--nlist", type=int, default=None, help="IVF 리스트 수 (기본: ANN_NLIST)")
+    p.add_argument("--out", required=True, help="출력 경로 (.npz)")
+    p.add_argument("--nprobe", type=int, default=None, help="저장할 기본 nprobe (기본: ANN_NPROBE)")
+    p.set_defaults(func=cmd_build_ann)
+
+    p = sub.add_parser("ann-report", help="exact 대비 ANN recall@N / latency 리포트")
+    _add_space_args(p)
+    p.add_argument("--nlist", type=int, default=None, help="IVF 리스트 수 (기본: ANN_NLIST)")
+    p.add_argument("--index", default="", help="저장된 IVF 인덱스 (없으면 즉석 빌드)")
+    p.add_argument("--nprobe", default="1,2,4,8,16,32,64", help="측정할 nprobe 목록 (쉼표 구분)")
+    p.add_argument("--topn", type=int, default=None, help="recall@N의 N (기본: CANDIDATE_TOPN)")
+    p.add_argument("--queries", type=int, default=1000, help="쿼리 수")
+    p.set_defaults(func=cmd_ann_report)
+
+    p = sub.add_parser("quantize", help="임베딩 양자화 변환 (float16 / int8 + 행별 scale)")
+    _add_space_args(p)
+    p.add_argument("--dtype", choices=QUANT_DTYPES, default="int8", help="저장 형식")
+    p.add_argument("--out", required=True, help="출력 prefix ({out}.ids.npy / .codes.npy / .scales.npy / .full.npy)")
+    p.add_argument("--keep-full", action="store_true", help="재채점용 float32 원본({out}.full.npy)도 저장")
+    p.set_defaults(func=cmd_quantize)
+
+    p = sub.add_parser("quant-report", help="float32 대비 양자화 Recall@N / NDCG@N 리포트")
+    _add_space_args(p)
+    p.add_argument("--dtypes", default="float16,int8", help="즉석 변환해 비교할 형식 목록 (쉼표 구분)")
+    p.add_argument("--index", default="", help="저장된 양자화 prefix (지정 시 --dtypes 대신 사용)")
+    p.add_argument("--topn", type=int, default=20, help="Recall@N / NDCG@N의 N")
+    p.add_argument("--queries", type=int, default=1000, help="쿼리 수")
+    p.set_defaults(func=cmd_quant_report)
+
+    p = sub.add_parser("build-snapshot", help="메타/Item2Vec/오디오 임베딩 단일 memmap 스냅샷 빌드")
+    p.add_argument("--out", required=True, help="출력 경로 (SNAPSHOT_PATH로 서빙)")
+    p.add_argument("--song-meta", default=None, help="song_meta.json 경로 (기본: SONG_META_PATH)")
+    p.add_argument("--audio-meta", default=None, help="오디오 메타 JSON 경로 (기본: SONG_META_AUDIO_PATH, 빈 문자열이면 생략)")
+    p.add_argument("--item2vec", default=None, help="Item2Vec 모델 경로 (기본: ITEM2VEC_PATH)")
+    p.add_argument("--audio-model", choices=["myna", "cnn"], default=None, help="오디오 모델 (기본: AUDIO_MODEL)")
+    p.add_argument("--myna", default=None, help="MyNA 임베딩 경로 (기본: AUDIO_EMB_MYNA_PATH)")
+    p.add_argument("--cnn", default=None, help="CNN 임베딩 경로 (기본: AUDIO_EMB_CNN_PATH)")
+    p.add_argument("--engine-version", default=None, help="헤더에 기록할 엔진 버전 (기본: ENGINE_VERSION)")
+    p.set_defaults(func=cmd_build_snapshot)
+
+    p = sub.add_parser("export-kv", help="서빙 전용 Item2Vec KeyedVectors export (학습 상태 제외, mmap 로드)")
+    p.add_argument("--out", required=True, help="출력 경로 (예: data/item2vec.kv, ITEM2VEC_PATH로 서빙)")
+    p.add_argument("--item2vec", default="", help="원본 Word2Vec 모델 경로 (기본: ITEM2VEC_PATH)")
+    p.set_defaults(func=cmd_export_kv)
+
+    p = sub.add_parser("bench-meta-load", help="메타 JSON 로더 벤치마크 (이전 json.load vs 스트리밍, 시간 / peak / steady RSS)")
+    p.add_argument("--kind", choices=["melon", "audio"], default="melon", help="로더 종류 (melon: song_meta.json, audio: 오디오 메타)")
+    p.add_argument("--song-meta", default="", help="메타 JSON 경로 (기본: SONG_META_PATH / SONG_META_AUDIO_PATH)")
+    p.add_argument("--repeat", type=int, default=3, help="로더별 반복 횟수 (매회 새 프로세스)")
+    p.set_defaults(func=cmd_bench_meta_load)
+
+    p = sub.add_parser("bench-search", help="/search 벤치마크 (선형 스캔 vs trigram 인덱스, 지연 시간 / 결과 집합 검증)")
+    p.add_argument("--song-meta", default="", help="song_meta.json 경로 (기본: SONG_META_PATH)")
+    p.add_argument("--sizes", default="100000,1000000", help="카탈로그 크기 목록 (쉼표 구분, 메타보다 크면 곡을 반복)")
+    p.add_argument("--queries", type=int, default=2000, help="질의 수")
+    p.add_argument("--limit", type=int, default=20, help="결과 개수")
+    p.add_argument("--verify", type=int, default=200, help="전체 매칭 집합을 스캔과 비교할 질의 수")
+    p.add_argument("--seed", type=int, default=0, help="질의 샘플링 시드")
+    p.set_defaults(func=cmd_bench_search)
+
+    p = sub.add_parser("build-search-prior", help="Item2Vec vocab 빈도 -> 자동완성 인기도 prior (.npz)")
+    p.add_argument("--item2vec", default="", help="Item2Vec 모델 경로 (기본: ITEM2VEC_PATH)")
+    p.add_argument("--out", required=True, help="출력 경로 (예: data/search_prior.npz)")
+    p.set_defaults(func=cmd_build_search_prior)
+
+    p = sub.add_parser("bench-autocomplete", help="자동완성 키 입력별 지연 시간 / 전체 스캔 대비 검증")
+    p.add_argument("--song-meta", default="", help="song_meta.json 경로 (기본: SONG_META_PATH)")
+    p.add_argument("--item2vec", default="", help="vocab 빈도 prior용 Item2Vec 모델 경로 (기본: ITEM2VEC_PATH)")
+    p.add_argument("--sizes", default="100000,1000000", help="카탈로그 크기 목록 (쉼표 구분, 메타보다 크면 곡을 반복)")
+    p.add_argument("--queries", type=int, default=5000, help="질의(키 입력) 수")
+    p.add_argument("--limit", type=int, default=10, help="결과 개수")
+    p.add_argument("--verify", type=int, default=100, help="전체 스캔 결과와 비교할 질의 수")
+    p.add_argument("--seed", type=int, default=0, help="질의 샘플링 시드")
+    p.set_defaults(func=cmd_bench_autocomplete)
+
+    p = sub.add_parser("replay-cache", help="트래픽 리플레이로 k별 vs k 무관 추천 캐시 적중률 비교")
+    p.add_argument("--log", default="", help="액세스 로그 / JSON Lines 경로 (없으면 합성 트래픽)")
+    p.add_argument("--max-k", type=int, default=None, help="k 무관 캐시 깊이 (기본: CACHE_MAX_K)")
+    p.add_argument("--capacity", type=int, default=0, help="LRU 항목 수 (0이면 무제한)")
+    p.add_argument("--synthetic", type=int, default=200000, help="합성 트래픽 요청 수")
+    p.add_argument("--catalog", type=int, default=700000, help="합성 트래픽 시드 후보 수")
+    p.add_argument("--zipf-a", type=float, default=1.1, help="합성 트래픽 시드 인기도 Zipf 지수")
+    p.add_argument("--k-mix", default="10:0.3,20:0.5,50:0.2", help="합성 트래픽 k 분포 (k:가중치, 쉼표 구분)")
+    p.add_argument("--seed", type=int, default=0, help="합성 트래픽 시드")
+    p.set_defaults(func=cmd_replay_cache)
+
+    p = sub.add_parser("bench-redis", help="Redis 캐시 조회 부하 테스트 (이전 동기 클라이언트 vs asyncio 풀, 이벤트 루프 지연)")
+    p.add_argument("--url", default="", help="Redis URL (기본: REDIS_URL)")
+    p.add_argument("--requests", type=int, default=5000, help="조회 요청 수")
+    p.add_argument("--concurrency", type=int, default=64, help="동시 코루틴 수")
+    p.add_argument("--pool", type=int, default=32, help="asyncio 연결 풀 크기")
+    p.add_argument("--payload-kb", type=int, default=12, help="캐시 값 크기 (KiB, 추천 100개 응답 정도)")
+    p.add_argument("--tick-ms", type=float, default=1.0, help="이벤트 루프 지연 측정 간격 (ms)")
+    p.set_defaults(func=cmd_bench_redis)
+
+    p = sub.add_parser("bench-serving", help="실행 중인 서버 혼합 트래픽 부하 (추천 미스 / 적중 / 검색 / health, 처리량 / p99)")
+    p.add_argument("--url", default="http://localhost:8000", help="서버 URL")
+    p.add_argument("--song-meta", default="", help="시드 / 검색어를 고를 song_meta.json 경로 (기본: SONG_META_PATH)")
+    p.add_argument("--requests", type=int, default=3000, help="요청 수")
+    p.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    p.add_argument("--mix", default="miss:0.4,hit:0.3,search:0.2,health:0.1", help="트래픽 비율 (종류:가중치, 쉼표 구분)")
+    p.add_argument("--hot", type=int, default=20, help="캐시 적중용 인기 시드 수")
+    p.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃 (초)")
+    p.add_argument("--seed", type=int, default=0, help="트래픽 샘플링 시드")
+    p.set_defaults(func=cmd_bench_serving)
+
+    p = sub.add_parser("warm-cache", help="인기 시드 추천을 일괄 계산해 Redis 캐시에 미리 저장 (진행 상황 / 처리량 출력)")
+    p.add_argument("--source", choices=WARMUP_SOURCES, default="vocab", help="시드 목록 (vocab 빈도 / 트래픽 로그 / 카탈로그 전체)")
+    p.add_argument("--log", default="", help="--source log의 액세스 로그 / JSON Lines 경로")
+    p.add_argument("--limit", type=int, default=0, help="최대 시드 수 (0이면 전부)")
+    p.add_argument("--k", type=int, default=20, help="추천 개수 (CACHE_MAX_K가 있으면 그 깊이로 저장)")
+    p.add_argument("--batch", type=int, default=256, help="엔진 일괄 추천 1회당 시드 수")
+    p.add_argument("--backend", choices=("inline", "thread", "process"), default="process", help="엔진 실행 방식 (process는 스냅샷 필요, 없으면 thread)")
+    p.add_argument("--workers", type=int, default=0, help="엔진 워커 수 = 동시 배치 수 (0이면 CPU 수)")
+    p.add_argument("--redis-url", default="", help="Redis URL (기본: REDIS_URL)")
+    p.add_argument("--force", action="store_true", help="이미 캐시에 있는 키도 다시 계산")
+    p.add_argument("--progress-sec", type=float, default=2.0, help="진행 상황 출력 간격 (초)")
+    p.set_defaults(func=cmd_warm_cache)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    setup_logging()
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
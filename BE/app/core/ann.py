@@ -0,0 +1,342 @@
+"""
+VibeCurator ANN Index
+IVF-Flat 근사 최근접 이웃 인덱스 (순수 NumPy)
+
+- 빌드: 구면 k-means로 nlist개 코어스 센트로이드 학습 -> 각 벡터를 가장 가까운 리스트에 배정
+- 검색: 쿼리와 가까운 nprobe개 리스트만 스캔 (nprobe가 클수록 recall↑ latency↑)
+- 벡터는 리스트 순서로 재배열해 저장하므로 리스트 스캔은 연속 메모리 슬라이스
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .retrieval import FUSION_MODES, ItemVectorIndex, fuse_ranked_lists, top_n_indices
+
+logger = logging.getLogger(__name__)
+
+
+def default_nlist(n: int) -> int:
+    """벡터 수에 맞춘 기본 리스트 수 (~4 * sqrt(N))"""
+    return max(1, min(n, int(4 * np.sqrt(max(n, 1)))))
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, block_size: int = 8192) -> np.ndarray:
+    """각 벡터를 내적이 가장 큰 센트로이드에 배정 (블록 단위로 메모리 제한)"""
+    assign = np.empty(vectors.shape[0], dtype=np.int64)
+    for start in range(0, vectors.shape[0], block_size):
+        block = vectors[start:start + block_size]
+        assign[start:start + block_size] = np.argmax(block @ centroids.T, axis=1)
+    return assign
+
+
+def spherical_kmeans(
+    vectors: np.ndarray,
+    nlist: int,
+    n_iter: int = 20,
+    seed: int = 42
+) -> np.ndarray:
+    """
+    구면 k-means (코사인 거리, 센트로이드는 L2 정규화)
+
+    Args:
+        vectors: (N, D) L2 정규화된 학습 벡터
+        nlist: 센트로이드 수
+        n_iter: 반복 횟수
+        seed: 난수 시드
+
+    Returns:
+        (nlist, D) float32 센트로이드
+    """
+    rng = np.random.default_rng(seed)
+    n = vectors.shape[0]
+    centroids = vectors[rng.choice(n, size=nlist, replace=False)].copy()
+
+    for _ in range(n_iter):
+        assign = _assign(vectors, centroids)
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=nlist)
+
+        nonempty = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[nonempty]
+        sums = np.add.reduceat(vectors[order], starts, axis=0)
+        centroids[nonempty] = sums
+
+        # 빈 리스트는 임의 벡터로 재시드
+        empty = np.flatnonzero(counts == 0)
+        if len(empty):
+            centroids[empty] = vectors[rng.choice(n, size=len(empty), replace=False)]
+
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        centroids = (centroids / norms).astype(np.float32)
+
+    return centroids
+
+
+class IVFFlatIndex(ItemVectorIndex):
+    """
+    IVF-Flat 인덱스
+
+    ItemVectorIndex와 같은 인터페이스(song_ids, row_of, search, search_by_id)를 제공하므로
+    엔진에서 exact 인덱스 대신 그대로 사용 가능
+    rows/song_ids/vectors는 리스트 순서로 재배열된 행 기준
+    """
+
+    def __init__(
+        self,
+        song_ids: np.ndarray,
+        vectors: np.ndarray,
+        centroids: np.ndarray,
+        list_offsets: np.ndarray,
+        nprobe: int = 16
+    ):
+        """
+        Args:
+            song_ids: (N,) 리스트 순서로 정렬된 song_id
+            vectors: (N, D) 리스트 순서로 정렬된 L2 정규화 벡터
+            centroids: (nlist, D) 센트로이드
+            list_offsets: (nlist + 1,) 리스트 i의 행 범위 = [offsets[i], offsets[i+1])
+            nprobe: 기본 탐색 리스트 수
+        """
+        super().__init__(song_ids, vectors, normalized=True)
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        self.list_offsets = np.asarray(list_offsets, dtype=np.int64)
+        self.nprobe = nprobe
+
+    @property
+    def nlist(self) -> int:
+        return int(self.centroids.shape[0])
+
+    @classmethod
+    def build(
+        cls,
+        base: ItemVectorIndex,
+        nlist: int = 0,
+        nprobe: int = 16,
+        n_iter: int = 20,
+        train_size: int = 100_000,
+        seed: int = 42
+    ) -> "IVFFlatIndex":
+        """
+        exact 인덱스로부터 IVF 인덱스 빌드
+
+        Args:
+            base: 정규화된 벡터를 가진 exact 인덱스
+            nlist: 리스트 수 (0이면 ~4*sqrt(N))
+            nprobe: 기본 탐색 리스트 수
+            n_iter: k-means 반복 횟수
+            train_size: k-means 학습 샘플 수
+            seed: 난수 시드
+        """
+        n = len(base)
+        nlist = min(nlist or default_nlist(n), n)
+        start = time.perf_counter()
+
+        rng = np.random.default_rng(seed)
+        if n > train_size:
+            train = base.vectors[rng.choice(n, size=train_size, replace=False)]
+        else:
+            train = base.vectors
+        centroids = spherical_kmeans(train, nlist, n_iter=n_iter, seed=seed)
+
+        assign = _assign(base.vectors, centroids)
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=nlist)
+        list_offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+        logger.info(
+            f"IVF 인덱스 빌드 완료: N={n:,}, nlist={nlist}, "
+            f"리스트 크기 max={counts.max() if n else 0:,}, {time.perf_counter() - start:.1f}s"
+        )
+        return cls(
+            base.song_ids[order],
+            np.ascontiguousarray(base.vectors[order]),
+            centroids,
+            list_offsets,
+            nprobe=nprobe
+        )
+
+    def restrict_to(self, song_ids: np.ndarray) -> "IVFFlatIndex":
+        """리스트 구조를 유지한 채 주어진 song_id 행만 남김"""
+        mask = np.isin(self.song_ids, np.asarray(song_ids, dtype=np.int64))
+        list_of_row = np.repeat(np.arange(self.nlist), np.diff(self.list_offsets))
+        counts = np.bincount(list_of_row[mask], minlength=self.nlist)
+        list_offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return IVFFlatIndex(
+            self.song_ids[mask], self.vectors[mask], self.centroids, list_offsets, nprobe=self.nprobe
+        )
+
+    def search(
+        self,
+        query: np.ndarray,
+        topn: int,
+        exclude_row: Optional[int] = None,
+        nprobe: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        nprobe개 리스트만 스캔하는 근사 검색
+
+        Returns:
+            (rows, scores): 점수 내림차순 배열 쌍 (후보가 부족하면 topn보다 적을 수 있음)
+        """
+        query = np.asarray(query, dtype=np.float32)
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+        probe = top_n_indices(self.centroids @ query, nprobe)
+
+        starts = self.list_offsets[probe]
+        ends = self.list_offsets[probe + 1]
+        rows = np.concatenate([np.arange(s, e) for s, e in zip(starts.tolist(), ends.tolist())])
+        if exclude_row is not None and exclude_row >= 0:
+            rows = rows[rows != exclude_row]
+
+        scores = self.vectors[rows] @ query
+        top = top_n_indices(scores, topn)
+        return rows[top], scores[top]
+
+    def search_multi(
+        self,
+        rows: Sequence[int],
+        topn: int,
+        fusion: str = "mean"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        다중 시드 근사 검색 (시드 자신들 제외)
+
+        mean은 평균 쿼리로 1회 검색, max/sum은 시드별 검색 결과를 결합
+        """
+        if fusion not in FUSION_MODES:
+            raise ValueError(f"Unknown fusion mode: {fusion}")
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        if len(rows) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        if fusion == "mean":
+            query = self.vectors[rows].mean(axis=0)
+            query /= max(float(np.linalg.norm(query)), 1e-12)
+            found, scores = self.search(query, topn + len(rows))
+            keep = ~np.isin(found, rows)
+            return found[keep][:topn], scores[keep][:topn]
+
+        per_seed = [self.search(self.vectors[row], topn, exclude_row=row) for row in rows.tolist()]
+        return fuse_ranked_lists(per_seed, fusion, topn, exclude=rows)
+
+    def search_batch(
+        self,
+        rows: Sequence[int],
+        topn: int,
+        block_size: int = 64
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """시드별 근사 검색 (리스트 구성이 시드마다 달라 GEMM으로 묶지 않음)"""
+        return [
+            self.search(self.vectors[row], topn, exclude_row=row)
+            for row in np.asarray(rows, dtype=np.int64).tolist()
+        ]
+
+    def save(self, path: str) -> None:
+        """인덱스를 .npz로 저장"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            song_ids=self.song_ids,
+            vectors=self.vectors,
+            centroids=self.centroids,
+            list_offsets=self.list_offsets,
+            nprobe=np.int64(self.nprobe)
+        )
+        logger.info(f"IVF 인덱스 저장 완료: {path}")
+
+    @classmethod
+    def load(cls, path: str) -> "IVFFlatIndex":
+        """save()로 저장한 .npz 로드"""
+        data = np.load(path)
+        return cls(
+            data["song_ids"],
+            data["vectors"],
+            data["centroids"],
+            data["list_offsets"],
+            nprobe=int(data["nprobe"])
+        )
+
+
+def load_ann_index(path: str, nprobe: Optional[int] = None) -> Optional[IVFFlatIndex]:
+    """
+    저장된 IVF 인덱스 로드
+
+    Args:
+        path: .npz 경로
+        nprobe: 지정 시 저장된 기본값 대신 사용
+
+    Returns:
+        IVFFlatIndex 또는 None
+    """
+    if not path:
+        return None
+
+    if not Path(path).exists():
+        logger.warning(f"ANN 인덱스 파일 없음: {path}")
+        return None
+
+    try:
+        index = IVFFlatIndex.load(path)
+        if nprobe:
+            index.nprobe = nprobe
+        logger.info(f"ANN 인덱스 로드 완료: {path} (N={len(index):,}, nlist={index.nlist}, nprobe={index.nprobe})")
+        return index
+    except Exception as e:
+        logger.error(f"ANN 인덱스 로드 실패: {e}")
+        return None
+
+
+def recall_report(
+    exact: ItemVectorIndex,
+    ann: IVFFlatIndex,
+    nprobes: Sequence[int],
+    topn: int = 200,
+    n_queries: int = 1000,
+    seed: int = 0
+) -> List[Dict[str, float]]:
+    """
+    exact 검색 대비 ANN recall@topn / 평균 latency 측정
+
+    쿼리는 인덱스 내 곡을 시드로 사용 (시드 자신 제외 검색)
+
+    Returns:
+        [{"nprobe", "recall", "ann_ms", "exact_ms"}, ...]
+    """
+    rng = np.random.default_rng(seed)
+    sample = exact.song_ids[rng.choice(len(exact), size=min(n_queries, len(exact)), replace=False)]
+
+    truth = []
+    start = time.perf_counter()
+    for sid in sample.tolist():
+        rows, _ = exact.search_by_id(sid, topn)
+        truth.append(exact.song_ids[rows])
+    exact_ms = (time.perf_counter() - start) * 1000 / max(len(sample), 1)
+
+    report = []
+    for nprobe in nprobes:
+        hits = 0
+        total = 0
+        start = time.perf_counter()
+        found_all = []
+        for sid in sample.tolist():
+            row = ann.row_of(sid)
+            rows, _ = ann.search(ann.vectors[row], topn, exclude_row=row, nprobe=nprobe)
+            found_all.append(ann.song_ids[rows])
+        ann_ms = (time.perf_counter() - start) * 1000 / max(len(sample), 1)
+
+        for expected, found in zip(truth, found_all):
+            hits += len(np.intersect1d(expected, found, assume_unique=True))
+            total += len(expected)
+
+        report.append({
+            "nprobe": nprobe,
+            "recall": hits / max(total, 1),
+            "ann_ms": ann_ms,
+            "exact_ms": exact_ms
+        })
+    return report
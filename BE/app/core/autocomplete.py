@@ -0,0 +1,379 @@
+"""
+VibeCurator Autocomplete
+한글 자모 분해 기반 곡명 / 아티스트 접두 자동완성 (완성 음절 / 초성 / 입력 중인 자모)
+
+- 키: 곡명 / 아티스트를 소문자 + 공백 제거 후 두 가지로 변환
+  자모 키: 음절을 초성 / 중성 / 종성으로 분해, 겹모음 / 겹받침은 자판 입력 순서대로 나눔 (ㅘ -> ㅗㅏ, ㄺ -> ㄹㄱ)
+  초성 키: 음절을 초성으로 ("방탄소년단" -> "ㅂㅌㅅㄴㄷ")
+- 질의가 자음만이면 초성 키, 아니면 자모 키의 접두 매칭
+  입력 중인 "방ㅌ" / "방타"의 자모 분해는 "방탄"의 자모 키 접두이므로 별도 처리 없이 매칭
+- 순위: 인기도 prior(Item2Vec vocab 빈도) 내림차순 > 곡명 길이 > 카탈로그 순서
+- 키를 정렬한 배열에서 접두 구간이 곧 trie 노드, 구간 상위 K개는 블록 계층별 상위 K 표로 조회
+  (구간 크기와 무관하게 가장자리 원소 + 레벨마다 최대 2 * (FANOUT - 1)개 블록만 병합)
+
+prior 파일 형식 (.npz, python -m app.cli build-search-prior):
+    song_ids: int64, counts: float32
+"""
+
+import logging
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .loaders import MetaRegistry, StringColumn, StringColumnBuilder
+from .search import meta_fields
+
+logger = logging.getLogger(__name__)
+
+# 요청당 최대 결과 수 (블록별 상위 K 표 크기 결정)
+MAX_LIMIT = 100
+
+# 블록 계층: 레벨 0 블록 크기, 상위 레벨은 FANOUT개 블록을 묶음
+_BLOCK = 1024
+_FANOUT = 8
+
+# 블록 표의 빈 칸 (어떤 순위보다 큼)
+_PAD = np.iinfo(np.int32).max
+
+_SYLLABLE_FIRST = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("",) + tuple("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ")
+
+# 겹모음 / 겹받침 -> 자판 입력 순서
+_COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+# 호환 자모 자음 (ㄱ ~ ㅎ, 겹받침 포함)
+_CONSONANTS = frozenset(chr(cp) for cp in range(0x3131, 0x314F))
+
+
+def _split_jamo(jamo: str) -> str:
+    return _COMPOUND_JAMO.get(jamo, jamo)
+
+
+def _syllable_parts(code: int) -> Tuple[int, int, int]:
+    """음절 코드 포인트 -> (초성, 중성, 종성) 인덱스"""
+    offset = code - _SYLLABLE_FIRST
+    return offset // 588, (offset % 588) // 28, offset % 28
+
+
+def _compose(cho: int, jung: int, jong: int = 0) -> str:
+    return chr(_SYLLABLE_FIRST + cho * 588 + jung * 28 + jong)
+
+
+def _build_tables() -> Tuple[dict, dict]:
+    jamo_table = {ord(jamo): parts for jamo, parts in _COMPOUND_JAMO.items()}
+    choseong_table = {}
+    for code in range(_SYLLABLE_FIRST, _SYLLABLE_LAST + 1):
+        cho, jung, jong = _syllable_parts(code)
+        jamo_table[code] = _CHOSEONG[cho] + _split_jamo(_JUNGSEONG[jung]) + _split_jamo(_JONGSEONG[jong])
+        choseong_table[code] = _CHOSEONG[cho]
+    return jamo_table, choseong_table
+
+
+# str.translate 표 (음절 11,172개 + 겹자모)
+_JAMO_TABLE, _CHOSEONG_TABLE = _build_tables()
+
+
+def _compact(text: str) -> str:
+    """소문자 + 공백 제거"""
+    return "".join(text.lower().split())
+
+
+def jamo_key(text: str) -> str:
+    """자모 키 ("방탄" -> "ㅂㅏㅇㅌㅏㄴ", 한글 외 문자는 그대로)"""
+    return _compact(text).translate(_JAMO_TABLE)
+
+
+def choseong_key(text: str) -> str:
+    """초성 키 ("방탄" -> "ㅂㅌ", 한글 외 문자는 그대로)"""
+    return _compact(text).translate(_CHOSEONG_TABLE)
+
+
+def is_choseong_query(query: str) -> bool:
+    """공백을 뺀 질의가 자음 자모로만 이루어졌는지"""
+    compact = _compact(query)
+    return bool(compact) and all(c in _CONSONANTS for c in compact)
+
+
+def keystroke_prefixes(text: str) -> Iterator[str]:
+    """
+    text를 두벌식으로 입력할 때 입력창에 보이는 중간 상태 (벤치마크용 근사)
+
+    "방탄" -> "ㅂ", "바", "방", "방ㅌ", "방타", "방탄" / "닭" -> "ㄷ", "다", "달", "닭"
+    """
+    for i, char in enumerate(text):
+        head = text[:i]
+        code = ord(char)
+        if _SYLLABLE_FIRST <= code <= _SYLLABLE_LAST:
+            cho, jung, jong = _syllable_parts(code)
+            yield head + _CHOSEONG[cho]
+            if jong:
+                yield head + _compose(cho, jung)
+                first = _split_jamo(_JONGSEONG[jong])[0]
+                if first != _JONGSEONG[jong]:
+                    yield head + _compose(cho, jung, _JONGSEONG.index(first))
+        yield head + char
+
+
+class _PrefixTable:
+    """
+    정렬된 키 배열 (접두 구간 = trie 노드) + 구간 상위 K 순위 조회
+
+    ranks[i]는 i번째 키(정렬 순서)가 가리키는 곡의 전역 순위 (작을수록 우선)
+    levels[l]은 _BLOCK * _FANOUT**l 크기 블록별 상위 K 순위 (오름차순, 빈 칸은 _PAD)
+    """
+
+    def __init__(self, keys: StringColumn, ranks: np.ndarray, top_k: int):
+        self.keys = keys
+        self.ranks = ranks
+        self.levels = self._block_tops(ranks, top_k)
+
+    def __len__(self) -> int:
+        return int(self.ranks.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        return self.keys.nbytes + int(self.ranks.nbytes) + sum(int(level.nbytes) for level in self.levels)
+
+    @classmethod
+    def build(cls, keys: List[str], ranks: np.ndarray, top_k: int) -> "_PrefixTable":
+        """(키, 순위) 쌍을 키 오름차순으로 정렬해 생성"""
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        sorted_keys = StringColumnBuilder()
+        for i in order:
+            sorted_keys.append(keys[i])
+        return cls(sorted_keys.build(), ranks[np.asarray(order, dtype=np.int64)].astype(np.int32), top_k)
+
+    @staticmethod
+    def _block_tops(ranks: np.ndarray, top_k: int) -> List[np.ndarray]:
+        """레벨별 블록 상위 K 표 (최상위 레벨 블록 수 <= _FANOUT)"""
+        blocks = -(-len(ranks) // _BLOCK)
+        padded = np.full(blocks * _BLOCK, _PAD, dtype=np.int32)
+        padded[:len(ranks)] = ranks
+        tops = np.sort(padded.reshape(blocks, _BLOCK), axis=1)[:, :top_k]
+        levels = [tops]
+        while len(tops) > _FANOUT:
+            groups = -(-len(tops) // _FANOUT)
+            padded = np.full((groups * _FANOUT, tops.shape[1]), _PAD, dtype=np.int32)
+            padded[:len(tops)] = tops
+            tops = np.sort(padded.reshape(groups, -1), axis=1)[:, :top_k]
+            levels.append(tops)
+        return levels
+
+    def _bisect(self, lo: int, hi: int, before: Callable[[str], bool]) -> int:
+        """키 정렬 순서 [lo, hi)에서 before(키)가 처음 거짓이 되는 위치"""
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if before(self.keys[mid]):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """prefix로 시작하는 키 구간 [a, b)"""
+        n = len(prefix)
+        a = self._bisect(0, len(self), lambda key: key < prefix)
+        b = self._bisect(a, len(self), lambda key: key[:n] <= prefix)
+        return a, b
+
+    def _units(self, level: int, start: int, stop: int) -> np.ndarray:
+        """레벨 단위 [start, stop)의 순위 (레벨 -1은 원소 자체)"""
+        if level < 0:
+            return self.ranks[start:stop]
+        return self.levels[level][start:stop].ravel()
+
+    def range_candidates(self, lo: int, hi: int) -> np.ndarray:
+        """
+        구간 [lo, hi)의 상위 K 후보 순위 (구간 안 상위 K개를 모두 포함)
+
+        아래 레벨부터 다음 레벨 블록 경계에 맞지 않는 가장자리만 현재 레벨 단위로 가져오고,
+        경계에 맞춰진 안쪽 구간은 한 레벨 위로 넘김
+        """
+        parts = []
+        level, unit = -1, 1
+        while lo < hi:
+            if level + 1 == len(self.levels):
+                parts.append(self._units(level, lo // unit, hi // unit))
+                break
+            upper = _BLOCK * _FANOUT ** (level + 1)
+            inner_lo = min(-(-lo // upper) * upper, hi)
+            inner_hi = max(hi // upper * upper, inner_lo)
+            parts.append(self._units(level, lo // unit, inner_lo // unit))
+            parts.append(self._units(level, inner_hi // unit, hi // unit))
+            lo, hi = inner_lo, inner_hi
+            level, unit = level + 1, upper
+        return np.concatenate(parts) if parts else self.ranks[:0]
+
+
+class AutocompleteIndex:
+    """
+    곡명 / 아티스트 자동완성 인덱스 (행 = 카탈로그 행)
+
+    곡마다 곡명 / 아티스트 키 2개씩을 자모 표와 초성 표에 넣고, 결과는 곡 단위로 중복 제거
+    """
+
+    def __init__(
+        self,
+        song_ids: np.ndarray,
+        rows_by_rank: np.ndarray,
+        jamo: _PrefixTable,
+        choseong: _PrefixTable,
+        has_prior: bool
+    ):
+        self.song_ids = song_ids
+        self.rows_by_rank = rows_by_rank
+        self.jamo = jamo
+        self.choseong = choseong
+        self.has_prior = has_prior
+
+    def __len__(self) -> int:
+        return int(self.song_ids.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.song_ids.nbytes + self.rows_by_rank.nbytes) + self.jamo.nbytes + self.choseong.nbytes
+
+    @classmethod
+    def build(
+        cls,
+        song_ids: np.ndarray,
+        fields: Iterable[Tuple[str, str]],
+        prior: Optional[np.ndarray] = None
+    ) -> "AutocompleteIndex":
+        """
+        (곡명, 아티스트) 행 순서대로 인덱스 생성
+
+        Args:
+            song_ids: 행 -> song_id
+            fields: 행별 (song_name, artist)
+            prior: 행별 인기도 (클수록 우선, None이면 곡명 길이 > 카탈로그 순서)
+        """
+        jamo_keys: List[str] = []
+        jamo_rows: List[int] = []
+        choseong_keys: List[str] = []
+        choseong_rows: List[int] = []
+        name_lens: List[int] = []
+        for row, (song_name, artist) in enumerate(fields):
+            song_name = song_name or ""
+            name_lens.append(len(_compact(song_name)))
+            for text in (song_name, artist or ""):
+                key = jamo_key(text)
+                if key:
+                    jamo_keys.append(key)
+                    jamo_rows.append(row)
+                    choseong_keys.append(choseong_key(text))
+                    choseong_rows.append(row)
+
+        # 전역 순위: prior 내림차순 > 곡명 길이 > 행
+        n = len(name_lens)
+        weights = np.zeros(n, dtype=np.float64) if prior is None else np.asarray(prior, dtype=np.float64)
+        rows_by_rank = np.lexsort((np.arange(n), np.asarray(name_lens), -weights)).astype(np.int32)
+        rank = np.empty(n, dtype=np.int32)
+        rank[rows_by_rank] = np.arange(n, dtype=np.int32)
+
+        # 곡당 키가 최대 2개(곡명 / 아티스트)라 상위 2 * MAX_LIMIT개면 중복 제거 후 MAX_LIMIT곡 보장
+        top_k = 2 * MAX_LIMIT
+        index = cls(
+            song_ids=np.asarray(song_ids, dtype=np.int64),
+            rows_by_rank=rows_by_rank,
+            jamo=_PrefixTable.build(jamo_keys, rank[np.asarray(jamo_rows, dtype=np.int64)], top_k),
+            choseong=_PrefixTable.build(choseong_keys, rank[np.asarray(choseong_rows, dtype=np.int64)], top_k),
+            has_prior=prior is not None
+        )
+        logger.info(
+            f"자동완성 인덱스 생성: songs={len(index):,}, keys={len(index.jamo):,} x 2 "
+            f"({index.nbytes / 2**20:.1f}MiB, prior={'yes' if index.has_prior else 'no'})"
+        )
+        return index
+
+    def complete_rows(self, query: str, limit: int) -> np.ndarray:
+        """자동완성 (결과 행 번호, 순위 순)"""
+        limit = min(limit, MAX_LIMIT)
+        if limit <= 0:
+            return np.zeros(0, dtype=np.int64)
+        if is_choseong_query(query):
+            table, key = self.choseong, choseong_key(query)
+        else:
+            table, key = self.jamo, jamo_key(query)
+        if not key:
+            return np.zeros(0, dtype=np.int64)
+
+        a, b = table.prefix_range(key)
+        candidates = table.range_candidates(a, b)
+        need = 2 * limit
+        if len(candidates) > need:
+            candidates = np.partition(candidates, need - 1)[:need]
+        ranks = np.unique(candidates)
+        ranks = ranks[ranks < len(self)][:limit]
+        return self.rows_by_rank[ranks].astype(np.int64)
+
+    def complete(self, query: str, limit: int) -> List[int]:
+        """자동완성 (결과 song_id 목록)"""
+        return self.song_ids[self.complete_rows(query, limit)].tolist()
+
+
+def align_prior(song_ids: np.ndarray, prior_ids: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """(song_id, count) 쌍 -> song_ids 행 순서 prior (없는 곡은 0)"""
+    order = np.argsort(prior_ids, kind="stable")
+    sorted_ids = prior_ids[order]
+    song_ids = np.asarray(song_ids, dtype=np.int64)
+    pos = np.minimum(np.searchsorted(sorted_ids, song_ids), max(len(sorted_ids) - 1, 0))
+    prior = np.zeros(len(song_ids), dtype=np.float32)
+    if len(sorted_ids):
+        found = sorted_ids[pos] == song_ids
+        prior[found] = counts[order][pos[found]]
+    return prior
+
+
+def save_search_prior(path: str, song_ids: np.ndarray, counts: np.ndarray) -> None:
+    """인기도 prior 저장 (.npz)"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    np.savez(path, song_ids=np.asarray(song_ids, dtype=np.int64), counts=np.asarray(counts, dtype=np.float32))
+    logger.info(f"검색 prior 저장 완료: {path} ({len(song_ids):,}곡)")
+
+
+def load_search_prior(path: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    인기도 prior 로드
+
+    Returns:
+        (song_ids, counts) 또는 None
+    """
+    if not path:
+        return None
+    if not Path(path).exists():
+        logger.warning(f"검색 prior 파일 없음: {path}")
+        return None
+    try:
+        with np.load(path) as data:
+            song_ids = np.asarray(data["song_ids"], dtype=np.int64)
+            counts = np.asarray(data["counts"], dtype=np.float32)
+        logger.info(f"검색 prior 로드 완료: {len(song_ids):,}곡")
+        return song_ids, counts
+    except Exception as e:
+        logger.error(f"검색 prior 로드 실패: {e}")
+        return None
+
+
+def build_autocomplete_index(
+    meta: MetaRegistry,
+    prior: Optional[Tuple[np.ndarray, np.ndarray]] = None
+) -> AutocompleteIndex:
+    """
+    메타 레지스트리 -> 자동완성 인덱스 (행 = song_ids 순서)
+
+    Args:
+        meta: 메타 레지스트리
+        prior: (song_ids, counts) 인기도 (Item2Vec vocab 빈도 / prior 파일)
+    """
+    song_ids = np.asarray(meta.song_ids, dtype=np.int64)
+    weights = align_prior(song_ids, *prior) if prior is not None else None
+    return AutocompleteIndex.build(song_ids, meta_fields(meta), weights)
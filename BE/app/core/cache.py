@@ -1,63 +1,623 @@
 """
 VibeCurator Redis Cache
-추천 결과 JSON 캐싱
+추천 결과 JSON 캐싱 (프로세스 내 LRU 1차 캐시 + Redis 2차 캐시)
 """
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Optional, Any
+import math
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 
-import redis
+import redis.asyncio as aioredis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
 
 logger = logging.getLogger(__name__)
 
 
 class RedisCache:
-    """Redis 캐시 클라이언트"""
+    """
+    Redis 캐시 클라이언트 (redis.asyncio, 크기 제한 연결 풀)
+    
+    - 명령은 이벤트 루프를 막지 않음 (동시 요청은 풀의 연결을 나눠 쓰고, 풀이 차면 빈 연결을 기다림)
+    - 연결 상태는 실제 명령 결과로 갱신 (명령 전 PING 없음)
+    - 명령이 실패하면 retry_sec 동안 명령을 보내지 않고 캐시 미스로 처리 (장애 중 요청마다 타임아웃을 기다리지 않음)
+    """
     
-    def __init__(self, redis_url: str):
+    def __init__(
+        self,
+        redis_url: str,
+        max_connections: int = 32,
+        timeout_sec: float = 2.0,
+        retry_sec: float = 5.0
+    ):
         """
         Args:
             redis_url: Redis 연결 URL (예: redis://localhost:6379/0)
+            max_connections: 연결 풀 크기
+            timeout_sec: 연결 / 명령 / 풀 대기 타임아웃 (초)
+            retry_sec: 명령 실패 후 다시 시도하기까지 대기 (초)
         """
         self.redis_url = redis_url
-        self._client: Optional[redis.Redis] = None
+        self.max_connections = max_connections
+        self.timeout_sec = timeout_sec
+        self.retry_sec = retry_sec
+        self._client: Optional[aioredis.Redis] = None
         self._connected = False
-        self._connect()
-    
-    def _connect(self) -> None:
-        """Redis 연결 시도"""
+        self._retry_at = 0.0
         try:
-            self._client = redis.from_url(
-                self.redis_url,
+            pool = aioredis.BlockingConnectionPool.from_url(
+                redis_url,
+                max_connections=max_connections,
+                timeout=timeout_sec,
                 decode_responses=True,
-                socket_connect_timeout=2,
-                socket_timeout=2
+                socket_connect_timeout=timeout_sec,
+                socket_timeout=timeout_sec,
+                retry=Retry(NoBackoff(), 0)
             )
-            # 연결 테스트
-            self._client.ping()
-            self._connected = True
-            logger.info(f"Redis 연결 성공: {self.redis_url}")
+            self._client = aioredis.Redis(connection_pool=pool)
         except Exception as e:
-            logger.warning(f"Redis 연결 실패 (캐시 없이 진행): {e}")
-            self._connected = False
-            self._client = None
+            logger.warning(f"Redis 설정 오류 (캐시 없이 진행): {e}")
+    
+    async def connect(self) -> bool:
+        """시작 시 1회 연결 확인 (실패해도 재시도 대기 후 명령이 성공하면 연결 상태로 전환)"""
+        if await self.ping():
+            logger.info(f"Redis 연결 성공: {self.redis_url} (pool={self.max_connections})")
+            return True
+        logger.warning(f"Redis 연결 실패 (캐시 없이 진행, {self.retry_sec:g}초 후 재시도): {self.redis_url}")
+        return False
     
     @property
     def is_connected(self) -> bool:
-        """Redis 연결 상태"""
-        if not self._client:
+        """Redis 연결 상태 (마지막 명령 결과 기준, 네트워크 I/O 없음)"""
+        return self._connected
+    
+    @property
+    def available(self) -> bool:
+        """명령을 보낼지 여부 (연결됨, 또는 실패 후 재시도 대기가 지남)"""
+        return self._client is not None and (self._connected or time.monotonic() >= self._retry_at)
+    
+    def _succeeded(self) -> None:
+        if not self._connected:
+            self._connected = True
+            if self._retry_at:
+                logger.info(f"Redis 연결 복구: {self.redis_url}")
+    
+    def _failed(self, action: str, error: Exception) -> None:
+        logger.warning(f"캐시 {action} 실패: {error}")
+        self._connected = False
+        self._retry_at = time.monotonic() + self.retry_sec
+    
+    async def ping(self) -> bool:
+        """Redis ping 테스트 (/health, 시작 시 연결 확인에서만 사용)"""
+        if self._client is None:
             return False
         try:
-            self._client.ping()
-            return True
-        except Exception:
-            self._connected = False
+            await self._client.ping()
+        except Exception as e:
+            self._failed("연결 확인", e)
             return False
+        self._succeeded()
+        return True
+    
+    async def get(self, key: str) -> Optional[str]:
+        """GET (없거나 실패 / 재시도 대기 중이면 None)"""
+        if not self.available:
+            return None
+        try:
+            data = await self._client.get(key)
+        except Exception as e:
+            self._failed("조회", e)
+            return None
+        self._succeeded()
+        return data or None
     
-    def ping(self) -> bool:
-        """Redis ping 테스트"""
-        return self.is_connected
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """MGET 1회 (keys 순서, 실패 / 재시도 대기 중이면 전부 None)"""
+        if not keys or not self.available:
+            return [None] * len(keys)
+        try:
+            values = await self._client.mget(keys)
+        except Exception as e:
+            self._failed("일괄 조회", e)
+            return [None] * len(keys)
+        self._succeeded()
+        return [data or None for data in values]
+    
+    async def set_many(self, items: Dict[str, str], ttl_sec: int) -> None:
+        """SET EX (2개 이상이면 파이프라인, 왕복 1회)"""
+        if not items or not self.available:
+            return
+        try:
+            if len(items) == 1:
+                key, data = next(iter(items.items()))
+                await self._client.set(key, data, ex=ttl_sec)
+            else:
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for key, data in items.items():
+                        pipe.set(key, data, ex=ttl_sec)
+                    await pipe.execute()
+        except Exception as e:
+            self._failed("저장", e)
+            return
+        self._succeeded()
+    
+    async def exists_many(self, keys: List[str]) -> List[bool]:
+        """EXISTS 파이프라인 (값은 가져오지 않음, 실패 / 재시도 대기 중이면 전부 False)"""
+        if not keys or not self.available:
+            return [False] * len(keys)
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.exists(key)
+                counts = await pipe.execute()
+        except Exception as e:
+            self._failed("존재 확인", e)
+            return [False] * len(keys)
+        self._succeeded()
+        return [bool(count) for count in counts]
+    
+    async def try_lock(self, key: str, token: str, ttl_sec: float) -> Optional[bool]:
+        """
+        SET NX PX 잠금 (워커 간 단일 계산)
+        
+        Returns:
+            True: 획득 / False: 다른 워커가 보유 중 / None: Redis 사용 불가 (잠금 없이 진행)
+        """
+        if not self.available:
+            return None
+        try:
+            acquired = await self._client.set(key, token, nx=True, px=max(1, int(ttl_sec * 1000)))
+        except Exception as e:
+            self._failed("잠금", e)
+            return None
+        self._succeeded()
+        return bool(acquired)
+    
+    async def unlock(self, key: str, token: str) -> None:
+        """잠금 해제 (WATCH로 아직 내 토큰일 때만 삭제, 만료 후 다른 워커가 잡은 잠금은 유지)"""
+        if not self.available:
+            return
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                await pipe.watch(key)
+                if await pipe.get(key) == token:
+                    pipe.multi()
+                    pipe.delete(key)
+                    await pipe.execute()
+                else:
+                    await pipe.unwatch()
+        except Exception as e:
+            self._failed("잠금 해제", e)
+            return
+        self._succeeded()
+    
+    async def close(self) -> None:
+        """연결 풀 종료 (앱 종료 / 핫 리로드로 이전 세대가 교체된 뒤)"""
+        if self._client is not None:
+            await self._client.connection_pool.disconnect()
+
+
+class LocalCache:
+    """
+    프로세스 내 LRU + TTL 캐시 (Redis 앞단 1차 캐시)
+    
+    - 값은 파싱 / 검증이 끝난 객체를 그대로 보관 (적중 시 네트워크 / json.loads / 재검증 없음)
+    - 항목 수(max_entries)와 근사 크기(max_bytes, 직렬화 JSON 길이 합) 중 하나라도 넘으면 오래된 항목부터 제거
+    - 만료는 조회 시점에 확인 (만료 항목은 미스로 집계 후 삭제)
+    """
+    
+    def __init__(self, max_entries: int, max_bytes: int, ttl_sec: float):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 근사 크기 (바이트, 0이면 크기 제한 없음)
+            ttl_sec: 항목 TTL 상한 (초)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_sec = ttl_sec
+        # key -> (expires_at, size, value), 앞쪽이 가장 오래 전에 사용된 항목
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """조회 (적중 시 최근 사용으로 갱신, 없거나 만료면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: str, value: Any, size: int, ttl_sec: Optional[float] = None) -> None:
+        """
+        저장 (용량 초과 시 LRU 제거)
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 객체
+            size: 근사 크기 (바이트)
+            ttl_sec: 항목 TTL (초, ttl_sec 설정값으로 상한, None이면 설정값)
+        """
+        ttl = self.ttl_sec if ttl_sec is None else min(ttl_sec, self.ttl_sec)
+        if ttl <= 0 or self.max_entries <= 0 or (self.max_bytes and size > self.max_bytes):
+            return
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (expires_at, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (self.max_bytes and self._bytes > self.max_bytes):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """전체 비우기 (카운터는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """적중 / 미스 / 만료 / 제거 카운터와 현재 점유량"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_sec": self.ttl_sec,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+            }
+
+
+class SingleFlight:
+    """
+    같은 캐시 키의 동시 계산을 1회로 합침 (single-flight)
+    
+    - 프로세스 내: 키별로 진행 중인 계산이 있으면 새로 계산하지 않고 그 결과(또는 예외)를 함께 받음
+    - 워커 간 (lock_ttl_sec > 0): Redis 잠금을 잡은 워커만 계산하고, 나머지는 캐시에 결과가 써질 때까지 대기
+      (잠금이 풀렸는데 결과가 없거나 lock_wait_sec를 넘기면 직접 계산)
+    - 계산은 별도 태스크로 실행 (먼저 온 요청이 취소되어도 기다리는 요청은 결과를 받음)
+    """
+    
+    def __init__(self, lock_ttl_sec: float = 0.0, lock_wait_sec: float = 5.0, poll_sec: float = 0.05):
+        """
+        Args:
+            lock_ttl_sec: Redis 잠금 TTL (초, 0이면 프로세스 내에서만 합침)
+            lock_wait_sec: 다른 워커의 결과를 기다리는 최대 시간 (초)
+            poll_sec: 다른 워커 결과 확인 간격 (초)
+        """
+        self.lock_ttl_sec = lock_ttl_sec
+        self.lock_wait_sec = lock_wait_sec
+        self.poll_sec = poll_sec
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.computed = 0
+        self.coalesced = 0
+        self.remote_coalesced = 0
+        self.lock_timeouts = 0
+    
+    def __len__(self) -> int:
+        return len(self._inflight)
+    
+    async def run(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        local: Optional["LocalCache"] = None,
+        cache: Optional[RedisCache] = None,
+        decode: Optional[Callable[[dict], Any]] = None
+    ) -> Tuple[Any, bool]:
+        """
+        key의 값을 1회만 계산 (compute는 계산 + 캐시 저장까지 수행)
+        
+        Args:
+            key: 캐시 키
+            compute: 계산 코루틴 함수 (결과를 캐시에 저장하고 반환)
+            local / cache / decode: 워커 간 대기 시 캐시에서 결과를 읽는 데 사용 (get_tiered와 동일)
+        
+        Returns:
+            (값, 캐시에서 읽었는지) - 다른 워커가 계산한 결과를 캐시에서 받았으면 True
+        
+        Raises:
+            compute가 던진 예외 (같은 키를 기다리던 요청 모두에 전달)
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+        
+        future = asyncio.ensure_future(self._lead(key, compute, local, cache, decode))
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+    
+    async def run_many(
+        self,
+        keys: List[str],
+        compute: Callable[[List[str]], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        여러 키를 한 번에 계산 (진행 중인 키는 합류, 나머지 키만 compute로 일괄 계산, 프로세스 내에서만)
+        
+        Args:
+            keys: 캐시 키 목록 (중복 없음)
+            compute: 키 목록 -> {키: 값 또는 예외 객체} 일괄 계산 코루틴 함수
+        
+        Returns:
+            {키: 값 또는 예외 객체}
+        
+        Raises:
+            compute가 던진 예외 (일괄 계산 전체 실패)
+        """
+        joined = {key: self._inflight[key] for key in keys if key in self._inflight}
+        self.coalesced += len(joined)
+        
+        results: Dict[str, Any] = {}
+        lead = [key for key in keys if key not in joined]
+        if lead:
+            loop = asyncio.get_running_loop()
+            task = asyncio.ensure_future(compute(lead))
+            for key in lead:
+                self._inflight[key] = loop.create_future()
+            task.add_done_callback(lambda done: self._settle(lead, done))
+            # 일괄 계산 자체가 실패하면 (대기열 초과 / 타임아웃 등) 그대로 전달
+            results.update(await asyncio.shield(task))
+        
+        for key, future in joined.items():
+            try:
+                results[key], _ = await asyncio.shield(future)
+            except Exception as e:
+                results[key] = e
+        return results
+    
+    def _settle(self, keys: List[str], task: asyncio.Future) -> None:
+        """run_many 일괄 계산 완료 -> 키별 대기자에게 결과 / 예외 전달"""
+        self.computed += len(keys)
+        cancelled = task.cancelled()
+        error = None if cancelled else task.exception()
+        values = task.result() if not cancelled and error is None else {}
+        for key in keys:
+            future = self._inflight.pop(key)
+            value = values.get(key, error)
+            if cancelled:
+                future.cancel()
+            elif isinstance(value, BaseException):
+                future.set_exception(value)
+                # 기다리는 요청이 모두 취소된 경우 미회수 예외 경고 방지
+                future.exception()
+            else:
+                future.set_result((value, False))
+    
+    async def _lead(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        local: Optional["LocalCache"],
+        cache: Optional[RedisCache],
+        decode: Optional[Callable[[dict], Any]]
+    ) -> Tuple[Any, bool]:
+        """계산 담당 (워커 간 잠금이 켜져 있으면 잠금을 잡은 워커만 계산)"""
+        lock_key = token = None
+        if self.lock_ttl_sec > 0 and cache is not None and decode is not None:
+            lock_key, token = f"lock:{key}", uuid.uuid4().hex
+            acquired = await cache.try_lock(lock_key, token, self.lock_ttl_sec)
+            if acquired is False:
+                value = await self._wait_remote(local, cache, key, lock_key, decode)
+                if value is not None:
+                    self.remote_coalesced += 1
+                    return value, True
+                # 다른 워커가 결과 없이 끝났거나 대기 시간 초과 -> 직접 계산 (잠금은 다시 시도)
+                acquired = await cache.try_lock(lock_key, token, self.lock_ttl_sec)
+            if not acquired:
+                token = None
+        
+        try:
+            self.computed += 1
+            return await compute(), False
+        finally:
+            if token is not None:
+                await cache.unlock(lock_key, token)
+    
+    async def _wait_remote(
+        self,
+        local: Optional["LocalCache"],
+        cache: RedisCache,
+        key: str,
+        lock_key: str,
+        decode: Callable[[dict], Any]
+    ) -> Optional[Any]:
+        """
+        다른 워커가 잠금을 풀거나 결과를 쓸 때까지 대기 (결과 키 + 잠금 키 MGET 1회씩 폴링)
+        
+        soft TTL이 지난 항목(재계산 대상)은 결과로 보지 않고 새 결과를 기다림
+        """
+        deadline = time.monotonic() + self.lock_wait_sec
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_sec)
+            data, holder = await cache.get_many([key, lock_key])
+            entry = _decode_entry(data, decode)
+            if entry is not None and entry[1] > time.time():
+                if local is not None:
+                    local.set(key, entry, len(data))
+                return entry[0]
+            if holder is None:
+                return None
+        self.lock_timeouts += 1
+        return None
+    
+    def stats(self) -> Dict[str, Any]:
+        """계산 / 합쳐진 요청 카운터 (duplicates_avoided = 프로세스 내 + 워커 간)"""
+        return {
+            "inflight": len(self._inflight),
+            "computed": self.computed,
+            "coalesced": self.coalesced,
+            "remote_coalesced": self.remote_coalesced,
+            "duplicates_avoided": self.coalesced + self.remote_coalesced,
+            "lock_ttl_sec": self.lock_ttl_sec,
+            "lock_timeouts": self.lock_timeouts,
+        }
+
+
+class CacheRefresher:
+    """
+    추천 캐시 항목 신선도 (stale-while-revalidate + 확률적 조기 갱신)
+    
+    - 항목에 계산 시각(computed_at), soft 만료(fresh_until), 계산 시간(compute_sec)을 함께 저장
+    - soft TTL = ttl_sec에서 최대 jitter 비율만큼 무작위로 줄인 값 (같이 계산된 항목의 만료 분산)
+    - Redis TTL = ttl_sec + stale_sec: soft 만료 후 stale_sec 동안은 이전 결과를 바로 응답하고 백그라운드에서 재계산
+    - soft 만료 전에도 계산 시간 x beta에 비례한 확률로 미리 재계산 (XFetch, 만료 직전 미스 몰림 방지)
+    - 재계산은 키별 1회 (진행 중인 키는 다시 예약하지 않음, SingleFlight가 있으면 동시 미스도 합류)
+    """
+    
+    def __init__(self, ttl_sec: int, stale_sec: int = 0, jitter: float = 0.0, beta: float = 0.0):
+        """
+        Args:
+            ttl_sec: soft TTL (초, CACHE_TTL_SEC)
+            stale_sec: soft 만료 후 이전 결과를 응답하는 시간 (초, 0이면 만료 즉시 미스)
+            jitter: soft TTL 무작위 단축 비율 (0~1)
+            beta: 조기 갱신 강도 (0이면 조기 갱신 없음)
+        """
+        self.ttl_sec = ttl_sec
+        self.stale_sec = stale_sec
+        self.jitter = jitter
+        self.beta = beta
+        self._refreshing: Dict[str, asyncio.Future] = {}
+        self.stale_hits = 0
+        self.early_refreshes = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+    
+    @property
+    def store_ttl_sec(self) -> int:
+        """Redis 저장 TTL (soft TTL + stale 구간)"""
+        return self.ttl_sec + self.stale_sec
+    
+    def stamp(self, data: dict, compute_sec: float) -> dict:
+        """저장할 딕셔너리에 계산 시각 / soft 만료 / 계산 시간 추가"""
+        now = time.time()
+        ttl = self.ttl_sec * (1.0 - self.jitter * random.random())
+        return {**data, "computed_at": round(now, 3), "fresh_until": round(now + ttl, 3), "compute_sec": round(compute_sec, 4)}
+    
+    def is_due(self, fresh_until: float, compute_sec: float) -> bool:
+        """
+        재계산 필요 여부 (soft 만료 지남, 또는 조기 갱신 당첨)
+        
+        조기 갱신: now - compute_sec * beta * ln(U) >= fresh_until (만료에 가까울수록, 계산이 오래 걸릴수록 확률 증가)
+        """
+        now = time.time()
+        if now >= fresh_until:
+            self.stale_hits += 1
+            return True
+        if self.beta > 0 and compute_sec > 0:
+            if now - compute_sec * self.beta * math.log(1.0 - random.random()) >= fresh_until:
+                self.early_refreshes += 1
+                return True
+        return False
+    
+    def schedule(self, keys: List[str], refresh: Callable[[List[str]], Awaitable[Any]]) -> None:
+        """백그라운드 재계산 예약 (이미 재계산 중인 키는 제외, 응답은 기다리지 않음)"""
+        keys = [key for key in dict.fromkeys(keys) if key not in self._refreshing]
+        if not keys:
+            return
+        self.refreshes += len(keys)
+        task = asyncio.ensure_future(refresh(keys))
+        for key in keys:
+            self._refreshing[key] = task
+        task.add_done_callback(lambda done: self._refreshed(keys, done))
+    
+    def _refreshed(self, keys: List[str], task: asyncio.Future) -> None:
+        for key in keys:
+            self._refreshing.pop(key, None)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            # 대기열 초과 / 엔진 오류 등 -> 이전 결과를 계속 응답하고 다음 적중 때 다시 예약
+            self.refresh_errors += len(keys)
+            logger.warning(f"캐시 재계산 실패 ({len(keys)}개): {error!r}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """stale 응답 / 조기 갱신 / 재계산 카운터"""
+        return {
+            "ttl_sec": self.ttl_sec,
+            "stale_sec": self.stale_sec,
+            "jitter": self.jitter,
+            "beta": self.beta,
+            "refreshing": len(self._refreshing),
+            "stale_hits": self.stale_hits,
+            "early_refreshes": self.early_refreshes,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+        }
+
+
+async def compute_once(
+    flight: Optional[SingleFlight],
+    local: Optional[LocalCache],
+    cache: Optional[RedisCache],
+    key: str,
+    decode: Callable[[dict], Any],
+    compute: Callable[[], Awaitable[Any]]
+) -> Tuple[Any, bool]:
+    """
+    캐시 미스 계산 (flight가 있으면 같은 키의 동시 계산을 1회로 합침)
+    
+    Returns:
+        (값, 다른 워커가 계산해 캐시에서 읽었는지)
+    """
+    if flight is None:
+        return await compute(), False
+    return await flight.run(key, compute, local=local, cache=cache, decode=decode)
+
+
+async def compute_once_many(
+    flight: Optional[SingleFlight],
+    keys: List[str],
+    compute: Callable[[List[str]], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    캐시 미스 일괄 계산 (flight가 있으면 진행 중인 키는 합류하고 나머지만 계산)
+    
+    Returns:
+        {키: 값 또는 예외 객체}
+    """
+    if flight is None:
+        return await compute(keys)
+    return await flight.run_many(keys, compute)
 
 
 def make_recommend_cache_key(
@@ -74,7 +634,35 @@ def make_recommend_cache_key(
     return f"rec:{engine_version}:{audio_model}:seed:{seed_id}:k:{k}"
 
 
-def get_json(cache: Optional[RedisCache], key: str) -> Optional[dict]:
+def recommend_cache_depth(k: int, max_k: int) -> int:
+    """
+    k와 무관한 캐시 깊이
+    
+    순위 목록은 작은 k가 큰 k의 앞부분이므로 max_k개까지 한 번 계산해 캐시하고 그 이하 k는 잘라서 응답
+    (max_k보다 큰 k는 k 그대로, max_k=0이면 기존처럼 k별 캐시)
+    """
+    return max(k, max_k)
+
+
+def make_playlist_cache_key(
+    engine_version: str,
+    audio_model: str,
+    seed_ids: List[int],
+    k: int,
+    fusion: str
+) -> str:
+    """
+    플레이리스트 추천 결과 캐시 키 생성
+    
+    시드 목록은 중복 제거 + 정렬 후 해시 (입력 순서와 무관)
+    형식: rec:{engine_version}:{audio_model}:playlist:{fusion}:{seeds_hash}:n:{seed_count}:k:{k}
+    """
+    seeds = sorted(set(int(sid) for sid in seed_ids))
+    digest = hashlib.sha1(",".join(str(sid) for sid in seeds).encode()).hexdigest()[:16]
+    return f"rec:{engine_version}:{audio_model}:playlist:{fusion}:{digest}:n:{len(seeds)}:k:{k}"
+
+
+async def get_json(cache: Optional[RedisCache], key: str) -> Optional[dict]:
     """
     캐시에서 JSON 조회
     
@@ -85,20 +673,26 @@ def get_json(cache: Optional[RedisCache], key: str) -> Optional[dict]:
     Returns:
         파싱된 JSON 딕셔너리 또는 None
     """
-    if cache is None or not cache.is_connected:
+    if cache is None:
+        return None
+    return _decode(await cache.get(key))
+
+
+def _decode(data: Optional[str], decode: Optional[Callable[[dict], Any]] = None) -> Optional[Any]:
+    """직렬화된 JSON -> 딕셔너리 (decode가 있으면 그 결과, 없거나 깨진 항목은 미스로 취급)"""
+    if data is None:
         return None
     
     try:
-        data = cache._client.get(key)
-        if data:
-            return json.loads(data)
+        value = json.loads(data)
+        return decode(value) if decode is not None else value
     except Exception as e:
-        logger.warning(f"캐시 조회 실패: {e}")
+        logger.warning(f"캐시 항목 해석 실패: {e}")
     
     return None
 
 
-def set_json(
+async def set_json(
     cache: Optional[RedisCache],
     key: str,
     value: dict,
@@ -113,12 +707,293 @@ def set_json(
         value: 저장할 딕셔너리
         ttl_sec: TTL (초)
     """
-    if cache is None or not cache.is_connected:
+    if cache is None:
         return
+    await cache.set_many({key: json.dumps(value, ensure_ascii=False)}, ttl_sec)
+
+
+async def get_json_many(cache: Optional[RedisCache], keys: List[str]) -> List[Optional[dict]]:
+    """
+    캐시에서 여러 JSON 일괄 조회 (MGET 1회)
+    
+    Args:
+        cache: RedisCache 인스턴스 (None이면 전부 None)
+        keys: 캐시 키 목록
+    
+    Returns:
+        keys 순서대로 파싱된 딕셔너리 또는 None
+    """
+    if cache is None:
+        return [None] * len(keys)
+    return [_decode(data) for data in await cache.get_many(keys)]
+
+
+async def set_json_many(
+    cache: Optional[RedisCache],
+    items: Dict[str, dict],
+    ttl_sec: int
+) -> None:
+    """
+    캐시에 여러 JSON 일괄 저장 (파이프라인 SET EX, 왕복 1회)
+    
+    Args:
+        cache: RedisCache 인스턴스 (None이면 무시)
+        items: {캐시 키: 저장할 딕셔너리}
+        ttl_sec: TTL (초)
+    """
+    if cache is None:
+        return
+    await cache.set_many({key: json.dumps(value, ensure_ascii=False) for key, value in items.items()}, ttl_sec)
+
+
+def _decode_entry(
+    data: Optional[str],
+    decode: Callable[[dict], Any]
+) -> Optional[Tuple[Any, float, float]]:
+    """
+    직렬화된 JSON -> (decode 결과, soft 만료 시각, 계산 시간)
+    
+    신선도 정보가 없는 이전 형식 항목은 Redis TTL까지 신선한 것으로 취급
+    """
+    if data is None:
+        return None
     
     try:
-        data = json.dumps(value, ensure_ascii=False)
-        cache._client.setex(key, ttl_sec, data)
+        value = json.loads(data)
+        return decode(value), float(value.get("fresh_until", math.inf)), float(value.get("compute_sec", 0.0))
     except Exception as e:
-        logger.warning(f"캐시 저장 실패: {e}")
+        logger.warning(f"캐시 항목 해석 실패: {e}")
+    
+    return None
+
 
+async def get_tiered(
+    local: Optional[LocalCache],
+    cache: Optional[RedisCache],
+    key: str,
+    decode: Callable[[dict], Any]
+) -> Optional[Tuple[Any, float, float]]:
+    """
+    2단 캐시 조회 (read-through)
+    
+    1차(프로세스 내)에 있으면 네트워크 없이 반환, 없으면 Redis 조회 후 decode 결과를 1차에 채움
+    
+    Args:
+        local: LocalCache 인스턴스 (None이면 Redis만 사용)
+        cache: RedisCache 인스턴스 (None이면 1차만 사용)
+        key: 캐시 키
+        decode: Redis JSON 딕셔너리 -> 1차 캐시에 보관할 객체 (파싱 / 검증 1회)
+    
+    Returns:
+        (decode된 객체, soft 만료 시각, 계산 시간) 또는 None
+    """
+    if local is not None:
+        entry = local.get(key)
+        if entry is not None:
+            return entry
+    
+    if cache is None:
+        return None
+    data = await cache.get(key)
+    entry = _decode_entry(data, decode)
+    if entry is not None and local is not None:
+        local.set(key, entry, len(data))
+    return entry
+
+
+async def get_tiered_many(
+    local: Optional[LocalCache],
+    cache: Optional[RedisCache],
+    keys: List[str],
+    decode: Callable[[dict], Any]
+) -> List[Optional[Tuple[Any, float, float]]]:
+    """
+    2단 캐시 일괄 조회 (1차 미스 키만 MGET 1회)
+    
+    Returns:
+        keys 순서대로 (decode된 객체, soft 만료 시각, 계산 시간) 또는 None
+    """
+    results: List[Optional[Tuple[Any, float, float]]] = [None] * len(keys)
+    if local is not None:
+        for i, key in enumerate(keys):
+            results[i] = local.get(key)
+    
+    miss = [i for i, entry in enumerate(results) if entry is None]
+    if not miss or cache is None:
+        return results
+    values = await cache.get_many([keys[i] for i in miss])
+    for i, data in zip(miss, values):
+        results[i] = _decode_entry(data, decode)
+        if results[i] is not None and local is not None:
+            local.set(keys[i], results[i], len(data))
+    return results
+
+
+async def set_tiered_many(
+    local: Optional[LocalCache],
+    cache: Optional[RedisCache],
+    items: Dict[str, Tuple[Any, dict]],
+    ttl_sec: int
+) -> None:
+    """
+    2단 캐시 일괄 저장 (1차 + 파이프라인 SET EX)
+    
+    Args:
+        items: {캐시 키: (1차 캐시 객체, Redis에 저장할 딕셔너리)}
+        ttl_sec: TTL (초)
+    """
+    if not items:
+        return
+    
+    raws = {key: json.dumps(data, ensure_ascii=False) for key, (_, data) in items.items()}
+    if local is not None:
+        for key, (value, data) in items.items():
+            entry = (value, float(data.get("fresh_until", math.inf)), float(data.get("compute_sec", 0.0)))
+            local.set(key, entry, len(raws[key]), ttl_sec)
+    if cache is not None:
+        await cache.set_many(raws, ttl_sec)
+
+
+async def store_computed(
+    refresher: Optional[CacheRefresher],
+    local: Optional[LocalCache],
+    cache: Optional[RedisCache],
+    items: Dict[str, Tuple[Any, dict]],
+    compute_sec: float,
+    ttl_sec: int
+) -> None:
+    """
+    새로 계산한 항목 저장 (refresher가 있으면 신선도 정보를 붙이고 stale 구간까지 보관)
+    
+    Args:
+        items: {캐시 키: (1차 캐시 객체, Redis에 저장할 딕셔너리)} (local이 None이면 1차 객체는 사용 안 함)
+        compute_sec: 항목당 계산 시간 (초, 조기 갱신 확률에 사용)
+        ttl_sec: refresher가 없을 때 저장 TTL (초)
+    """
+    if refresher is not None:
+        items = {key: (value, refresher.stamp(data, compute_sec)) for key, (value, data) in items.items()}
+        ttl_sec = refresher.store_ttl_sec
+    await set_tiered_many(local, cache, items, ttl_sec)
+
+
+async def _stale_keys(
+    local: Optional[LocalCache],
+    cache: Optional[RedisCache],
+    keys: List[str],
+    decode: Callable[[dict], Any]
+) -> List[str]:
+    """
+    재계산 전 Redis 재확인 (1차 캐시의 stale 항목을 다른 워커가 이미 갱신했으면 1차만 교체)
+    
+    Returns:
+        Redis에도 신선한 항목이 없는 키 (재계산 대상)
+    """
+    if local is None or cache is None:
+        return keys
+    now = time.time()
+    stale = []
+    for key, data in zip(keys, await cache.get_many(keys)):
+        entry = _decode_entry(data, decode)
+        if entry is not None and entry[1] > now:
+            local.set(key, entry, len(data))
+        else:
+            stale.append(key)
+    return stale
+
+
+async def get_or_compute(
+    flight: Optional[SingleFlight],
+    refresher: Optional[CacheRefresher],
+    local: Optional[LocalCache],
+    cache: Optional[RedisCache],
+    key: str,
+    decode: Callable[[dict], Any],
+    compute: Callable[[], Awaitable[Tuple[Any, dict]]],
+    ttl_sec: int
+) -> Tuple[Any, bool]:
+    """
+    캐시 조회 -> 미스면 계산 후 저장 (추천 라우터에서 사용)
+    
+    - 적중: 바로 응답, soft 만료가 지났거나 조기 갱신 당첨이면 백그라운드 재계산 예약 (stale-while-revalidate)
+    - 미스: 같은 키의 동시 미스는 1회만 계산 (flight)
+    
+    Args:
+        flight: SingleFlight 인스턴스 (None이면 요청마다 계산)
+        refresher: CacheRefresher 인스턴스 (None이면 ttl_sec 고정 TTL)
+        local / cache / key / decode: get_tiered와 동일
+        compute: 계산 코루틴 함수 -> (1차 캐시 객체, Redis에 저장할 딕셔너리)
+        ttl_sec: refresher가 없을 때 저장 TTL (초)
+    
+    Returns:
+        (decode된 객체, 캐시에서 읽었는지)
+    """
+    async def compute_and_store() -> Any:
+        started = time.perf_counter()
+        value, data = await compute()
+        await store_computed(refresher, local, cache, {key: (value, data)}, time.perf_counter() - started, ttl_sec)
+        return value
+    
+    async def refresh(keys: List[str]) -> None:
+        if await _stale_keys(local, cache, keys, decode):
+            await compute_once(flight, local, cache, key, decode, compute_and_store)
+    
+    entry = await get_tiered(local, cache, key, decode)
+    if entry is not None:
+        value, fresh_until, compute_sec = entry
+        if refresher is not None and refresher.is_due(fresh_until, compute_sec):
+            refresher.schedule([key], refresh)
+        return value, True
+    
+    return await compute_once(flight, local, cache, key, decode, compute_and_store)
+
+
+async def get_or_compute_many(
+    flight: Optional[SingleFlight],
+    refresher: Optional[CacheRefresher],
+    local: Optional[LocalCache],
+    cache: Optional[RedisCache],
+    keys: List[str],
+    decode: Callable[[dict], Any],
+    compute: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+    ttl_sec: int
+) -> List[Tuple[Any, bool]]:
+    """
+    일괄 캐시 조회 -> 미스 키만 한 번에 계산 후 저장 (get_or_compute의 일괄 버전)
+    
+    Args:
+        compute: 키 목록 -> {키: (1차 캐시 객체, Redis에 저장할 딕셔너리) 또는 예외 객체}
+    
+    Returns:
+        keys 순서대로 (decode된 객체 또는 예외 객체, 캐시에서 읽었는지)
+    
+    Raises:
+        compute가 던진 예외 (일괄 계산 전체 실패)
+    """
+    async def compute_and_store(batch: List[str]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        outputs = await compute(batch)
+        elapsed = time.perf_counter() - started
+        items = {key: output for key, output in outputs.items() if not isinstance(output, Exception)}
+        # 키당 계산 시간 = 일괄 계산 시간 / 키 수
+        await store_computed(refresher, local, cache, items, elapsed / max(len(batch), 1), ttl_sec)
+        return {key: output if isinstance(output, Exception) else output[0] for key, output in outputs.items()}
+    
+    async def refresh(batch: List[str]) -> None:
+        batch = await _stale_keys(local, cache, batch, decode)
+        if batch:
+            await compute_once_many(flight, batch, compute_and_store)
+    
+    entries = await get_tiered_many(local, cache, keys, decode)
+    due = [
+        key for key, entry in zip(keys, entries)
+        if entry is not None and refresher is not None and refresher.is_due(entry[1], entry[2])
+    ]
+    if due:
+        refresher.schedule(due, refresh)
+    
+    miss = list(dict.fromkeys(key for key, entry in zip(keys, entries) if entry is None))
+    computed = await compute_once_many(flight, miss, compute_and_store) if miss else {}
+    return [
+        (entry[0], True) if entry is not None else (computed[key], False)
+        for key, entry in zip(keys, entries)
+    ]
@@ -4,7 +4,7 @@ VibeCurator Backend Configuration
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -28,13 +28,123 @@ class Settings(BaseSettings):
     OFFRAIL_PENALTY_GENERAL: float = Field(default=0.008, ge=0.0, description="일반 장르 불일치 페널티")
     OFFRAIL_PENALTY_SPECIAL: float = Field(default=0.03, ge=0.0, description="특수 장르 불일치 페널티")
     STAGE3_CANDIDATES: int = Field(default=200, ge=10, description="하이브리드 계산 전 후보 수")
+    BATCH_MAX_SEEDS: int = Field(default=500, ge=1, description="일괄 추천 요청당 최대 시드 수")
+    PLAYLIST_MAX_SEEDS: int = Field(default=100, ge=1, description="플레이리스트 추천 요청당 최대 시드 수")
+    
+    # ANN settings
+    ANN_MODE: Literal["exact", "ivf"] = Field(default="exact", description="유사도 검색 방식 (exact 전수 / ivf 근사)")
+    ANN_NLIST: int = Field(default=0, ge=0, description="IVF 리스트 수 (0이면 ~4*sqrt(N))")
+    ANN_NPROBE: int = Field(default=16, ge=1, description="IVF 탐색 리스트 수 (recall vs latency)")
+    ANN_CF_INDEX_PATH: str = Field(default="", description="미리 빌드한 CF IVF 인덱스 경로 (.npz)")
+    ANN_AUDIO_INDEX_PATH: str = Field(default="", description="미리 빌드한 오디오 IVF 인덱스 경로 (.npz)")
     
     # Mode settings
     DEMO_MODE: bool = Field(default=True, description="데모 모드 (실제 모델 없이 동작)")
     
+    # Startup settings
+    BACKGROUND_LOADING: bool = Field(
+        default=True,
+        description="리소스를 백그라운드에서 로드 (로드 중에도 요청 수신, /ready와 추천 API는 엔진 준비 전까지 503)"
+    )
+    LOAD_WORKERS: int = Field(default=4, ge=1, description="리소스 병렬 로드 스레드 수")
+    LOAD_PROCESSES: int = Field(
+        default=2,
+        ge=0,
+        description="메타 JSON 파싱 프로세스 수 (GIL 없이 song_meta / 오디오 메타를 동시에 파싱, 0이면 로더 스레드에서 파싱)"
+    )
+    ENGINE_BACKEND: Literal["inline", "thread", "process"] = Field(
+        default="thread",
+        description="추천 엔진 실행 방식 (inline 이벤트 루프 / thread 스레드 풀 / process 스냅샷 공유 프로세스 풀)"
+    )
+    ENGINE_WORKERS: int = Field(default=4, ge=1, description="엔진 스레드 / 프로세스 수 (워커 프로세스별)")
+    ENGINE_MAX_QUEUE: int = Field(
+        default=64,
+        ge=0,
+        description="엔진 워커가 모두 바쁠 때 기다릴 수 있는 요청 수 (넘으면 503 + Retry-After)"
+    )
+    ENGINE_TIMEOUT_SEC: float = Field(default=10.0, ge=0, description="엔진 호출 요청별 타임아웃 (초, 넘으면 504, 0이면 없음)")
+    ENGINE_DRAIN_MAX_SEC: float = Field(
+        default=300.0,
+        ge=0,
+        description="핫 리로드로 교체된 엔진 실행기가 진행 중 요청을 마치기를 기다리는 최대 시간 (초, 넘어도 대기 중 작업은 취소하지 않음)"
+    )
+    NOT_READY_RETRY_AFTER_SEC: int = Field(default=5, ge=1, description="엔진 준비 전 503 응답의 Retry-After (초)")
+    ADMIN_TOKEN: str = Field(
+        default="",
+        description="관리 API 토큰 (X-Admin-Token 헤더, 비어 있으면 /admin/* 비활성화)"
+    )
+    
     # Redis settings
     REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Redis 연결 URL")
-    CACHE_TTL_SEC: int = Field(default=900, ge=0, description="캐시 TTL (초)")
+    REDIS_MAX_CONNECTIONS: int = Field(default=32, ge=1, description="Redis 연결 풀 크기 (워커 프로세스별, 풀이 차면 빈 연결을 기다림)")
+    REDIS_TIMEOUT_SEC: float = Field(default=2.0, gt=0, description="Redis 연결 / 명령 / 풀 대기 타임아웃 (초)")
+    REDIS_RETRY_SEC: float = Field(
+        default=5.0,
+        ge=0,
+        description="Redis 명령 실패 후 재시도까지 대기 (초, 그동안은 Redis 없이 캐시 미스로 처리)"
+    )
+    CACHE_TTL_SEC: int = Field(default=900, ge=0, description="캐시 TTL (초, soft TTL: 지나면 재계산 대상)")
+    CACHE_STALE_SEC: int = Field(
+        default=300,
+        ge=0,
+        description="soft TTL이 지난 항목을 바로 응답하고 백그라운드에서 재계산하는 구간 (초, Redis TTL = CACHE_TTL_SEC + 이 값, 0이면 만료 즉시 미스)"
+    )
+    CACHE_TTL_JITTER: float = Field(
+        default=0.1,
+        ge=0,
+        le=1,
+        description="항목별 soft TTL 무작위 단축 비율 (같이 계산된 항목의 만료 분산, 0이면 고정)"
+    )
+    CACHE_EARLY_REFRESH_BETA: float = Field(
+        default=1.0,
+        ge=0,
+        description="확률적 조기 갱신 강도 (만료에 가까울수록 / 계산이 오래 걸릴수록 미리 재계산, 0이면 없음)"
+    )
+    CACHE_WARMUP_SEEDS: int = Field(
+        default=0,
+        ge=0,
+        description="시작 / 리로드 후 백그라운드로 미리 계산할 인기 시드 수 (ENGINE_VERSION 네임스페이스당 워커 1개만 실행, 0이면 비활성화)"
+    )
+    CACHE_WARMUP_SOURCE: Literal["vocab", "log", "catalog"] = Field(
+        default="vocab",
+        description="워밍업 시드 목록 (vocab Item2Vec vocab 빈도 순 / log CACHE_WARMUP_LOG_PATH 요청 수 순 / catalog 메타 순서)"
+    )
+    CACHE_WARMUP_LOG_PATH: str = Field(default="", description="워밍업 시드를 고를 트래픽 로그 (액세스 로그 / JSON Lines)")
+    CACHE_WARMUP_BATCH: int = Field(default=64, ge=1, description="워밍업 엔진 일괄 추천 1회당 시드 수")
+    CACHE_MAX_K: int = Field(
+        default=100,
+        ge=0,
+        description="추천 결과 캐시 깊이 (시드당 이 개수까지 한 번 계산해 저장, 그 이하 k는 앞부분을 잘라 응답, 0이면 k별 캐시)"
+    )
+    LOCAL_CACHE_MAX_ENTRIES: int = Field(
+        default=10000,
+        ge=0,
+        description="프로세스 내 1차 캐시 최대 항목 수 (Redis 앞단 LRU, 0이면 비활성화)"
+    )
+    LOCAL_CACHE_MAX_MB: int = Field(
+        default=64,
+        ge=0,
+        description="프로세스 내 1차 캐시 최대 크기 (MB, 직렬화 JSON 길이 기준 근사, 0이면 항목 수만 제한)"
+    )
+    LOCAL_CACHE_TTL_SEC: int = Field(
+        default=60,
+        ge=0,
+        description="프로세스 내 1차 캐시 TTL (초, CACHE_TTL_SEC 이하로 적용, 워커 간 불일치 허용 구간)"
+    )
+    SINGLE_FLIGHT: bool = Field(
+        default=True,
+        description="같은 캐시 키의 동시 미스를 프로세스 내에서 1회 계산으로 합침 (나머지 요청은 결과 공유)"
+    )
+    CACHE_LOCK_TTL_SEC: float = Field(
+        default=0.0,
+        ge=0,
+        description="워커 간 single-flight Redis 잠금 TTL (초, 엔진 호출보다 길게, 0이면 워커 간 잠금 없음)"
+    )
+    CACHE_LOCK_WAIT_SEC: float = Field(
+        default=5.0,
+        ge=0,
+        description="다른 워커가 계산 중일 때 결과를 기다리는 최대 시간 (초, 넘으면 직접 계산)"
+    )
     
     # File paths
     SONG_META_PATH: str = Field(
@@ -48,6 +158,34 @@ class Settings(BaseSettings):
     ITEM2VEC_PATH: str = Field(default="", description="Item2Vec 모델 경로")
     AUDIO_EMB_MYNA_PATH: str = Field(default="", description="Myna 오디오 임베딩 경로")
     AUDIO_EMB_CNN_PATH: str = Field(default="", description="CNN 오디오 임베딩 경로")
+    SNAPSHOT_PATH: str = Field(
+        default="",
+        description="카탈로그 스냅샷 경로 (python -m app.cli build-snapshot, 설정 시 메타/Item2Vec/오디오 임베딩을 memmap으로 로드)"
+    )
+    SHARED_SNAPSHOT_DIR: str = Field(
+        default="",
+        description="워커 간 공유 스냅샷 디렉터리 (예: /dev/shm/vibecurator, 첫 워커가 소스에서 스냅샷을 발행하고 나머지는 memmap으로 attach, SNAPSHOT_PATH가 우선)"
+    )
+    ITEM2VEC_QUANT_PATH: str = Field(
+        default="",
+        description="양자화 CF 벡터 prefix (python -m app.cli quantize, 설정 시 Word2Vec 모델 대신 mmap 로드)"
+    )
+    AUDIO_EMB_QUANT_PATH: str = Field(
+        default="",
+        description="양자화 오디오 임베딩 prefix (설정 시 .npz 대신 mmap 로드)"
+    )
+    EMB_QUANT_RESCORE: bool = Field(
+        default=True,
+        description="양자화 검색 후보를 float32 원본({prefix}.full.npy, mmap)으로 재채점"
+    )
+    CF_NEIGHBORS_PATH: str = Field(
+        default="",
+        description="사전 계산 CF 이웃 테이블 prefix ({prefix}.ids.npy / {prefix}.scores.npy, 설정 시 mmap 서빙)"
+    )
+    SEARCH_PRIOR_PATH: str = Field(
+        default="",
+        description="자동완성 인기도 prior (.npz, python -m app.cli build-search-prior, 없으면 Item2Vec vocab 빈도)"
+    )
     
     # Settings 모델이 환경변수를 어떻게 읽을지 규칙을 알려주는 설정 클래스
     class Config:
@@ -55,8 +193,8 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = True # 환경변수 이름의 대소문자를 구분
 
-# Settings 인스턴스를 돌려주는 함수 
-def get_settings() -> Settings:
+# Settings 인스턴스를 돌려주는 함수 (overrides: 핫 리로드 시 환경변수 위에 덮어쓸 값)
+def get_settings(**overrides: Any) -> Settings:
     
-    return Settings()
+    return Settings(**overrides)
 
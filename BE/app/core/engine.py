@@ -5,16 +5,20 @@ Stage3 하이브리드 추천 엔진
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Set
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 import numpy as np
 
-from .loaders import MetaRegistry, AudioBundle, SongMeta
+from .loaders import MetaRegistry, AudioBundle, SongMeta, build_catalog_columns
+from .retrieval import FUSION_MODES, ItemVectorIndex, fuse_ranked_lists
+from .ann import IVFFlatIndex
+from .neighbors import NeighborTable
 from .scoring import (
-    batch_cosine_similarity,
     minmax_normalize,
-    apply_stage1_5_reranking,
-    compute_hybrid_scores
+    GENRE_GROUP_UNK,
+    rerank_stage1_5_arrays,
+    compute_hybrid_scores_arrays
 )
 
 logger = logging.getLogger(__name__)
@@ -46,12 +50,23 @@ class RecommendationEngine:
         offrail_penalty_general: float = 0.008,
         offrail_penalty_special: float = 0.03,
         # Stage3 하이브리드 파라미터
-        stage3_candidates: int = 200  # 하이브리드 계산 전 후보 수
+        stage3_candidates: int = 200,  # 하이브리드 계산 전 후보 수
+        # 사전 계산 이웃 테이블 (있으면 Stage1을 테이블 조회로 대체)
+        neighbor_table: Optional[NeighborTable] = None,
+        # ANN 파라미터 ("exact" | "ivf")
+        ann_mode: str = "exact",
+        ann_nlist: int = 0,
+        ann_nprobe: int = 16,
+        cf_ann_index: Optional[IVFFlatIndex] = None,
+        audio_ann_index: Optional[IVFFlatIndex] = None,
+        # 미리 만든 CF 인덱스 (양자화 / 스냅샷, 있으면 Word2Vec 대신 사용)
+        cf_index: Optional[ItemVectorIndex] = None,
+        cf_vocab_size: int = 0
     ):
         """
         Args:
             meta_registry: 메타데이터 레지스트리
-            item2vec_model: Item2Vec 모델 (gensim Word2Vec)
+            item2vec_model: Item2Vec 벡터 (gensim KeyedVectors, Word2Vec 모델도 허용)
             audio_bundle: 오디오 임베딩 번들
             demo_mode: 데모 모드
             candidate_topn: CF 후보 개수 (topn_cf)
@@ -62,9 +77,17 @@ class RecommendationEngine:
             offrail_penalty_general: 일반 장르 불일치 페널티
             offrail_penalty_special: 특수 장르 불일치 페널티
             stage3_candidates: 하이브리드 계산 전 후보 수
+            neighbor_table: 사전 계산된 CF 이웃 테이블 (mmap)
+            ann_mode: 유사도 검색 방식 ("exact" 전수 검색 | "ivf" 근사 검색)
+            ann_nlist: IVF 리스트 수 (0이면 자동)
+            ann_nprobe: IVF 탐색 리스트 수 (recall vs latency)
+            cf_ann_index: 미리 빌드한 CF IVF 인덱스 (없고 ivf 모드면 시작 시 빌드)
+            audio_ann_index: 미리 빌드한 오디오 IVF 인덱스 (없고 ivf 모드면 시작 시 빌드)
+            cf_index: 미리 만든 CF 인덱스 (양자화 / 스냅샷 memmap, 설정 시 item2vec_model 벡터 대신 사용)
+            cf_vocab_size: 전체 Item2Vec vocab 크기 (cf_index가 vocab ∩ 메타만 담은 경우 표시용, 0이면 인덱스 크기)
         """
         self.meta = meta_registry
-        self.item2vec = item2vec_model
+        self.neighbor_table = neighbor_table
         self.audio = audio_bundle
         self.demo_mode = demo_mode
         self.candidate_topn = candidate_topn
@@ -81,23 +104,79 @@ class RecommendationEngine:
         self.offrail_penalty_special = offrail_penalty_special
         self.stage3_candidates = stage3_candidates
         
-        # 메타에 있는 곡 ID 집합 (빠른 조회용)
+        # ANN 설정
+        self.ann_mode = ann_mode
+        self.ann_nlist = ann_nlist
+        self.ann_nprobe = ann_nprobe
+        
+        # 컬럼형 카탈로그 (song_id -> 행, 아티스트/장르 그룹 정수 코드)
         # meta_registry는 이제 song_meta.json 기준 (meta_full)
-        self._meta_song_ids: Set[int] = set(meta_registry.song_ids)
+        self.catalog = meta_registry.catalog
+        if self.catalog is None:
+            self.catalog = build_catalog_columns(meta_registry.songs, meta_registry.song_ids)
+        
+        # CF 검색 인덱스 (L2 정규화 float32 행렬 + 정수 song_id 행)
+        # vocab ∩ 메타로 미리 잘라두어 top-N 슬롯이 메타 없는 곡에 낭비되지 않도록 함
+        self._cf_index: Optional[ItemVectorIndex] = None
+        self.cf_vocab_size = 0
+        full_index: Optional[ItemVectorIndex] = None
+        if cf_index is not None:
+            full_index = cf_index
+        elif item2vec_model is not None:
+            full_index = ItemVectorIndex.from_keyed_vectors(item2vec_model)
+        if full_index is not None:
+            self.cf_vocab_size = cf_vocab_size or len(full_index)
+            self._cf_index = full_index.restrict_to(np.asarray(meta_registry.song_ids, dtype=np.int64))
+            logger.info(
+                f"CF servable vocab: {len(self._cf_index):,} / {self.cf_vocab_size:,} "
+                f"(메타 없는 {self.cf_vocab_size - len(self._cf_index):,}곡 제외)"
+            )
         
-        # Item2Vec vocab (str 키)
-        self._vocab_set: Set[str] = set()
-        if item2vec_model is not None:
-            self._vocab_set = set(item2vec_model.wv.key_to_index.keys())
+        # CF 근사 검색 인덱스 (IVF): 저장된 인덱스 우선, 없으면 ivf 모드에서 빌드
+        meta_ids = np.asarray(meta_registry.song_ids, dtype=np.int64)
+        if cf_ann_index is not None:
+            self._cf_index = cf_ann_index.restrict_to(meta_ids)
+        elif ann_mode == "ivf" and self._cf_index is not None:
+            self._cf_index = IVFFlatIndex.build(self._cf_index, nlist=ann_nlist, nprobe=ann_nprobe)
+        
+        # 오디오 검색 인덱스: IVF는 시작 시 준비, exact는 첫 사용 시 생성
+        self._audio_index: Optional[ItemVectorIndex] = None
+        if audio_ann_index is not None:
+            self._audio_index = audio_ann_index
+        elif ann_mode == "ivf" and audio_bundle is not None:
+            self._audio_index = IVFFlatIndex.build(
+                audio_bundle.vector_index(),
+                nlist=ann_nlist,
+                nprobe=ann_nprobe
+            )
         
         logger.info(
             f"Engine 초기화: demo={demo_mode}, "
-            f"meta={len(self._meta_song_ids)}, "
-            f"vocab={len(self._vocab_set)}, "
+            f"meta={len(self.catalog)}, "
+            f"vocab={self.cf_vocab_size}, "
+            f"neighbors={'mmap' if neighbor_table is not None else 'none'}, "
+            f"ann={ann_mode}, "
             f"audio={'loaded' if audio_bundle else 'none'}, "
             f"alpha_cf={self.alpha_cf}, beta_audio={self.beta_audio}"
         )
     
+    @property
+    def cf_index(self) -> Optional[ItemVectorIndex]:
+        """CF 검색 인덱스 (vocab ∩ 메타, 없으면 None)"""
+        return self._cf_index
+    
+    @property
+    def cf_servable_size(self) -> int:
+        """CF 검색 대상 곡 수 (vocab ∩ 메타)"""
+        return len(self._cf_index) if self._cf_index is not None else 0
+    
+    def _in_cf_vocab(self, seed_id: int) -> bool:
+        """시드가 CF 후보 생성 대상인지 (이웃 테이블 또는 vocab)"""
+        if self.neighbor_table is not None:
+            return self.neighbor_table.contains(seed_id)
+        # 정수 song_id 정렬 배열 조회 (시드는 항상 메타에 있으므로 vocab ∩ 메타로 판단)
+        return self._cf_index is not None and self._cf_index.contains(seed_id)
+    
     def _get_seed_meta(self, seed_id: int) -> Optional[SongMeta]:
         """시드 곡 메타데이터 조회"""
         return self.meta.songs.get(seed_id)
@@ -108,7 +187,7 @@ class RecommendationEngine:
         seed_id를 기반으로 해시하여 항상 같은 결과 반환
         """
         # seed_id 기반 결정적 정렬
-        candidates = [sid for sid in self.meta.song_ids if sid != seed_id]
+        candidates = [int(sid) for sid in self.meta.song_ids if sid != seed_id]
         
         # 해시 기반 정렬 (결정적)
         def score_fn(sid: int) -> int:
@@ -132,91 +211,146 @@ class RecommendationEngine:
         
         return results
     
-    def _get_cf_candidates_raw(self, seed_id: int, topn: int) -> List[Dict]:
+    def _cf_search(self, seed_id: int, topn: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Item2Vec으로 CF 후보 생성 (Stage1 순수 CF)
-        메타데이터와 결합하여 반환
+        Stage1 CF 유사곡 검색
+        이웃 테이블이 있으면 유사도 계산 없이 테이블 행 슬라이스로 대체
         
         Returns:
-            [{"song_id": int, "score_cf": float, "artist_key": str, "main_genre": str, ...}, ...]
+            (song_ids, scores) 점수 내림차순 배열 쌍 (실패/vocab 없음이면 빈 배열)
         """
-        if self.item2vec is None:
-            return []
-        
-        seed_key = str(seed_id)
-        if seed_key not in self._vocab_set:
-            return []
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+        try:
+            if self.neighbor_table is not None:
+                # 사전 계산 테이블 조회 (O(1) 슬라이스)
+                return self.neighbor_table.lookup(seed_id, topn)
+            if self._cf_index is None:
+                return empty
+            # GEMV + argpartition top-N (servable 행렬이므로 여유분 없이 정확히 topn개)
+            rows, scores = self._cf_index.search_by_id(seed_id, topn)
+            return self._cf_index.song_ids[rows], scores
+        except Exception as e:
+            logger.error(f"CF 후보 생성 실패: {e}")
+            return empty
+    
+    def _cf_search_batch(self, seed_ids: List[int], topn: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        여러 시드의 Stage1 CF 검색을 한 번에 수행 (exact 인덱스는 GEMM 1회)
+        결과는 시드별 _cf_search와 동일
+        """
+        if self.neighbor_table is not None or self._cf_index is None:
+            return [self._cf_search(sid, topn) for sid in seed_ids]
+        
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+        results = [empty] * len(seed_ids)
+        positions = []
+        rows = []
+        for pos, sid in enumerate(seed_ids):
+            row = self._cf_index.row_of(sid)
+            if row >= 0:
+                positions.append(pos)
+                rows.append(row)
         
         try:
-            # most_similar 호출 (topn + 여유분)
-            similar = self.item2vec.wv.most_similar(seed_key, topn=topn + 50)
-            
-            results = []
-            for key, score in similar:
-                try:
-                    sid = int(key)
-                except ValueError:
-                    continue
-                
-                # 자기 자신 제외
-                if sid == seed_id:
-                    continue
-                
-                # 메타에 있는 곡만
-                if sid not in self._meta_song_ids:
-                    continue
-                
-                meta = self.meta.songs.get(sid)
-                if meta is None:
-                    continue
-                
-                # genre가 ", "로 join된 경우 첫 번째 장르만 사용 (re-ranking용)
-                main_genre = meta.genre.split(", ")[0] if meta.genre and ", " in meta.genre else (meta.genre or "")
-                
-                results.append({
-                    "song_id": sid,
-                    "score_cf": float(score),
-                    "song_name": meta.song_name,
-                    "artist_str": meta.artist,
-                    "main_genre": main_genre,
-                    "issue_year": meta.issue_year,
-                    "artist_key": meta.artist_key or "UNKNOWN"
-                })
-                
-                if len(results) >= topn:
-                    break
-            
+            hits = self._cf_index.search_batch(rows, topn)
+        except Exception as e:
+            logger.error(f"CF 배치 후보 생성 실패: {e}")
             return results
-            
+        
+        for pos, (cand_rows, scores) in zip(positions, hits):
+            results[pos] = (self._cf_index.song_ids[cand_rows], scores)
+        return results
+    
+    def _cf_search_multi(
+        self,
+        seed_ids: List[int],
+        topn: int,
+        fusion: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        다중 시드 Stage1 CF 검색 (시드 자신들 제외)
+        이웃 테이블 모드는 시드별 이웃 목록을 결합
+        
+        Returns:
+            (song_ids, scores) 점수 내림차순 배열 쌍
+        """
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+        try:
+            if self.neighbor_table is not None:
+                lists = [self.neighbor_table.lookup(sid, topn) for sid in seed_ids]
+                lists = [hit for hit in lists if len(hit[0])]
+                return fuse_ranked_lists(lists, fusion, topn, exclude=np.asarray(seed_ids, dtype=np.int64))
+            if self._cf_index is None:
+                return empty
+            rows = [row for row in (self._cf_index.row_of(sid) for sid in seed_ids) if row >= 0]
+            cand_rows, scores = self._cf_index.search_multi(rows, topn, fusion)
+            return self._cf_index.song_ids[cand_rows], scores
         except Exception as e:
-            logger.error(f"CF 후보 생성 실패: {e}")
-            return []
+            logger.error(f"다중 시드 CF 후보 생성 실패: {e}")
+            return empty
     
-    def _get_cf_candidates_with_rerank(self, seed_id: int, topk_final: int) -> List[Dict]:
+    def _build_cf_candidates(self, sids: np.ndarray, scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Stage1.5: CF 후보 추출 -> 아티스트 페널티 -> 장르 레일가드 -> 아티스트 하드컷
+        CF 검색 결과를 카탈로그 행으로 변환
         
         Returns:
-            re-ranking된 후보 리스트
+            (rows, scores_cf): 카탈로그 행 (int32)과 CF 점수 (float64), 검색 순서 유지
         """
-        # 1. CF 후보 추출
-        candidates = self._get_cf_candidates_raw(seed_id, self.candidate_topn)
+        rows = self.catalog.rows_of(sids)
+        # 테이블 빌드 이후 메타에서 빠진 곡은 제외
+        keep = rows >= 0
+        return rows[keep], np.asarray(scores, dtype=np.float64)[keep]
+    
+    def _get_cf_candidates_raw(self, seed_id: int, topn: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Item2Vec으로 CF 후보 생성 (Stage1 순수 CF)
         
-        if not candidates:
-            return []
+        Returns:
+            (rows, scores_cf) 카탈로그 행 / CF 점수 배열 쌍
+        """
+        sids, scores = self._cf_search(seed_id, topn)
+        return self._build_cf_candidates(sids, scores)
+    
+    def _get_cf_candidates_with_rerank(self, seed_id: int, topk_final: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stage1.5: CF 후보 추출 -> 아티스트 페널티 -> 장르 레일가드 -> 아티스트 하드컷
         
-        # 2. Seed 정보 조회
-        seed_meta = self._get_seed_meta(seed_id)
-        # genre가 ", "로 join된 경우 첫 번째 장르만 사용
-        if seed_meta and seed_meta.genre:
-            seed_main_genre = seed_meta.genre.split(", ")[0] if ", " in seed_meta.genre else seed_meta.genre
-        else:
-            seed_main_genre = "UNK"
+        Returns:
+            re-ranking된 (rows, score_final) 배열 쌍
+        """
+        # 1. CF 후보 추출
+        rows, scores_cf = self._get_cf_candidates_raw(seed_id, self.candidate_topn)
+        return self._rerank_cf_candidates(self._seed_group_code(seed_id), rows, scores_cf, topk_final)
+    
+    def _seed_group_code(self, seed_id: int) -> int:
+        """시드 곡의 메인 장르 그룹 코드 (re-ranking 기준, 메타/장르 없으면 UNK)"""
+        row = self.catalog.row_of(seed_id)
+        if row < 0:
+            return GENRE_GROUP_UNK
+        return int(self.catalog.genre_group_codes[row])
+    
+    def _rerank_cf_candidates(
+        self,
+        seed_group_code: int,
+        rows: np.ndarray,
+        scores_cf: np.ndarray,
+        topk_final: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stage1.5 re-ranking (CF 후보가 이미 있는 경우)
+        카탈로그의 아티스트 / 장르 그룹 코드 배열로 계산
         
-        # 3. Stage1.5 re-ranking 적용
-        reranked = apply_stage1_5_reranking(
-            candidates=candidates,
-            seed_main_genre=seed_main_genre,
+        Returns:
+            (rows, score_final): score_final 내림차순, 최대 topk_final개
+        """
+        if len(rows) == 0:
+            return rows, np.empty(0, dtype=np.float64)
+        
+        selected, score_final = rerank_stage1_5_arrays(
+            scores_cf,
+            self.catalog.artist_codes[rows],
+            self.catalog.genre_group_codes[rows],
+            seed_group_code=seed_group_code,
             topk_final=topk_final,
             max_per_artist_soft=self.max_per_artist_soft,
             max_per_artist_final=self.max_per_artist_final,
@@ -224,46 +358,102 @@ class RecommendationEngine:
             offrail_penalty_general=self.offrail_penalty_general,
             offrail_penalty_special=self.offrail_penalty_special
         )
-        
-        return reranked
+        return rows[selected], score_final
     
     def _compute_audio_scores(
         self,
         seed_id: int,
-        candidate_ids: List[int]
-    ) -> Dict[int, float]:
+        candidate_ids: np.ndarray
+    ) -> Optional[np.ndarray]:
         """
         오디오 임베딩 기반 유사도 점수 계산 (raw cosine similarity)
+        정규화된 임베딩 행렬에서 마스크된 행만 모아 내적 1회
         
         Returns:
-            {song_id: cosine_similarity}
+            (C,) 후보 순서 유사도 배열 (임베딩 없는 후보는 NaN),
+            오디오/시드 임베딩이 없거나 임베딩 있는 후보가 없으면 None
         """
         if self.audio is None:
-            return {}
+            return None
         
         # 시드 임베딩
-        if seed_id not in self.audio.song_id_to_idx:
-            return {}
+        seed_row = self.audio.row_of(seed_id)
+        if seed_row < 0:
+            return None
         
-        seed_idx = self.audio.song_id_to_idx[seed_id]
-        seed_emb = self.audio.embeddings[seed_idx]
+        return self._gather_audio_scores(candidate_ids, self.audio.gather(np.asarray([seed_row]))[0][:, None])
+    
+    def _compute_audio_scores_multi(
+        self,
+        seed_ids: List[int],
+        candidate_ids: np.ndarray,
+        fusion: str
+    ) -> Optional[np.ndarray]:
+        """
+        다중 시드 오디오 유사도 (오디오 임베딩이 있는 시드만 사용)
+        
+        - mean: 정규화된 시드 임베딩 평균과의 코사인 유사도
+        - max / sum: 후보 x 시드 유사도 행렬을 시드 축으로 결합
         
-        # 후보 임베딩 수집
-        valid_candidates = []
-        valid_indices = []
-        for sid in candidate_ids:
-            if sid in self.audio.song_id_to_idx:
-                valid_candidates.append(sid)
-                valid_indices.append(self.audio.song_id_to_idx[sid])
+        Returns:
+            (C,) 후보 순서 유사도 배열 (임베딩 없는 후보는 NaN) 또는 None
+        """
+        if self.audio is None:
+            return None
         
-        if not valid_candidates:
-            return {}
+        seed_rows = self.audio.rows_of(seed_ids)
+        seed_rows = seed_rows[seed_rows >= 0]
+        if len(seed_rows) == 0:
+            return None
         
-        # 배치 코사인 유사도 (raw values)
-        candidate_embs = self.audio.embeddings[valid_indices]
-        similarities = batch_cosine_similarity(seed_emb, candidate_embs)
+        seed_embs = self.audio.gather(seed_rows)
+        if fusion == "mean":
+            query = seed_embs.mean(axis=0)
+            query /= max(float(np.linalg.norm(query)), 1e-12)
+            return self._gather_audio_scores(candidate_ids, query[:, None])
         
-        return {sid: float(similarities[i]) for i, sid in enumerate(valid_candidates)}
+        return self._gather_audio_scores(candidate_ids, seed_embs.T, fusion)
+    
+    def _gather_audio_scores(
+        self,
+        candidate_ids: np.ndarray,
+        queries: np.ndarray,
+        fusion: str = "max"
+    ) -> Optional[np.ndarray]:
+        """
+        후보 중 임베딩이 있는 행만 모아 (C', D) @ (D, B) 후 시드 축 결합 (B=1이면 그대로)
+        
+        Returns:
+            (C,) 후보 순서 유사도 배열 (없는 후보는 NaN) 또는 None (임베딩 있는 후보 없음)
+        """
+        rows = self.audio.rows_of(candidate_ids)
+        valid = rows >= 0
+        if not valid.any():
+            return None
+        
+        sims = self.audio.gather(rows[valid]) @ queries  # (C', B)
+        scores = np.full(len(rows), np.nan)
+        scores[valid] = sims.max(axis=1) if fusion == "max" else sims.sum(axis=1)
+        return scores
+    
+    def _get_audio_index(self) -> Optional[ItemVectorIndex]:
+        """오디오 임베딩 검색 인덱스 (exact는 첫 호출 시 생성)"""
+        if self._audio_index is None and self.audio is not None:
+            self._audio_index = self.audio.vector_index()
+        return self._audio_index
+    
+    def audio_neighbors(self, seed_id: int, topn: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        오디오 임베딩 공간 최근접 이웃 검색 (exact 또는 IVF)
+        
+        Returns:
+            (song_ids, scores) 점수 내림차순 배열 쌍, 시드 임베딩이 없으면 빈 배열
+        """
+        index = self._get_audio_index()
+        if index is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        rows, scores = index.search_by_id(seed_id, topn)
+        return index.song_ids[rows], scores
     
     def recommend(self, seed_id: int, k: int) -> Dict[str, Any]:
         """
@@ -292,16 +482,7 @@ class RecommendationEngine:
             RuntimeError: 리소스 미로드 상태
         """
         # 시드 메타 확인
-        seed_meta = self._get_seed_meta(seed_id)
-        if seed_meta is None:
-            raise ValueError(f"Seed not found in metadata: {seed_id}")
-        
-        seed_info = {
-            "song_id": seed_id,
-            "song_name": seed_meta.song_name,
-            "artist": seed_meta.artist,
-            "genre": seed_meta.genre
-        }
+        seed_info = self._get_seed_info(seed_id)
         
         # 데모 모드
         if self.demo_mode:
@@ -318,38 +499,235 @@ class RecommendationEngine:
         
         # 1) Stage1.5: CF 후보 + re-ranking
         cf_candidates = self._get_cf_candidates_with_rerank(seed_id, self.stage3_candidates)
+        return self._recommend_from_candidates(seed_id, seed_info, cf_candidates, k)
+    
+    def recommend_batch(self, seed_ids: List[int], k: int) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        여러 시드 일괄 추천
+        
+        Stage1 유사도는 행렬-행렬 곱 한 번으로 계산하고,
+        Stage1.5/Stage3는 시드별로 수행 (시드별 결과는 recommend()와 동일)
+        
+        Args:
+            seed_ids: 시드 곡 ID 목록
+            k: 시드당 추천 개수
+        
+        Returns:
+            입력 순서대로 recommend() 결과 딕셔너리 또는 해당 시드에서 발생한 예외
+            (ValueError: 시드 없음 / RuntimeError: 리소스 문제)
+        """
+        results: List[Union[Dict[str, Any], Exception]] = [None] * len(seed_ids)
+        
+        # 시드 메타 확인
+        seed_infos: Dict[int, Dict[str, Any]] = {}
+        valid_positions = []
+        for pos, seed_id in enumerate(seed_ids):
+            try:
+                seed_infos[pos] = self._get_seed_info(seed_id)
+                valid_positions.append(pos)
+            except ValueError as e:
+                results[pos] = e
+        
+        # 데모 모드
+        if self.demo_mode:
+            for pos in valid_positions:
+                results[pos] = {
+                    "seed": seed_infos[pos],
+                    "items": self._demo_recommend(seed_ids[pos], k),
+                    "method": "demo"
+                }
+            return results
+        
+        # 1) Stage1: 전체 시드 CF 검색 일괄 수행
+        valid_ids = [seed_ids[pos] for pos in valid_positions]
+        cf_hits = self._cf_search_batch(valid_ids, self.candidate_topn)
+        
+        # 2) Stage1.5 + Stage3: 시드별
+        for pos, seed_id, (sids, scores) in zip(valid_positions, valid_ids, cf_hits):
+            try:
+                rows, scores_cf = self._build_cf_candidates(sids, scores)
+                cf_candidates = self._rerank_cf_candidates(
+                    self._seed_group_code(seed_id), rows, scores_cf, self.stage3_candidates
+                )
+                results[pos] = self._recommend_from_candidates(seed_id, seed_infos[pos], cf_candidates, k)
+            except (ValueError, RuntimeError) as e:
+                results[pos] = e
+        
+        return results
+    
+    def recommend_playlist(
+        self,
+        seed_ids: List[int],
+        k: int,
+        fusion: str = "mean"
+    ) -> Dict[str, Any]:
+        """
+        플레이리스트 이어듣기 추천 (다중 시드)
+        
+        파이프라인:
+        1. 시드들을 결합한 CF 후보 생성 (mean / max / sum, 시드 자신들 제외)
+        2. 지배적 시드 장르 기준 Stage1.5 re-ranking
+        3. 시드들을 같은 방식으로 결합한 오디오 유사도 + 하이브리드 스코어링
+        
+        시드는 중복 제거 후 정렬해서 사용 (입력 순서와 무관한 결과)
+        
+        Args:
+            seed_ids: 시드 곡 ID 목록
+            k: 추천 개수
+            fusion: "mean" | "max" | "sum"
+        
+        Returns:
+            {
+                "seeds": [...],
+                "items": [...],
+                "method": "demo" | "cf_only" | "hybrid",
+                "fusion": str
+            }
+        
+        Raises:
+            ValueError: 알 수 없는 fusion, 메타에 없는 시드, vocab에 시드가 하나도 없는 경우
+            RuntimeError: 리소스 미로드 상태
+        """
+        if fusion not in FUSION_MODES:
+            raise ValueError(f"Unknown fusion mode: {fusion}")
+        
+        seeds = sorted(set(seed_ids))
+        if not seeds:
+            raise ValueError("Empty seed list")
+        seed_infos = [self._get_seed_info(sid) for sid in seeds]
         
-        if not cf_candidates:
+        # 데모 모드: 첫 시드 기준 결정적 결과에서 시드 제외
+        if self.demo_mode:
+            seed_set = set(seeds)
+            demo_items = [
+                item for item in self._demo_recommend(seeds[0], k + len(seeds))
+                if item["song_id"] not in seed_set
+            ][:k]
+            for rank, item in enumerate(demo_items, 1):
+                item["rank"] = rank
+            return {"seeds": seed_infos, "items": demo_items, "method": "demo", "fusion": fusion}
+        
+        # 1) Stage1: 다중 시드 CF 후보
+        sids, scores = self._cf_search_multi(seeds, self.candidate_topn, fusion)
+        rows, scores_cf = self._build_cf_candidates(sids, scores)
+        
+        # 2) Stage1.5: 지배적 시드 장르 기준 re-ranking
+        cand_rows, score_final = self._rerank_cf_candidates(
+            self._dominant_seed_group(seeds), rows, scores_cf, self.stage3_candidates
+        )
+        if len(cand_rows) == 0:
+            if not any(self._in_cf_vocab(sid) for sid in seeds):
+                raise ValueError(f"No seed in Item2Vec vocabulary: {seeds}")
+            raise RuntimeError("CF candidate generation failed")
+        
+        # 3) Stage3: 다중 시드 오디오 유사도 + 하이브리드 스코어링
+        candidate_ids = self.catalog.song_ids[cand_rows]
+        audio_scores = self._compute_audio_scores_multi(seeds, candidate_ids, fusion)
+        items, method = self._score_and_rank(cand_rows, score_final, audio_scores, k)
+        
+        return {
+            "seeds": seed_infos,
+            "items": items,
+            "method": method,
+            "fusion": fusion
+        }
+    
+    def _dominant_seed_group(self, seed_ids: List[int]) -> int:
+        """
+        시드들 중 가장 많은 장르 그룹 코드 (동률이면 앞선 시드 우선)
+        장르 정보가 없으면 UNK
+        """
+        groups = [self._seed_group_code(sid) for sid in seed_ids]
+        counts = Counter(group for group in groups if group != GENRE_GROUP_UNK)
+        if not counts:
+            return GENRE_GROUP_UNK
+        return counts.most_common(1)[0][0]
+    
+    def _get_seed_info(self, seed_id: int) -> Dict[str, Any]:
+        """
+        시드 곡 정보 (응답용)
+        
+        Raises:
+            ValueError: 시드가 메타에 없는 경우
+        """
+        seed_meta = self._get_seed_meta(seed_id)
+        if seed_meta is None:
+            raise ValueError(f"Seed not found in metadata: {seed_id}")
+        
+        return {
+            "song_id": seed_id,
+            "song_name": seed_meta.song_name,
+            "artist": seed_meta.artist,
+            "genre": seed_meta.genre
+        }
+    
+    def _recommend_from_candidates(
+        self,
+        seed_id: int,
+        seed_info: Dict[str, Any],
+        cf_candidates: Tuple[np.ndarray, np.ndarray],
+        k: int
+    ) -> Dict[str, Any]:
+        """
+        Stage1.5 결과 (rows, score_final)로부터 오디오 유사도 + 하이브리드 스코어링 + Top-K 생성
+        
+        Raises:
+            ValueError: 시드가 Item2Vec vocab에 없는 경우
+            RuntimeError: CF 후보 생성 실패
+        """
+        rows, score_final = cf_candidates
+        if len(rows) == 0:
             # CF 실패 (vocab에 없음)
-            if str(seed_id) not in self._vocab_set:
+            if not self._in_cf_vocab(seed_id):
                 raise ValueError(f"Seed not in Item2Vec vocabulary: {seed_id}")
             raise RuntimeError("CF candidate generation failed")
         
         # 2) 오디오 유사도 계산 (raw cosine similarity)
-        candidate_ids = [cand["song_id"] for cand in cf_candidates]
+        candidate_ids = self.catalog.song_ids[rows]
         audio_scores = self._compute_audio_scores(seed_id, candidate_ids)
         
+        items, method = self._score_and_rank(rows, score_final, audio_scores, k)
+        return {
+            "seed": seed_info,
+            "items": items,
+            "method": method
+        }
+    
+    def _score_and_rank(
+        self,
+        rows: np.ndarray,
+        score_final: np.ndarray,
+        audio_scores: Optional[np.ndarray],
+        k: int
+    ) -> Tuple[List[Dict], str]:
+        """
+        Stage3 하이브리드 스코어링 + Top-K 응답 항목 생성
+        문자열 필드(곡명/아티스트/장르)는 최종 Top-K에 대해서만 조회
+        
+        Returns:
+            (items, method)
+        """
+        song_ids = self.catalog.song_ids[rows]
+        
         # 3) 하이브리드 스코어링
-        if audio_scores:
+        if audio_scores is not None:
             # Stage3: CF+메타(0.7) + 오디오(0.3) 결합
-            hybrid_results = compute_hybrid_scores(
-                cf_candidates=cf_candidates,
-                audio_scores=audio_scores,
+            order, hybrid_scores = compute_hybrid_scores_arrays(
+                score_final,
+                audio_scores,
                 alpha=self.alpha_cf,   # 0.7
                 beta=self.beta_audio   # 0.3
             )
             method = "hybrid"
         else:
             # 오디오 없으면 CF+메타 only (Stage1.5 결과 그대로)
-            hybrid_results = [
-                (cand["song_id"], cand.get("score_final", cand.get("score_cf", 0)))
-                for cand in cf_candidates
-            ]
+            order, hybrid_scores = np.arange(len(rows)), score_final
             method = "cf_only"
         
         # 4) Top-K 결과 생성
         items = []
-        for rank, (sid, score) in enumerate(hybrid_results[:k], 1):
+        top_ids = song_ids[order[:k]].tolist()
+        for rank, (sid, score) in enumerate(zip(top_ids, hybrid_scores[:k].tolist()), 1):
             meta = self.meta.songs.get(sid)
             if meta:
                 items.append({
@@ -361,8 +739,4 @@ class RecommendationEngine:
                     "score": round(score, 6)
                 })
         
-        return {
-            "seed": seed_info,
-            "items": items,
-            "method": method
-        }
+        return items, method
@@ -0,0 +1,208 @@
+"""
+VibeCurator Engine Executor
+추천 엔진 실행 백엔드 (이벤트 루프 밖에서 CPU 연산)
+
+- inline: 이벤트 루프에서 바로 실행 (이전 방식)
+- thread: 크기 제한 스레드 풀 (numpy 행렬 연산 / BLAS가 GIL을 놓는 동안 다른 요청 처리)
+- process: spawn 프로세스 풀, 각 워커가 카탈로그 스냅샷을 memmap으로 열어 엔진 생성 (벡터 / 메타 페이지를 부모와 공유)
+
+대기열(실행 중 + 대기) 한도를 넘으면 EngineBusyError, 요청별 타임아웃을 넘으면 EngineTimeoutError
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+ENGINE_BACKENDS = ("inline", "thread", "process")
+
+# process 백엔드 워커의 엔진 / 시작 배리어 (워커 프로세스마다 1개)
+_worker_engine: Optional[Any] = None
+_worker_barrier: Optional[Any] = None
+
+# start()에서 먼저 준비된 워커가 나머지 워커의 엔진 생성을 기다리는 최대 시간 (초)
+_START_BARRIER_TIMEOUT_SEC = 600.0
+
+
+class EngineBusyError(Exception):
+    """대기열이 가득 차 요청을 받지 않음 (503 + Retry-After)"""
+
+
+class EngineTimeoutError(Exception):
+    """요청별 타임아웃 초과 (504, 이미 실행 중인 연산은 끝까지 진행)"""
+
+
+def _init_worker(settings: Dict[str, Any], barrier: Any) -> None:
+    """process 백엔드 워커 초기화: 스냅샷 memmap으로 서빙 엔진 생성"""
+    global _worker_engine, _worker_barrier
+    from .config import Settings
+    from .startup import build_worker_engine
+
+    _worker_barrier = barrier
+    _worker_engine = build_worker_engine(Settings(**settings))
+
+
+def _call_worker(method: str, kwargs: Dict[str, Any]) -> Any:
+    if _worker_engine is None:
+        raise RuntimeError("Engine worker not initialized")
+    return getattr(_worker_engine, method)(**kwargs)
+
+
+def _worker_ready() -> int:
+    """
+    워커 준비 확인 (start()에서 워커 수만큼 제출)
+
+    모든 워커가 도착할 때까지 배리어에서 대기하므로 호출 1개가 워커 1개를 점유
+    -> 먼저 뜬 워커가 여러 호출을 처리할 수 없고, 워커 수만큼의 호출이 서로 다른 워커에서 실행됨
+    """
+    if _worker_engine is None:
+        raise RuntimeError("Engine worker not initialized")
+    if _worker_barrier is not None:
+        _worker_barrier.wait(_START_BARRIER_TIMEOUT_SEC)
+    return os.getpid()
+
+
+class EngineExecutor:
+    """
+    추천 엔진 호출 실행기 (세대마다 1개, 엔진과 함께 교체)
+
+    대기열 카운터는 이벤트 루프에서만 갱신하고, 슬롯은 워커의 연산이 실제로 끝날 때 반환
+    (타임아웃으로 응답을 먼저 돌려줘도 실행 중인 연산이 끝날 때까지 자리를 차지)
+    """
+
+    def __init__(
+        self,
+        backend: str = "thread",
+        workers: int = 4,
+        max_queue: int = 64,
+        timeout_sec: float = 0.0,
+        settings: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            backend: "inline" | "thread" | "process"
+            workers: 스레드 / 프로세스 수
+            max_queue: 워커가 모두 바쁠 때 기다릴 수 있는 요청 수
+            timeout_sec: 요청별 타임아웃 (초, 0이면 없음)
+            settings: process 백엔드 워커가 엔진을 만들 설정 (SNAPSHOT_PATH 필요)
+        """
+        if backend not in ENGINE_BACKENDS:
+            raise ValueError(f"Unknown engine backend: {backend}")
+        self.backend = backend
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout_sec = timeout_sec
+        self._pool: Optional[Executor] = None
+        if backend == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="engine")
+        elif backend == "process":
+            context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(settings or {}, context.Barrier(workers))
+            )
+        self.pending = 0
+        self.max_pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    async def start(self) -> bool:
+        """
+        process 백엔드 워커를 모두 띄우고 엔진 생성까지 대기 (첫 요청이 워커 초기화를 기다리지 않게)
+
+        준비 확인 호출이 배리어에서 서로를 기다리므로 workers개 모두가 서로 다른 워커에서 실행될 때만 완료
+        """
+        if self.backend != "process":
+            return True
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(*(loop.run_in_executor(self._pool, _worker_ready) for _ in range(self.workers)))
+        return len(set(pids)) == self.workers
+
+    def _release(self, _: Future) -> None:
+        self.pending -= 1
+        self.completed += 1
+
+    async def run(self, engine: Any, method: str, **kwargs: Any) -> Any:
+        """
+        engine.<method>(**kwargs) 실행 (process 백엔드는 워커의 같은 세대 엔진에서 실행)
+
+        Raises:
+            EngineBusyError: 대기열 한도 초과
+            EngineTimeoutError: timeout_sec 초과
+            엔진 메서드가 던진 예외 (ValueError / RuntimeError 등)
+        """
+        if self._pool is None:
+            return getattr(engine, method)(**kwargs)
+        if self.pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise EngineBusyError(f"Engine queue full ({self.pending} pending)")
+
+        if self.backend == "thread":
+            future = self._pool.submit(lambda: getattr(engine, method)(**kwargs))
+        else:
+            future = self._pool.submit(_call_worker, method, kwargs)
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+        future.add_done_callback(lambda done: _call_soon(loop, self._release, done))
+
+        try:
+            if self.timeout_sec > 0:
+                # 시간 초과 시 아직 시작 전이면 취소되어 바로 자리 반환
+                return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout_sec)
+            return await asyncio.wrap_future(future)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise EngineTimeoutError(f"Engine call timed out after {self.timeout_sec:g}s")
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 / 처리 카운터"""
+        return {
+            "backend": self.backend,
+            "workers": self.workers if self._pool is not None else 0,
+            "max_queue": self.max_queue,
+            "timeout_sec": self.timeout_sec,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
+
+    async def drain(self, max_wait_sec: float, poll_sec: float = 0.05) -> bool:
+        """
+        실행 중 + 대기 요청이 모두 끝날 때까지 대기 (교체된 세대를 닫기 전, 최대 max_wait_sec)
+
+        Returns:
+            대기열이 비었는지 (False면 max_wait_sec 초과)
+        """
+        deadline = time.monotonic() + max_wait_sec
+        while self.pending > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(poll_sec)
+        return self.pending == 0
+
+    def shutdown(self, cancel_futures: bool = True) -> None:
+        """
+        풀 종료 (실행 중 작업은 끝까지 진행)
+
+        Args:
+            cancel_futures: 대기 중 작업 취소 (앱 종료 시), False면 대기 중 작업도 실행 후 종료 (교체된 세대)
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=cancel_futures)
+
+
+def _call_soon(loop: asyncio.AbstractEventLoop, callback: Any, *args: Any) -> None:
+    """워커 스레드의 완료 콜백 -> 이벤트 루프 (루프가 이미 닫혔으면 무시)"""
+    try:
+        loop.call_soon_threadsafe(callback, *args)
+    except RuntimeError:
+        pass
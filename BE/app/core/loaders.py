@@ -5,12 +5,19 @@ VibeCurator Data Loaders
 
 import json
 import logging
+import re
+from array import array
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Callable, Dict, Iterator, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass
 
 import numpy as np
 
+from .scoring import GenreGroupEncoder
+from .retrieval import ItemVectorIndex, l2_normalize_rows
+from .quantization import QuantizedMatrix, QuantizedVectorIndex, load_quantized
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,21 +32,212 @@ class SongMeta:
     artist_key: Optional[str] = None  # artist_id_basket[0] 또는 "UNKNOWN"
 
 
+@dataclass
+class CatalogColumns:
+    """
+    컬럼형 카탈로그 (로드 시 1회 계산)
+    
+    행 번호 = MetaRegistry.song_ids 순서, 문자열 필드는 정수 코드로 인턴
+    요청 경로(Stage1.5 등)는 정수 배열만 사용하고 문자열은 최종 응답 생성 시에만 조회
+    """
+    song_ids: np.ndarray           # (N,) int64, 행 -> song_id
+    artist_codes: np.ndarray       # (N,) int32, artist_keys 인덱스
+    main_genre_codes: np.ndarray   # (N,) int32, main_genres 인덱스
+    genre_group_codes: np.ndarray  # (N,) int32, genre_groups 인덱스 (0=UNK, 1~4=특수 그룹)
+    issue_years: np.ndarray        # (N,) int16, 없으면 0
+    artist_keys: List[str]
+    main_genres: List[str]
+    genre_groups: List[str]
+    sorted_ids: np.ndarray         # song_id 오름차순 (searchsorted 조회용)
+    sorted_rows: np.ndarray        # sorted_ids 위치 -> 행 (int32)
+    
+    def __len__(self) -> int:
+        return int(self.song_ids.shape[0])
+    
+    def rows_of(self, song_ids: np.ndarray) -> np.ndarray:
+        """song_id 배열 -> 행 번호 배열 (int32, 없으면 -1)"""
+        return _lookup_rows(self.sorted_ids, self.sorted_rows, song_ids)
+    
+    def row_of(self, song_id: int) -> int:
+        """song_id의 행 번호 (없으면 -1)"""
+        return int(self.rows_of(np.asarray([song_id]))[0])
+
+
 @dataclass
 class MetaRegistry:
-    """메타데이터 레지스트리"""
-    songs: Dict[int, SongMeta]
-    song_ids: List[int]
-    search_index: List[Tuple[int, str]]  # (song_id, normalized_text)
+    """
+    메타데이터 레지스트리
+    
+    JSON 스트리밍 로더 / 스냅샷은 songs, search_index를 컬럼 기반 지연 뷰로 채움
+    (ColumnarSongs / ColumnarSearchIndex, song_ids는 int64 배열)
+    """
+    songs: Mapping[int, SongMeta]
+    song_ids: Union[List[int], np.ndarray]
+    search_index: Sequence[Tuple[int, str]]  # (song_id, normalized_text)
+    catalog: Optional[CatalogColumns] = None
+    search: Optional[Any] = None  # SongSearchIndex (core.search, 서빙 메타 로드 시 생성)
+    autocomplete: Optional[Any] = None  # AutocompleteIndex (core.autocomplete, 엔진 생성과 함께 생성)
 
 
 @dataclass
 class AudioBundle:
-    """오디오 임베딩 번들"""
-    song_ids: np.ndarray
-    embeddings: np.ndarray
-    song_id_to_idx: Dict[int, int]
+    """
+    오디오 임베딩 번들
+    
+    embeddings는 로드 시 1회 L2 정규화 (코사인 유사도 = 내적)
+    양자화 모드에서는 QuantizedMatrix (+ 재채점용 float32 원본 mmap)
+    song_id -> 행 조회는 정렬 배열 + searchsorted
+    """
+    song_ids: np.ndarray     # (N,) int64
+    embeddings: Union[np.ndarray, QuantizedMatrix]  # (N, D) float32 L2 정규화 또는 양자화 행렬
     model_type: str  # "myna" or "cnn"
+    sorted_ids: np.ndarray   # song_id 오름차순
+    sorted_rows: np.ndarray  # sorted_ids 위치 -> 행 (int32)
+    full_embeddings: Optional[np.ndarray] = None  # 양자화 모드 재채점용 float32 원본
+    
+    def __len__(self) -> int:
+        return int(self.song_ids.shape[0])
+    
+    def rows_of(self, song_ids: np.ndarray) -> np.ndarray:
+        """song_id 배열 -> 임베딩 행 번호 배열 (int32, 없으면 -1)"""
+        return _lookup_rows(self.sorted_ids, self.sorted_rows, song_ids)
+    
+    def row_of(self, song_id: int) -> int:
+        """song_id의 임베딩 행 번호 (없으면 -1)"""
+        return int(self.rows_of(np.asarray([song_id]))[0])
+    
+    def gather(self, rows: np.ndarray) -> np.ndarray:
+        """행 임베딩 gather (float32, 양자화 모드는 원본이 있으면 원본, 없으면 복원값)"""
+        if isinstance(self.embeddings, QuantizedMatrix):
+            if self.full_embeddings is not None:
+                return np.asarray(self.full_embeddings[rows], dtype=np.float32)
+            return self.embeddings.rows(rows)
+        return self.embeddings[rows]
+    
+    def vector_index(self) -> ItemVectorIndex:
+        """오디오 임베딩 공간 검색 인덱스"""
+        if isinstance(self.embeddings, QuantizedMatrix):
+            return QuantizedVectorIndex(self.song_ids, self.embeddings, self.full_embeddings)
+        return ItemVectorIndex(self.song_ids, self.embeddings, normalized=True)
+
+
+def _sorted_lookup(song_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """song_id 배열 -> (오름차순 song_id, 해당 행 번호 int32) 조회 테이블"""
+    order = np.argsort(song_ids, kind="stable")
+    return song_ids[order], order.astype(np.int32)
+
+
+def _lookup_rows(sorted_ids: np.ndarray, sorted_rows: np.ndarray, song_ids: np.ndarray) -> np.ndarray:
+    """정렬 조회 테이블에서 song_id 배열의 행 번호 검색 (int32, 없으면 -1)"""
+    song_ids = np.asarray(song_ids, dtype=np.int64)
+    if len(sorted_ids) == 0:
+        return np.full(song_ids.shape, -1, dtype=np.int32)
+    pos = np.minimum(np.searchsorted(sorted_ids, song_ids), len(sorted_ids) - 1)
+    return np.where(sorted_ids[pos] == song_ids, sorted_rows[pos], -1).astype(np.int32)
+
+
+class StringColumn(Sequence):
+    """아레나 기반 문자열 컬럼 (offsets (M+1,) int64 + utf-8 바이트, 인덱스 조회 시 디코드)"""
+    
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self._offsets = offsets
+        self._data = data
+    
+    def __len__(self) -> int:
+        return int(self._offsets.shape[0]) - 1
+    
+    def __getitem__(self, i: int) -> str:
+        start, end = int(self._offsets[i]), int(self._offsets[i + 1])
+        return bytes(self._data[start:end]).decode("utf-8")
+    
+    def __iter__(self) -> Iterator[str]:
+        data = memoryview(self._data)
+        offsets = self._offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield str(data[start:end], "utf-8")
+    
+    @property
+    def nbytes(self) -> int:
+        return int(self._offsets.nbytes + self._data.nbytes)
+    
+    def take(self, rows: np.ndarray) -> "StringColumn":
+        """행 부분집합 컬럼 (새 아레나로 복사)"""
+        starts = self._offsets[rows]
+        lengths = self._offsets[rows + 1] - starts
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        src = np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1], dtype=np.int64)
+        return StringColumn(offsets, np.asarray(self._data)[src])
+
+
+class StringColumnBuilder:
+    """StringColumn 증분 빌더 (bytearray + int64 offsets, 문자열 객체를 보관하지 않음)"""
+    
+    def __init__(self):
+        self._data = bytearray()
+        self._offsets = array("q", [0])
+    
+    def append(self, value: str) -> None:
+        self._data += value.encode("utf-8")
+        self._offsets.append(len(self._data))
+    
+    def build(self) -> StringColumn:
+        return StringColumn(np.frombuffer(self._offsets, dtype=np.int64), np.frombuffer(self._data, dtype=np.uint8))
+
+
+class ColumnarSongs(Mapping):
+    """song_id -> SongMeta 지연 매핑 (조회 시 카탈로그 + 문자열 아레나에서 생성)"""
+    
+    def __init__(self, catalog: CatalogColumns, strings: Dict[str, StringColumn]):
+        self._catalog = catalog
+        self._strings = strings
+    
+    def __len__(self) -> int:
+        return len(self._catalog)
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._catalog.song_ids.tolist())
+    
+    def __getitem__(self, song_id: int) -> SongMeta:
+        row = self._catalog.row_of(song_id) if isinstance(song_id, (int, np.integer)) else -1
+        if row < 0:
+            raise KeyError(song_id)
+        year = int(self._catalog.issue_years[row])
+        return SongMeta(
+            song_id=int(song_id),
+            song_name=self._strings["song_name"][row],
+            artist=self._strings["artist"][row],
+            genre=self._strings["genre"][row],
+            issue_year=year or None,
+            artist_key=self._catalog.artist_keys[int(self._catalog.artist_codes[row])]
+        )
+
+
+class ColumnarSearchIndex(Sequence):
+    """
+    (song_id, normalized_text) 지연 시퀀스 (MetaRegistry.search_index)
+    
+    song_name + artist를 조회 시 정규화 (검색 API는 core.search.SongSearchIndex 사용)
+    """
+    
+    def __init__(self, song_ids: np.ndarray, strings: Dict[str, StringColumn]):
+        self._song_ids = song_ids
+        self._strings = strings
+    
+    def __len__(self) -> int:
+        return int(self._song_ids.shape[0])
+    
+    def __getitem__(self, row: int) -> Tuple[int, str]:
+        text = _normalize_text(f"{self._strings['song_name'][row]} {self._strings['artist'][row]}")
+        return int(self._song_ids[row]), text
+    
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        texts = (_normalize_text(f"{name} {artist}") for name, artist in self.fields())
+        return zip(self._song_ids.tolist(), texts)
+    
+    def fields(self) -> Iterator[Tuple[str, str]]:
+        """행별 (song_name, artist)"""
+        return zip(self._strings["song_name"], self._strings["artist"])
 
 
 def _normalize_text(text: str) -> str:
@@ -47,17 +245,82 @@ def _normalize_text(text: str) -> str:
     return text.lower().strip()
 
 
-def _extract_field(item: Dict, candidates: List[str], default: str = "") -> str:
-    """여러 후보 키에서 필드 추출"""
-    for key in candidates:
+_MISSING = object()
+
+
+def _first_present(item: Dict, keys: Tuple[str, ...], default: Any = None) -> Any:
+    """키 목록 중 레코드에 있는 첫 키의 값"""
+    for key in keys:
         if key in item:
-            val = item[key]
-            if isinstance(val, list):
-                return ", ".join(str(v) for v in val)
-            return str(val) if val else default
+            return item[key]
     return default
 
 
+def _first_truthy(item: Dict, keys: Tuple[str, ...]) -> Any:
+    """키 목록 중 값이 비어있지 않은 첫 값 (없으면 None)"""
+    for key in keys:
+        val = item.get(key)
+        if val:
+            return val
+    return None
+
+
+def _format_text(val: Any, default: str = "") -> str:
+    """필드 값 -> 문자열 (리스트는 ", "로 join)"""
+    if isinstance(val, list):
+        return ", ".join(str(v) for v in val)
+    return str(val) if val else default
+
+
+def main_genre_of(genre: Optional[str]) -> str:
+    """genre가 ", "로 join된 경우 첫 번째 장르 코드 (re-ranking 기준)"""
+    return genre.split(", ")[0] if genre else ""
+
+
+def build_catalog_columns(songs: Dict[int, SongMeta], song_ids: List[int]) -> CatalogColumns:
+    """
+    SongMeta 딕셔너리 -> 컬럼형 카탈로그
+    
+    Args:
+        songs: song_id -> SongMeta
+        song_ids: 행 순서 song_id 리스트
+    """
+    n = len(song_ids)
+    artist_codes = np.empty(n, dtype=np.int32)
+    main_genre_codes = np.empty(n, dtype=np.int32)
+    genre_group_codes = np.empty(n, dtype=np.int32)
+    issue_years = np.zeros(n, dtype=np.int16)
+    
+    artist_index: Dict[str, int] = {}
+    genre_index: Dict[str, int] = {}
+    genre_groups = GenreGroupEncoder()
+    
+    for row, sid in enumerate(song_ids):
+        meta = songs[sid]
+        artist_codes[row] = artist_index.setdefault(meta.artist_key or "UNKNOWN", len(artist_index))
+        main_genre = main_genre_of(meta.genre)
+        main_genre_codes[row] = genre_index.setdefault(main_genre, len(genre_index))
+        genre_group_codes[row] = genre_groups.encode_genre(main_genre)
+        if meta.issue_year:
+            issue_years[row] = meta.issue_year
+    
+    ids = np.asarray(song_ids, dtype=np.int64)
+    sorted_ids, sorted_rows = _sorted_lookup(ids)
+    
+    return CatalogColumns(
+        song_ids=ids,
+        artist_codes=artist_codes,
+        main_genre_codes=main_genre_codes,
+        genre_group_codes=genre_group_codes,
+        issue_years=issue_years,
+        artist_keys=list(artist_index),
+        main_genres=list(genre_index),
+        genre_groups=genre_groups.groups,
+        sorted_ids=sorted_ids,
+        sorted_rows=sorted_rows
+    )
+
+
 def _parse_year(value: Any) -> Optional[int]:
     """연도 파싱"""
     if value is None:
@@ -71,297 +334,483 @@ def _parse_year(value: Any) -> Optional[int]:
     return None
 
 
-def load_song_meta_melon(path: str, demo_mode: bool) -> MetaRegistry:
+JSON_STREAM_CHUNK_CHARS = 1 << 20
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+
+
+class _JsonStream:
+    """청크 단위로 읽으며 JSON 값을 하나씩 디코드하는 리더 (소비한 앞부분은 버림)"""
+    
+    def __init__(self, f, chunk_chars: int):
+        self._f = f
+        self._chunk_chars = chunk_chars
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+    
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_chars)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (EOF면 "")"""
+        while True:
+            self._pos = _JSON_WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+    
+    def expect(self, chars: str) -> str:
+        """다음 문자가 chars 중 하나인지 확인하고 소비"""
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"JSON 구문 오류: {chars!r} 기대, {ch!r} 발견")
+        self._pos += 1
+        return ch
+    
+    def value(self) -> Any:
+        """다음 JSON 값 하나 디코드 (청크 경계에 걸치면 이어 읽고 재시도)"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+                # 숫자 / 리터럴은 청크 끝에서 잘려도 디코드되므로 뒤에 문자가 있어야 확정
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+
+def iter_json_items(path: str, chunk_chars: int = JSON_STREAM_CHUNK_CHARS) -> Iterator[Any]:
     """
-    Melon song_meta.json 로드 (CF 후보 필터링용)
+    JSON 문서의 레코드를 하나씩 스트리밍 파싱
     
-    Args:
-        path: JSON 파일 경로
-        demo_mode: 데모 모드 여부 (파일 없으면 더미 생성)
+    최상위 배열은 원소, 최상위 객체는 값(dict of dict)을 순서대로 반환
+    상주 메모리는 청크 하나 + 레코드 하나 (문서 전체 리스트를 만들지 않음)
+    최상위 객체의 첫 값이 dict가 아니면 단일 레코드로 보고 객체 전체를 반환
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        stream = _JsonStream(f, chunk_chars)
+        head = stream.peek()
+        if head == "[":
+            stream.expect("[")
+            if stream.peek() == "]":
+                return
+            while True:
+                yield stream.value()
+                if stream.expect(",]") == "]":
+                    return
+        elif head == "{":
+            stream.expect("{")
+            if stream.peek() == "}":
+                return
+            first = True
+            while True:
+                stream.value()  # key
+                stream.expect(":")
+                val = stream.value()
+                if first and not isinstance(val, dict):
+                    f.seek(0)
+                    yield json.load(f)
+                    return
+                first = False
+                yield val
+                if stream.expect(",}") == "}":
+                    return
+        elif head:
+            yield stream.value()
+
+
+def _iter_json_items_full(path: str) -> Iterator[Any]:
+    """json.load로 문서 전체를 읽은 뒤 레코드 반환 (이전 방식)"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
     
-    Returns:
-        MetaRegistry: 메타데이터 레지스트리
+    # 구조 파악: 리스트 또는 딕셔너리
+    if isinstance(data, list):
+        return iter(data)
+    if isinstance(data, dict):
+        # 딕셔너리인 경우 values 사용
+        if all(isinstance(v, dict) for v in data.values()):
+            return iter(list(data.values()))
+        # 단일 객체인 경우
+        return iter([data])
+    return iter([])
+
+
+@dataclass(frozen=True)
+class _MetaSchema:
+    """
+    메타 JSON 필드 -> 키 매핑 (레코드마다 후보 키를 탐색하지 않도록 미리 확정)
+    
+    필드별 후보 키 중 첫 레코드에 실제로 있는 키만 우선순위 순으로 보관
+    """
+    song_id: Tuple[str, ...]
+    song_name: Tuple[str, ...]
+    artist_basket: Tuple[str, ...]
+    artist: Tuple[str, ...]
+    genre: Tuple[str, ...]
+    genre_fallback: Tuple[str, ...]
+    issue_year: Tuple[str, ...]
+    artist_id: Tuple[str, ...]
+    
+    @classmethod
+    def resolve(cls, item: Dict, candidates: Dict[str, Tuple[str, ...]]) -> "_MetaSchema":
+        return cls(**{field: tuple(k for k in keys if k in item) for field, keys in candidates.items()})
+
+
+# 필드별 후보 키 (우선순위 순)
+_SONG_NAME_KEYS = ("song_name", "title", "name", "track_name")
+
+_MELON_FIELDS = {
+    "song_id": ("id", "song_id", "sid"),
+    "song_name": _SONG_NAME_KEYS,
+    "artist_basket": ("artist_name_basket",),
+    "artist": ("artist", "artist_name", "artists"),
+    "genre": ("song_gn_gnr_basket", "song_gn_dtl_gnr_basket"),
+    "genre_fallback": ("genre", "genres"),
+    "issue_year": ("issue_date", "issue_year"),
+    "artist_id": ("artist_id_basket",),
+}
+
+_AUDIO_FIELDS = {
+    "song_id": ("song_id", "id", "sid"),
+    "song_name": _SONG_NAME_KEYS,
+    "artist_basket": (),
+    "artist": ("artist", "artist_name", "artist_name_basket", "artists"),
+    "genre": ("song_gn_gnr_basket", "genre", "genres"),
+    "genre_fallback": (),
+    "issue_year": ("issue_year", "issue_date", "year"),
+    "artist_id": ("artist_id_basket",),
+}
+
+# (song_id, song_name, artist, genre, issue_year, artist_key)
+MetaRecord = Tuple[int, str, str, str, Optional[int], str]
+
+
+def _parse_melon_record(item: Dict, schema: _MetaSchema) -> Optional[MetaRecord]:
+    """Melon song_meta 레코드 -> MetaRecord (song_id 없으면 None)"""
+    # song_id 추출 (id 또는 song_id)
+    sid_raw = _first_truthy(item, schema.song_id)
+    if sid_raw is None:
+        return None
+    try:
+        sid = int(sid_raw)
+    except (ValueError, TypeError):
+        return None
+    
+    song_name = _format_text(_first_present(item, schema.song_name), default="Unknown")
+    
+    # artist 추출 (artist_name_basket 처리)
+    artist_list = _first_present(item, schema.artist_basket, default=_MISSING)
+    if artist_list is _MISSING:
+        artist = _format_text(_first_present(item, schema.artist), default="Unknown")
+    elif isinstance(artist_list, list):
+        artist = ", ".join(str(a) for a in artist_list if a)
+    else:
+        artist = str(artist_list) if artist_list else ""
+    
+    # genre 추출 (song_gn_gnr_basket 또는 song_gn_dtl_gnr_basket)
+    genre_raw = _first_truthy(item, schema.genre)
+    if not genre_raw:
+        genre = _format_text(_first_present(item, schema.genre_fallback), default="")
+    elif isinstance(genre_raw, list):
+        genre = ", ".join(str(g) for g in genre_raw if g)
+    else:
+        genre = str(genre_raw)
+    
+    # issue_year 추출 (issue_date에서 YYYYMMDD 파싱)
+    issue_date = _first_truthy(item, schema.issue_year)
+    issue_year = _parse_year(issue_date) if issue_date else None
+    
+    # artist_key 추출 (artist_id_basket[0])
+    artist_key = "UNKNOWN"
+    artist_id_basket = _first_present(item, schema.artist_id)
+    if isinstance(artist_id_basket, list) and len(artist_id_basket) > 0:
+        artist_key = str(artist_id_basket[0])
+    elif artist_id_basket:
+        artist_key = str(artist_id_basket)
+    
+    return sid, song_name, artist, genre, issue_year, artist_key
+
+
+def _parse_audio_record(item: Dict, schema: _MetaSchema) -> Optional[MetaRecord]:
+    """오디오 메타 레코드 -> MetaRecord (song_id 없으면 None)"""
+    sid_raw = _format_text(_first_present(item, schema.song_id))
+    if not sid_raw:
+        return None
+    try:
+        sid = int(sid_raw)
+    except ValueError:
+        return None
+    
+    song_name = _format_text(_first_present(item, schema.song_name), default="Unknown")
+    artist = _format_text(_first_present(item, schema.artist), default="Unknown")
+    
+    # main_genre 추출 (첫 번째 장르 코드)
+    genre_raw = _first_truthy(item, schema.genre)
+    if isinstance(genre_raw, list) and len(genre_raw) > 0:
+        genre = str(genre_raw[0])
+    elif isinstance(genre_raw, str):
+        genre = genre_raw
+    else:
+        genre = ""
+    
+    # artist_key 추출 (첫 번째 아티스트 ID)
+    artist_id_basket = _first_present(item, schema.artist_id)
+    if isinstance(artist_id_basket, list) and len(artist_id_basket) > 0:
+        artist_key = str(artist_id_basket[0])
+    else:
+        artist_key = "UNKNOWN"
+    
+    issue_year = _parse_year(_first_truthy(item, schema.issue_year))
+    
+    return sid, song_name, artist, genre, issue_year, artist_key
+
+
+class _MetaColumnsBuilder:
     """
-    songs: Dict[int, SongMeta] = {}
-    song_ids: List[int] = []
-    search_index: List[Tuple[int, str]] = []
+    MetaRecord -> 컬럼형 메타 증분 적재
+    
+    SongMeta / 검색 튜플을 만들지 않고 정수 배열 + 문자열 아레나에 바로 기록
+    중복 song_id는 build()에서 첫 행만 남김
+    """
+    
+    def __init__(self):
+        self.song_ids = array("q")
+        self.artist_codes = array("i")
+        self.main_genre_codes = array("i")
+        self.genre_group_codes = array("i")
+        self.issue_years = array("h")
+        self._artist_index: Dict[str, int] = {}
+        self._genre_index: Dict[str, int] = {}
+        self._genre_groups = GenreGroupEncoder()
+        self._strings = {name: StringColumnBuilder() for name in ("song_name", "artist", "genre")}
+    
+    def add(
+        self,
+        sid: int,
+        song_name: str,
+        artist: str,
+        genre: str,
+        issue_year: Optional[int],
+        artist_key: str
+    ) -> None:
+        self.song_ids.append(sid)
+        self.artist_codes.append(self._artist_index.setdefault(artist_key or "UNKNOWN", len(self._artist_index)))
+        main_genre = main_genre_of(genre)
+        self.main_genre_codes.append(self._genre_index.setdefault(main_genre, len(self._genre_index)))
+        self.genre_group_codes.append(self._genre_groups.encode_genre(main_genre))
+        self.issue_years.append(issue_year or 0)
+        strings = self._strings
+        strings["song_name"].append(song_name)
+        strings["artist"].append(artist)
+        strings["genre"].append(genre or "")
+    
+    def build(self) -> MetaRegistry:
+        ids = np.frombuffer(self.song_ids, dtype=np.int64)
+        columns = {
+            "artist_codes": np.frombuffer(self.artist_codes, dtype=np.int32),
+            "main_genre_codes": np.frombuffer(self.main_genre_codes, dtype=np.int32),
+            "genre_group_codes": np.frombuffer(self.genre_group_codes, dtype=np.int32),
+            "issue_years": np.frombuffer(self.issue_years, dtype=np.int16),
+        }
+        strings = {name: builder.build() for name, builder in self._strings.items()}
+        
+        # 중복 song_id 스킵 (stable 정렬이므로 같은 id 중 첫 행이 앞에 옴)
+        sorted_ids, sorted_rows = _sorted_lookup(ids)
+        dup = sorted_ids[1:] == sorted_ids[:-1]
+        if dup.any():
+            keep = np.ones(len(ids), dtype=bool)
+            keep[sorted_rows[1:][dup]] = False
+            rows = np.flatnonzero(keep)
+            logger.debug(f"중복 song_id 스킵: {int(dup.sum())}건")
+            ids = ids[rows]
+            columns = {name: col[rows] for name, col in columns.items()}
+            strings = {name: col.take(rows) for name, col in strings.items()}
+            sorted_ids, sorted_rows = _sorted_lookup(ids)
+        
+        catalog = CatalogColumns(
+            song_ids=ids,
+            artist_keys=list(self._artist_index),
+            main_genres=list(self._genre_index),
+            genre_groups=self._genre_groups.groups,
+            sorted_ids=sorted_ids,
+            sorted_rows=sorted_rows,
+            **columns
+        )
+        return MetaRegistry(
+            songs=ColumnarSongs(catalog, strings),
+            song_ids=catalog.song_ids,
+            search_index=ColumnarSearchIndex(catalog.song_ids, strings),
+            catalog=catalog
+        )
+
+
+class _MetaDictBuilder:
+    """MetaRecord -> SongMeta dict + 검색 리스트 (이전 방식, streaming=False)"""
+    
+    def __init__(self):
+        self.songs: Dict[int, SongMeta] = {}
+        self.song_ids: List[int] = []
+        self.search_index: List[Tuple[int, str]] = []
+    
+    def add(
+        self,
+        sid: int,
+        song_name: str,
+        artist: str,
+        genre: str,
+        issue_year: Optional[int],
+        artist_key: str
+    ) -> None:
+        # 중복 song_id 스킵
+        if sid in self.songs:
+            logger.debug(f"중복 song_id 스킵: {sid}")
+            return
+        self.songs[sid] = SongMeta(
+            song_id=sid,
+            song_name=song_name,
+            artist=artist,
+            genre=genre,
+            issue_year=issue_year,
+            artist_key=artist_key
+        )
+        self.song_ids.append(sid)
+        self.search_index.append((sid, _normalize_text(f"{song_name} {artist}")))
     
+    def build(self) -> MetaRegistry:
+        return MetaRegistry(
+            songs=self.songs,
+            song_ids=self.song_ids,
+            search_index=self.search_index,
+            catalog=build_catalog_columns(self.songs, self.song_ids)
+        )
+
+
+def _add_demo_songs(builder: Union[_MetaColumnsBuilder, _MetaDictBuilder]) -> None:
+    """데모 모드 더미 메타데이터"""
+    demo_genres = ["GN0100", "GN0200", "GN0300", "GN0400", "GN0500"]
+    for i in range(1, 5001):
+        builder.add(
+            i,
+            f"Demo Song {i}",
+            f"Demo Artist {i % 100}",
+            demo_genres[i % len(demo_genres)],
+            2020 + (i % 5),
+            str(i % 100)  # 아티스트 ID 시뮬레이션
+        )
+
+
+def _load_meta_json(
+    path: str,
+    demo_mode: bool,
+    label: str,
+    fields: Dict[str, Tuple[str, ...]],
+    parse_record: Callable[[Dict, _MetaSchema], Optional[MetaRecord]],
+    streaming: bool
+) -> MetaRegistry:
+    """메타 JSON 공통 로더 (레코드 파싱은 parse_record, 저장 방식은 streaming으로 선택)"""
+    registry: Optional[MetaRegistry] = None
     file_path = Path(path) if path else None
     
     # 파일 로드 시도
     if file_path and file_path.exists():
         try:
-            logger.info(f"Melon 메타데이터 로드 중: {file_path}")
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            # 구조 파악: 리스트 또는 딕셔너리
-            items = []
-            if isinstance(data, list):
-                items = data
-            elif isinstance(data, dict):
-                # 딕셔너리인 경우 values 사용
-                if all(isinstance(v, dict) for v in data.values()):
-                    items = list(data.values())
-                else:
-                    items = [data]
+            logger.info(f"{label} 로드 중: {file_path}")
+            builder = _MetaColumnsBuilder() if streaming else _MetaDictBuilder()
+            items = iter_json_items(str(file_path)) if streaming else _iter_json_items_full(str(file_path))
             
+            schema: Optional[_MetaSchema] = None
             for item in items:
                 if not isinstance(item, dict):
                     continue
-                
-                # song_id 추출 (id 또는 song_id)
-                sid_raw = item.get("id") or item.get("song_id") or item.get("sid")
-                if sid_raw is None:
-                    continue
-                try:
-                    sid = int(sid_raw)
-                except (ValueError, TypeError):
-                    continue
-                
-                # song_name 추출
-                song_name = _extract_field(
-                    item,
-                    ["song_name", "title", "name", "track_name"],
-                    default="Unknown"
-                )
-                
-                # artist 추출 (artist_name_basket 처리)
-                artist = ""
-                if "artist_name_basket" in item:
-                    artist_list = item["artist_name_basket"]
-                    if isinstance(artist_list, list):
-                        artist = ", ".join(str(a) for a in artist_list if a)
-                    else:
-                        artist = str(artist_list) if artist_list else ""
-                else:
-                    artist = _extract_field(
-                        item,
-                        ["artist", "artist_name", "artists"],
-                        default="Unknown"
-                    )
-                
-                # genre 추출 (song_gn_gnr_basket 또는 song_gn_dtl_gnr_basket)
-                genre = ""
-                genre_raw = item.get("song_gn_gnr_basket") or item.get("song_gn_dtl_gnr_basket")
-                if genre_raw:
-                    if isinstance(genre_raw, list):
-                        genre = ", ".join(str(g) for g in genre_raw if g)
-                    else:
-                        genre = str(genre_raw)
-                else:
-                    genre = _extract_field(item, ["genre", "genres"], default="")
-                
-                # issue_year 추출 (issue_date에서 YYYYMMDD 파싱)
-                issue_year = None
-                issue_date = item.get("issue_date") or item.get("issue_year")
-                if issue_date:
-                    issue_year = _parse_year(issue_date)
-                
-                # artist_key 추출 (artist_id_basket[0])
-                artist_key = "UNKNOWN"
-                artist_id_basket = item.get("artist_id_basket")
-                if isinstance(artist_id_basket, list) and len(artist_id_basket) > 0:
-                    artist_key = str(artist_id_basket[0])
-                elif artist_id_basket:
-                    artist_key = str(artist_id_basket)
-                
-                # 중복 song_id 스킵
-                if sid in songs:
-                    logger.debug(f"중복 song_id 스킵: {sid}")
-                    continue
-                
-                meta = SongMeta(
-                    song_id=sid,
-                    song_name=song_name,
-                    artist=artist,
-                    genre=genre,
-                    issue_year=issue_year,
-                    artist_key=artist_key
-                )
-                songs[sid] = meta
-                song_ids.append(sid)
-                
-                # 검색 인덱스
-                search_text = _normalize_text(f"{song_name} {artist}")
-                search_index.append((sid, search_text))
-            
-            logger.info(f"Melon 메타데이터 로드 완료: {len(songs):,}곡")
+                # 스키마는 첫 레코드에서 확정 (id 키가 없는 레코드를 만나면 그 레코드 기준으로 재확정)
+                if schema is None or not any(key in item for key in schema.song_id):
+                    schema = _MetaSchema.resolve(item, fields)
+                record = parse_record(item, schema)
+                if record is not None:
+                    builder.add(*record)
             
+            registry = builder.build()
+            logger.info(f"{label} 로드 완료: {len(registry.songs):,}곡")
+        
         except Exception as e:
-            logger.error(f"Melon 메타데이터 로드 실패: {e}")
+            logger.error(f"{label} 로드 실패: {e}")
             if not demo_mode:
-                raise RuntimeError(f"Melon 메타데이터 로드 실패: {e}")
+                raise RuntimeError(f"{label} 로드 실패: {e}")
     
     # 데모 모드: 더미 데이터 생성
-    if not songs and demo_mode:
+    if (registry is None or not registry.songs) and demo_mode:
         logger.warning("데모 모드: 더미 메타데이터 생성")
-        demo_genres = ["GN0100", "GN0200", "GN0300", "GN0400", "GN0500"]
-        for i in range(1, 5001):
-            meta = SongMeta(
-                song_id=i,
-                song_name=f"Demo Song {i}",
-                artist=f"Demo Artist {i % 100}",
-                genre=demo_genres[i % len(demo_genres)],
-                issue_year=2020 + (i % 5),
-                artist_key=str(i % 100)
-            )
-            songs[i] = meta
-            song_ids.append(i)
-            search_text = _normalize_text(f"{meta.song_name} {meta.artist}")
-            search_index.append((i, search_text))
-        logger.info(f"더미 메타데이터 생성 완료: {len(songs):,}곡")
+        builder = _MetaColumnsBuilder() if streaming else _MetaDictBuilder()
+        _add_demo_songs(builder)
+        registry = builder.build()
+        logger.info(f"더미 메타데이터 생성 완료: {len(registry.songs):,}곡")
     
     # 데모 모드가 아닌데 메타가 없으면 예외
-    if not songs and not demo_mode:
+    if registry is None or not registry.songs:
         raise RuntimeError(f"메타데이터가 비어있습니다: {path}")
     
-    return MetaRegistry(songs=songs, song_ids=song_ids, search_index=search_index)
+    return registry
 
 
-def load_audio_song_meta(path: str, demo_mode: bool) -> MetaRegistry:
+def load_song_meta_melon(path: str, demo_mode: bool, streaming: bool = True) -> MetaRegistry:
     """
-    오디오 메타데이터 JSON 로드
+    Melon song_meta.json 로드 (CF 후보 필터링용)
     
     Args:
         path: JSON 파일 경로
         demo_mode: 데모 모드 여부 (파일 없으면 더미 생성)
+        streaming: True면 레코드 단위 스트리밍 파싱 + 컬럼형 저장,
+                   False면 json.load + SongMeta dict (이전 방식, 벤치마크 비교용)
     
     Returns:
         MetaRegistry: 메타데이터 레지스트리
     """
-    songs: Dict[int, SongMeta] = {}
-    song_ids: List[int] = []
-    search_index: List[Tuple[int, str]] = []
-    
-    file_path = Path(path) if path else None
-    
-    # 파일 로드 시도
-    if file_path and file_path.exists():
-        try:
-            logger.info(f"메타데이터 로드 중: {file_path}")
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            # 구조 파악: 리스트 또는 딕셔너리
-            items = []
-            if isinstance(data, list):
-                items = data
-            elif isinstance(data, dict):
-                # 딕셔너리인 경우 values 사용
-                if all(isinstance(v, dict) for v in data.values()):
-                    items = list(data.values())
-                else:
-                    # 단일 객체인 경우
-                    items = [data]
-            
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                
-                # song_id 추출
-                sid_raw = _extract_field(item, ["song_id", "id", "sid"])
-                if not sid_raw:
-                    continue
-                try:
-                    sid = int(sid_raw)
-                except ValueError:
-                    continue
-                
-                # 필드 추출
-                song_name = _extract_field(
-                    item, 
-                    ["song_name", "title", "name", "track_name"],
-                    default="Unknown"
-                )
-                artist = _extract_field(
-                    item,
-                    ["artist", "artist_name", "artist_name_basket", "artists"],
-                    default="Unknown"
-                )
-                
-                # main_genre 추출 (첫 번째 장르 코드)
-                genre_raw = item.get("song_gn_gnr_basket") or item.get("genre") or item.get("genres")
-                if isinstance(genre_raw, list) and len(genre_raw) > 0:
-                    genre = str(genre_raw[0])
-                elif isinstance(genre_raw, str):
-                    genre = genre_raw
-                else:
-                    genre = ""
-                
-                # artist_key 추출 (첫 번째 아티스트 ID)
-                artist_id_basket = item.get("artist_id_basket")
-                if isinstance(artist_id_basket, list) and len(artist_id_basket) > 0:
-                    artist_key = str(artist_id_basket[0])
-                else:
-                    artist_key = "UNKNOWN"
-                
-                issue_year = _parse_year(
-                    item.get("issue_year") or item.get("issue_date") or item.get("year")
-                )
-                
-                # 중복 song_id 스킵
-                if sid in songs:
-                    logger.debug(f"중복 song_id 스킵: {sid}")
-                    continue
-                
-                meta = SongMeta(
-                    song_id=sid,
-                    song_name=song_name,
-                    artist=artist,
-                    genre=genre,
-                    issue_year=issue_year,
-                    artist_key=artist_key
-                )
-                songs[sid] = meta
-                song_ids.append(sid)
-                
-                # 검색 인덱스
-                search_text = _normalize_text(f"{song_name} {artist}")
-                search_index.append((sid, search_text))
-            
-            logger.info(f"메타데이터 로드 완료: {len(songs):,}곡")
-            
-        except Exception as e:
-            logger.error(f"메타데이터 로드 실패: {e}")
-            if not demo_mode:
-                raise RuntimeError(f"메타데이터 로드 실패: {e}")
-    
-    # 데모 모드: 더미 데이터 생성
-    if not songs and demo_mode:
-        logger.warning("데모 모드: 더미 메타데이터 생성")
-        demo_genres = ["GN0100", "GN0200", "GN0300", "GN0400", "GN0500"]
-        for i in range(1, 5001):
-            meta = SongMeta(
-                song_id=i,
-                song_name=f"Demo Song {i}",
-                artist=f"Demo Artist {i % 100}",
-                genre=demo_genres[i % len(demo_genres)],
-                issue_year=2020 + (i % 5),
-                artist_key=str(i % 100)  # 아티스트 ID 시뮬레이션
-            )
-            songs[i] = meta
-            song_ids.append(i)
-            search_text = _normalize_text(f"{meta.song_name} {meta.artist}")
-            search_index.append((i, search_text))
-        logger.info(f"더미 메타데이터 생성 완료: {len(songs):,}곡")
+    return _load_meta_json(path, demo_mode, "Melon 메타데이터", _MELON_FIELDS, _parse_melon_record, streaming)
+
+
+def load_audio_song_meta(path: str, demo_mode: bool, streaming: bool = True) -> MetaRegistry:
+    """
+    오디오 메타데이터 JSON 로드
     
-    # 데모 모드가 아닌데 메타가 없으면 예외
-    if not songs and not demo_mode:
-        raise RuntimeError(f"메타데이터가 비어있습니다: {path}")
+    Args:
+        path: JSON 파일 경로
+        demo_mode: 데모 모드 여부 (파일 없으면 더미 생성)
+        streaming: True면 레코드 단위 스트리밍 파싱 + 컬럼형 저장,
+                   False면 json.load + SongMeta dict (이전 방식, 벤치마크 비교용)
     
-    return MetaRegistry(songs=songs, song_ids=song_ids, search_index=search_index)
+    Returns:
+        MetaRegistry: 메타데이터 레지스트리
+    """
+    return _load_meta_json(path, demo_mode, "메타데이터", _AUDIO_FIELDS, _parse_audio_record, streaming)
 
 
 def load_item2vec_model(path: str) -> Optional[Any]:
     """
-    Item2Vec (Word2Vec) 모델 로드
+    Item2Vec 벡터 로드 (서빙용 KeyedVectors)
+    
+    - 서빙 전용 export(python -m app.cli export-kv)는 벡터 .npy를 mmap='r'로 열기만 함
+    - 학습용 Word2Vec 모델도 허용하지만 model.wv만 반환 (별도 저장된 syn1neg 등 학습 상태는 mmap이라 읽지 않음)
     
     Args:
-        path: 모델 파일 경로
+        path: 모델 파일 경로 (.kv export 또는 Word2Vec.save 파일)
     
     Returns:
-        Word2Vec 모델 또는 None
+        gensim KeyedVectors 또는 None
     """
     if not path:
         logger.info("Item2Vec 경로 미설정, 스킵")
@@ -373,21 +822,84 @@ def load_item2vec_model(path: str) -> Optional[Any]:
         return None
     
     try:
-        from gensim.models import Word2Vec
+        from gensim.models import KeyedVectors
+        from gensim.utils import SaveLoad
         logger.info(f"Item2Vec 모델 로드 중: {path}")
-        model = Word2Vec.load(path)
-        vocab_size = len(model.wv)
-        logger.info(f"Item2Vec 로드 완료: vocab={vocab_size:,}")
-        return model
+        # 압축 파일은 mmap 불가
+        mmap = None if file_path.suffix in (".gz", ".bz2") else "r"
+        wv = SaveLoad.load(path, mmap=mmap)
+        wv = getattr(wv, "wv", wv)
+        if not isinstance(wv, KeyedVectors):
+            raise TypeError(f"KeyedVectors / Word2Vec 파일이 아님: {type(wv).__name__}")
+        mode = "mmap" if isinstance(wv.vectors, np.memmap) else "in-memory"
+        logger.info(f"Item2Vec 로드 완료: vocab={len(wv):,} ({mode})")
+        return wv
     except Exception as e:
         logger.error(f"Item2Vec 로드 실패: {e}")
         return None
 
 
+def keyed_vector_counts(model: Any) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Item2Vec vocab 빈도 (학습 시 기록된 KeyedVectors 'count' 속성, 정수 키만)
+    
+    Returns:
+        (song_ids, counts) 또는 None (빈도가 없는 export / 양자화 / 스냅샷 벡터)
+    """
+    wv = getattr(model, "wv", model)
+    counts = getattr(wv, "expandos", {}).get("count")
+    if counts is None or not np.any(counts):
+        return None
+    song_ids = []
+    rows = []
+    for idx, key in enumerate(wv.index_to_key):
+        try:
+            song_ids.append(int(key))
+        except (ValueError, TypeError):
+            continue
+        rows.append(idx)
+    return np.asarray(song_ids, dtype=np.int64), np.asarray(counts)[rows].astype(np.float32)
+
+
+def export_item2vec_vectors(model: Any, path: str) -> int:
+    """
+    서빙 전용 Item2Vec 벡터 export (학습 상태 없이 KeyedVectors만)
+    
+    정수 song_id 키만 남기고 L2 정규화한 float32 벡터를 {path}.vectors.npy로 분리 저장
+    load_item2vec_model()이 mmap='r'로 열고 ItemVectorIndex가 복사 / 재정규화 없이 그대로 사용
+    
+    Args:
+        model: Word2Vec 모델 또는 KeyedVectors
+        path: 출력 경로 (예: data/item2vec.kv)
+    
+    Returns:
+        저장한 벡터 수
+    """
+    from gensim.models import KeyedVectors
+    
+    index = ItemVectorIndex.from_keyed_vectors(model)
+    kv = KeyedVectors(vector_size=index.dim, count=0, dtype=np.float32)
+    kv.add_vectors([str(sid) for sid in index.song_ids.tolist()], np.ascontiguousarray(index.vectors))
+    kv.l2_normalized = True
+    # vocab 빈도 유지 (자동완성 인기도 prior)
+    #   (keyed_vector_counts와 ItemVectorIndex 모두 원본 vocab 순서에서 정수 키만 남기므로 행이 일치)
+    counts = keyed_vector_counts(model)
+    if counts is not None:
+        kv.allocate_vecattrs(attrs=["count"], types=[np.int64])
+        kv.expandos["count"][:] = counts[1]
+    
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    kv.save(path, separately=["vectors"])
+    logger.info(f"Item2Vec 서빙 벡터 저장 완료: {path} (vocab={len(kv):,}, {kv.vectors.nbytes / 2**20:.1f}MiB)")
+    return len(kv)
+
+
 def load_audio_embeddings(
     audio_model: str,
     myna_path: str,
-    cnn_path: str
+    cnn_path: str,
+    quant_path: str = "",
+    rescore_full: bool = True
 ) -> Optional[AudioBundle]:
     """
     오디오 임베딩 로드
@@ -396,10 +908,27 @@ def load_audio_embeddings(
         audio_model: "myna" 또는 "cnn"
         myna_path: Myna 임베딩 경로
         cnn_path: CNN 임베딩 경로
+        quant_path: 양자화 임베딩 prefix (설정 시 우선 사용, 실패하면 .npz로 대체)
+        rescore_full: 양자화 모드에서 float32 원본(.full.npy)이 있으면 재채점용으로 열기
     
     Returns:
         AudioBundle 또는 None
     """
+    if quant_path:
+        loaded = load_quantized(quant_path, rescore_full)
+        if loaded is not None:
+            song_ids, matrix, full = loaded
+            sorted_ids, sorted_rows = _sorted_lookup(np.asarray(song_ids, dtype=np.int64))
+            return AudioBundle(
+                song_ids=np.asarray(song_ids, dtype=np.int64),
+                embeddings=matrix,
+                model_type=audio_model,
+                sorted_ids=sorted_ids,
+                sorted_rows=sorted_rows,
+                full_embeddings=full
+            )
+        logger.warning(f"양자화 오디오 임베딩 사용 불가, float32 임베딩으로 대체: {quant_path}")
+    
     path = myna_path if audio_model == "myna" else cnn_path
     
     if not path:
@@ -460,17 +989,20 @@ def load_audio_embeddings(
             logger.error(f"embeddings가 2차원이 아님: ndim={embeddings.ndim}")
             return None
         
-        # 인덱스 맵 생성
-        # 각 song_id가 embeddings 배열에서 몇 번째 위치인지 알려주는 딕셔너리를 만듬
-        song_id_to_idx = {int(sid): idx for idx, sid in enumerate(song_ids)}
+        # L2 정규화 (요청마다 재정규화하지 않도록 1회만)
+        embeddings = l2_normalize_rows(embeddings)
+        
+        # song_id -> 행 조회 테이블 (정렬 배열)
+        sorted_ids, sorted_rows = _sorted_lookup(song_ids)
         
         logger.info(f"오디오 임베딩 로드 완료: {len(song_ids):,}곡, dim={embeddings.shape[1]}")
         
         return AudioBundle(
             song_ids=song_ids,
             embeddings=embeddings,
-            song_id_to_idx=song_id_to_idx,
-            model_type=audio_model
+            model_type=audio_model,
+            sorted_ids=sorted_ids,
+            sorted_rows=sorted_rows
         )
         
     except Exception as e:
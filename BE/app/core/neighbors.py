@@ -0,0 +1,181 @@
+"""
+VibeCurator CF Neighbor Table
+오프라인으로 미리 계산한 Item2Vec top-N 이웃 테이블 (빌드 + mmap 서빙)
+
+파일 형식 ({prefix}.ids.npy / {prefix}.scores.npy):
+    ids:    (N, topn + 1) int32   - 0번 열은 시드 song_id, 1번 열부터 이웃 song_id
+    scores: (N, topn + 1) float16 - 0번 열은 1.0, 1번 열부터 코사인 유사도
+    행은 시드 song_id 오름차순 정렬 (이진 탐색으로 행 조회)
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .retrieval import ItemVectorIndex
+
+logger = logging.getLogger(__name__)
+
+
+def neighbor_table_paths(prefix: str) -> Tuple[Path, Path]:
+    """테이블 파일 경로 쌍 (ids, scores)"""
+    return Path(f"{prefix}.ids.npy"), Path(f"{prefix}.scores.npy")
+
+
+def build_neighbor_table(
+    index: ItemVectorIndex,
+    prefix: str,
+    topn: int,
+    block_size: int = 128,
+    workers: Optional[int] = None
+) -> int:
+    """
+    전체 vocab의 top-N CF 이웃을 계산해 .npy 쌍으로 저장
+
+    블록 단위 행렬곱 (block_size x N)을 스레드 풀에서 병렬 실행
+    (BLAS/argpartition은 GIL을 해제하므로 코어 수만큼 확장됨)
+    블록당 메모리: block_size * N * 4 bytes
+
+    Args:
+        index: 검색 대상 인덱스 (보통 vocab ∩ 메타)
+        prefix: 출력 경로 prefix
+        topn: 시드당 이웃 수
+        block_size: 한 번에 계산할 시드 행 수
+        workers: 스레드 수 (기본: CPU 코어 수)
+
+    Returns:
+        저장된 행 수
+    """
+    n = len(index)
+    topn = min(topn, max(n - 1, 0))
+    workers = workers or os.cpu_count() or 1
+
+    # 시드 song_id 오름차순으로 행 배치
+    order = np.argsort(index.song_ids, kind="stable")
+    vectors = index.vectors
+    song_ids = index.song_ids
+
+    ids_path, scores_path = neighbor_table_paths(prefix)
+    ids_path.parent.mkdir(parents=True, exist_ok=True)
+    ids_out = np.lib.format.open_memmap(ids_path, mode="w+", dtype=np.int32, shape=(n, topn + 1))
+    scores_out = np.lib.format.open_memmap(scores_path, mode="w+", dtype=np.float16, shape=(n, topn + 1))
+
+    def _run_block(start: int) -> int:
+        out_rows = np.arange(start, min(start + block_size, n))
+        src_rows = order[out_rows]
+        sims = vectors[src_rows] @ vectors.T  # (B, N)
+        sims[np.arange(len(src_rows)), src_rows] = -np.inf  # 자기 자신 제외
+
+        if topn > 0:
+            part = np.argpartition(-sims, topn - 1, axis=1)[:, :topn]
+        else:
+            part = np.empty((len(src_rows), 0), dtype=np.int64)
+        part_scores = np.take_along_axis(sims, part, axis=1)
+        rank = np.argsort(-part_scores, axis=1, kind="stable")
+        top = np.take_along_axis(part, rank, axis=1)[:, :topn]
+        top_scores = np.take_along_axis(part_scores, rank, axis=1)[:, :topn]
+
+        ids_out[out_rows, 0] = song_ids[src_rows]
+        ids_out[out_rows, 1:] = song_ids[top]
+        scores_out[out_rows, 0] = 1.0
+        scores_out[out_rows, 1:] = top_scores
+        return len(out_rows)
+
+    starts = range(0, n, block_size)
+    done = 0
+    next_log = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for count in pool.map(_run_block, starts):
+            done += count
+            if done >= next_log:
+                logger.info(f"이웃 테이블 빌드 진행: {done:,}/{n:,}")
+                next_log += max(n // 20, block_size)
+
+    ids_out.flush()
+    scores_out.flush()
+    logger.info(f"이웃 테이블 저장 완료: {ids_path}, {scores_path} ({n:,} x {topn})")
+    return n
+
+
+class NeighborTable:
+    """
+    mmap으로 연 CF 이웃 테이블
+
+    조회는 시드 행 이진 탐색 + 행 슬라이스 (유사도 계산 없음)
+    읽기 전용 mmap이므로 같은 파일을 여는 모든 워커가 페이지 캐시를 공유함
+    """
+
+    def __init__(self, ids: np.ndarray, scores: np.ndarray):
+        if ids.shape != scores.shape or ids.ndim != 2:
+            raise ValueError(f"이웃 테이블 shape 불일치: ids={ids.shape}, scores={scores.shape}")
+        self.ids = ids
+        self.scores = scores
+        # 0번 열(시드 song_id, 오름차순)을 연속 배열로 1회 복사 (strided view면 searchsorted가 호출마다 복사)
+        self.song_ids_sorted = np.ascontiguousarray(ids[:, 0])
+
+    def __len__(self) -> int:
+        return int(self.ids.shape[0])
+
+    @property
+    def width(self) -> int:
+        """시드당 저장된 이웃 수"""
+        return int(self.ids.shape[1]) - 1
+
+    def row_of(self, song_id: int) -> int:
+        """시드 song_id의 행 번호 (없으면 -1)"""
+        pos = int(np.searchsorted(self.song_ids_sorted, song_id))
+        if pos < len(self.song_ids_sorted) and self.song_ids_sorted[pos] == song_id:
+            return pos
+        return -1
+
+    def contains(self, song_id: int) -> bool:
+        return self.row_of(song_id) >= 0
+
+    def lookup(self, song_id: int, topn: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        시드의 상위 topn 이웃 조회
+
+        Returns:
+            (song_ids int64, scores float32) 배열 쌍, 시드가 없으면 빈 배열
+        """
+        row = self.row_of(song_id)
+        if row < 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        end = 1 + min(topn, self.width)
+        return (
+            np.asarray(self.ids[row, 1:end], dtype=np.int64),
+            np.asarray(self.scores[row, 1:end], dtype=np.float32)
+        )
+
+
+def load_neighbor_table(prefix: str) -> Optional[NeighborTable]:
+    """
+    이웃 테이블 로드 (mmap_mode='r')
+
+    Args:
+        prefix: 파일 경로 prefix ({prefix}.ids.npy / {prefix}.scores.npy)
+
+    Returns:
+        NeighborTable 또는 None
+    """
+    if not prefix:
+        return None
+
+    ids_path, scores_path = neighbor_table_paths(prefix)
+    if not ids_path.exists() or not scores_path.exists():
+        logger.warning(f"이웃 테이블 파일 없음: {ids_path}, {scores_path}")
+        return None
+
+    try:
+        ids = np.load(ids_path, mmap_mode="r")
+        scores = np.load(scores_path, mmap_mode="r")
+        table = NeighborTable(ids, scores)
+        logger.info(f"이웃 테이블 로드 완료 (mmap): {len(table):,}곡 x {table.width}")
+        return table
+    except Exception as e:
+        logger.error(f"이웃 테이블 로드 실패: {e}")
+        return None
@@ -0,0 +1,343 @@
+"""
+VibeCurator Embedding Quantization
+Item2Vec / 오디오 임베딩 양자화 저장 (float16, int8 + 행별 scale)
+
+파일 형식 ({prefix}.*.npy, 모두 mmap_mode='r'로 로드):
+    ids:    (N,) int64          - 행 -> song_id
+    codes:  (N, D) float16|int8 - 양자화된 L2 정규화 벡터
+    scales: (N,) float32        - int8 행별 scale (float16이면 없음)
+    full:   (N, D) float32      - 선택, 재채점용 원본 정규화 벡터 (페이지 캐시에서 후보 행만 읽음)
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .retrieval import RESCORE_MARGIN, ItemVectorIndex, top_n_indices
+
+logger = logging.getLogger(__name__)
+
+QUANT_DTYPES = ("float16", "int8")
+
+# float32 원본 재채점 시 1차 선별 배수 (양자화 오차로 밀려난 후보 회수)
+RESCORE_SHORTLIST_FACTOR = 4
+
+# 전체 스캔 시 한 번에 float32로 복원할 행 수 (임시 메모리: chunk * D * 4 bytes)
+SCAN_CHUNK_ROWS = 65536
+
+
+def quant_paths(prefix: str) -> Dict[str, Path]:
+    """양자화 파일 경로 (ids, codes, scales, full)"""
+    return {name: Path(f"{prefix}.{name}.npy") for name in ("ids", "codes", "scales", "full")}
+
+
+class QuantizedMatrix:
+    """
+    양자화된 (N, D) 행렬
+
+    - float16: codes만 저장
+    - int8: codes * scales[:, None] 으로 복원 (scale = 행별 max|v| / 127)
+    내적은 청크 단위로 float32 복원 후 계산 (상주 메모리는 codes 크기만큼)
+    """
+
+    def __init__(self, codes: np.ndarray, scales: Optional[np.ndarray] = None):
+        if codes.ndim != 2:
+            raise ValueError(f"codes가 2차원이 아님: ndim={codes.ndim}")
+        if codes.dtype == np.int8:
+            if scales is None or len(scales) != codes.shape[0]:
+                raise ValueError("int8 codes에는 행별 scales가 필요합니다")
+        elif codes.dtype != np.float16:
+            raise ValueError(f"지원하지 않는 codes dtype: {codes.dtype}")
+        self.codes = codes
+        self.scales = scales if codes.dtype == np.int8 else None
+
+    @classmethod
+    def quantize(cls, vectors: np.ndarray, dtype: str) -> "QuantizedMatrix":
+        """float32 행렬 양자화"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if dtype == "float16":
+            return cls(vectors.astype(np.float16))
+        if dtype == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+            return cls(codes, scales.astype(np.float32))
+        raise ValueError(f"Unknown quantization dtype: {dtype}")
+
+    @property
+    def dtype_name(self) -> str:
+        return str(self.codes.dtype)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return tuple(self.codes.shape)
+
+    def __len__(self) -> int:
+        return int(self.codes.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.codes.nbytes + (self.scales.nbytes if self.scales is not None else 0))
+
+    def rows(self, rows: np.ndarray) -> np.ndarray:
+        """행 gather + float32 복원"""
+        out = np.asarray(self.codes[rows], dtype=np.float32)
+        if self.scales is not None:
+            out *= self.scales[rows][:, None]
+        return out
+
+    def to_float32(self) -> np.ndarray:
+        """전체 float32 복원 (오프라인 도구 / IVF 빌드용)"""
+        return self.rows(np.arange(len(self)))
+
+    def take(self, mask: np.ndarray) -> "QuantizedMatrix":
+        """행 마스크로 부분 행렬 생성"""
+        return QuantizedMatrix(
+            np.ascontiguousarray(self.codes[mask]),
+            None if self.scales is None else np.ascontiguousarray(self.scales[mask])
+        )
+
+    def dot_many(self, queries: np.ndarray) -> np.ndarray:
+        """(B, D) 쿼리와의 내적 (B, N) float32"""
+        queries = np.asarray(queries, dtype=np.float32)
+        out = np.empty((queries.shape[0], len(self)), dtype=np.float32)
+        for start in range(0, len(self), SCAN_CHUNK_ROWS):
+            end = min(start + SCAN_CHUNK_ROWS, len(self))
+            block = np.asarray(self.codes[start:end], dtype=np.float32)
+            sims = queries @ block.T
+            if self.scales is not None:
+                sims *= self.scales[start:end]
+            out[:, start:end] = sims
+        return out
+
+    def dot(self, query: np.ndarray) -> np.ndarray:
+        """(D,) 쿼리와의 내적 (N,) float32"""
+        return self.dot_many(np.asarray(query, dtype=np.float32)[None, :])[0]
+
+
+class QuantizedVectorIndex(ItemVectorIndex):
+    """
+    양자화 벡터 인덱스 (exact 전수 검색)
+
+    1차 선별은 양자화 행렬 스캔, 최종 점수는 full(float32 원본)이 있으면
+    선별된 후보 행만 원본으로 재채점 (없으면 양자화 값으로 재채점)
+    """
+
+    def __init__(
+        self,
+        song_ids: np.ndarray,
+        matrix: QuantizedMatrix,
+        full_vectors: Optional[np.ndarray] = None,
+        full_rows: Optional[np.ndarray] = None
+    ):
+        """
+        Args:
+            song_ids: (N,) 정수 song_id 배열
+            matrix: 양자화 행렬
+            full_vectors: 재채점용 float32 원본 (보통 mmap, 행 공간은 full_rows 기준)
+            full_rows: 이 인덱스 행 -> full_vectors 행 (None이면 동일)
+        """
+        if len(song_ids) != len(matrix):
+            raise ValueError(f"song_ids({len(song_ids)})와 codes({len(matrix)}) 길이 불일치")
+        self.song_ids = np.asarray(song_ids, dtype=np.int64)
+        self.matrix = matrix
+        self.full_vectors = full_vectors
+        self._full_rows = full_rows
+        self._build_lookup()
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """전체 float32 복원 행렬 (오프라인 도구 / IVF 빌드용, 매 호출마다 새로 생성)"""
+        return self.matrix.to_float32()
+
+    @property
+    def dim(self) -> int:
+        return int(self.matrix.shape[1])
+
+    @property
+    def rescore_full(self) -> bool:
+        """float32 원본 재채점 사용 여부"""
+        return self.full_vectors is not None
+
+    def restrict_to(self, song_ids: np.ndarray) -> "QuantizedVectorIndex":
+        mask = np.isin(self.song_ids, np.asarray(song_ids, dtype=np.int64))
+        if mask.all():
+            return self
+        full_rows = None
+        if self.full_vectors is not None:
+            base = self._full_rows if self._full_rows is not None else np.arange(len(self))
+            full_rows = base[mask]
+        return QuantizedVectorIndex(self.song_ids[mask], self.matrix.take(mask), self.full_vectors, full_rows)
+
+    def _gather(self, rows: np.ndarray) -> np.ndarray:
+        return self.matrix.rows(rows)
+
+    def _gather_exact(self, rows: np.ndarray) -> np.ndarray:
+        if self.full_vectors is None:
+            return self.matrix.rows(rows)
+        if self._full_rows is not None:
+            rows = self._full_rows[rows]
+        return np.asarray(self.full_vectors[rows], dtype=np.float32)
+
+    def search_multi(
+        self,
+        rows: Sequence[int],
+        topn: int,
+        fusion: str = "mean"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """다중 시드 검색 (원본이 있으면 양자화 스캔 선별 후 원본 벡터로 결합 점수 재계산)"""
+        if self.full_vectors is None:
+            return super().search_multi(rows, topn, fusion)
+
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        cand, scores = super().search_multi(rows, self._shortlist_size(topn), fusion)
+        if len(cand) == 0:
+            return cand, scores
+
+        queries = self._gather_exact(rows)
+        vectors = self._gather_exact(cand)
+        if fusion == "mean":
+            query = queries.mean(axis=0)
+            query /= max(float(np.linalg.norm(query)), 1e-12)
+            scores = vectors @ query
+        else:
+            sims = vectors @ queries.T  # (C, B)
+            scores = sims.max(axis=1) if fusion == "max" else sims.sum(axis=1)
+        top = top_n_indices(scores, topn)
+        return cand[top], scores[top]
+
+    def _shortlist_size(self, topn: int) -> int:
+        if self.full_vectors is None:
+            return topn + RESCORE_MARGIN
+        return topn * RESCORE_SHORTLIST_FACTOR + RESCORE_MARGIN
+
+    def _dot(self, query: np.ndarray) -> np.ndarray:
+        return self.matrix.dot(query)
+
+    def _dot_many(self, queries: np.ndarray) -> np.ndarray:
+        return self.matrix.dot_many(queries)
+
+
+def save_quantized(
+    prefix: str,
+    song_ids: np.ndarray,
+    matrix: QuantizedMatrix,
+    full_vectors: Optional[np.ndarray] = None
+) -> None:
+    """양자화 행렬 저장 (.npy 묶음, full_vectors는 재채점용 선택)"""
+    paths = quant_paths(prefix)
+    paths["ids"].parent.mkdir(parents=True, exist_ok=True)
+    np.save(paths["ids"], np.asarray(song_ids, dtype=np.int64))
+    np.save(paths["codes"], matrix.codes)
+    if matrix.scales is not None:
+        np.save(paths["scales"], matrix.scales)
+    if full_vectors is not None:
+        np.save(paths["full"], np.asarray(full_vectors, dtype=np.float32))
+    logger.info(
+        f"양자화 임베딩 저장 완료: {paths['codes']} ({len(matrix):,} x {matrix.shape[1]}, "
+        f"{matrix.dtype_name}, {matrix.nbytes / 2**20:.1f}MiB, full={'yes' if full_vectors is not None else 'no'})"
+    )
+
+
+def load_quantized(
+    prefix: str,
+    rescore_full: bool = True
+) -> Optional[Tuple[np.ndarray, QuantizedMatrix, Optional[np.ndarray]]]:
+    """
+    양자화 행렬 로드 (mmap_mode='r')
+
+    Args:
+        prefix: 파일 경로 prefix
+        rescore_full: full(float32 원본) 파일이 있으면 재채점용으로 함께 열기
+
+    Returns:
+        (song_ids, QuantizedMatrix, full_vectors 또는 None) 또는 None
+    """
+    if not prefix:
+        return None
+
+    paths = quant_paths(prefix)
+    if not paths["ids"].exists() or not paths["codes"].exists():
+        logger.warning(f"양자화 임베딩 파일 없음: {paths['ids']}, {paths['codes']}")
+        return None
+
+    try:
+        song_ids = np.load(paths["ids"])
+        codes = np.load(paths["codes"], mmap_mode="r")
+        scales = np.load(paths["scales"]) if paths["scales"].exists() else None
+        matrix = QuantizedMatrix(codes, scales)
+        full = None
+        if rescore_full and paths["full"].exists():
+            full = np.load(paths["full"], mmap_mode="r")
+        logger.info(
+            f"양자화 임베딩 로드 완료 (mmap): {len(matrix):,} x {matrix.shape[1]} {matrix.dtype_name}, "
+            f"재채점={'float32' if full is not None else 'off'}"
+        )
+        return song_ids, matrix, full
+    except Exception as e:
+        logger.error(f"양자화 임베딩 로드 실패: {e}")
+        return None
+
+
+def load_quantized_index(prefix: str, rescore_full: bool = True) -> Optional[QuantizedVectorIndex]:
+    """양자화 파일 -> QuantizedVectorIndex (없거나 실패하면 None)"""
+    loaded = load_quantized(prefix, rescore_full)
+    if loaded is None:
+        return None
+    song_ids, matrix, full = loaded
+    return QuantizedVectorIndex(song_ids, matrix, full)
+
+
+def accuracy_report(
+    exact: ItemVectorIndex,
+    candidates: Dict[str, ItemVectorIndex],
+    topn: int = 20,
+    n_queries: int = 1000,
+    seed: int = 42
+) -> Sequence[Dict[str, float]]:
+    """
+    float32 exact 검색 대비 Recall@N / NDCG@N
+
+    정답은 float32 exact top-N (이진 관련도), 쿼리는 무작위 행 (자기 자신 제외)
+
+    Args:
+        exact: float32 기준 인덱스
+        candidates: 이름 -> 비교 인덱스 (같은 song_id 공간)
+
+    Returns:
+        [{"name", "recall", "ndcg", "recall_delta", "ndcg_delta"}, ...]
+    """
+    rng = np.random.default_rng(seed)
+    rows = rng.choice(len(exact), size=min(n_queries, len(exact)), replace=False)
+    discounts = 1.0 / np.log2(np.arange(topn) + 2)
+
+    truths = []
+    for row in rows.tolist():
+        hit, _ = exact.search(exact.vectors[row], topn, exclude_row=row)
+        truths.append(exact.song_ids[hit])
+
+    report = []
+    for name, index in candidates.items():
+        recalls = []
+        ndcgs = []
+        for row, truth in zip(rows.tolist(), truths):
+            hit, _ = index.search_by_id(int(exact.song_ids[row]), topn)
+            got = index.song_ids[hit]
+            if len(truth) == 0:
+                continue
+            rel = np.isin(got, truth).astype(np.float64)
+            recalls.append(rel.sum() / len(truth))
+            ideal = discounts[:min(len(truth), topn)].sum()
+            ndcgs.append(float((rel * discounts[:len(rel)]).sum() / ideal))
+        recall = float(np.mean(recalls)) if recalls else 0.0
+        ndcg = float(np.mean(ndcgs)) if ndcgs else 0.0
+        report.append({
+            "name": name,
+            "recall": recall,
+            "ndcg": ndcg,
+            "recall_delta": recall - 1.0,
+            "ndcg_delta": ndcg - 1.0
+        })
+    return report
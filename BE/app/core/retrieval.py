@@ -0,0 +1,325 @@
+"""
+VibeCurator CF Retrieval
+Item2Vec 벡터 행렬 기반 CF 후보 검색 (gensim most_similar 대체)
+"""
+
+import logging
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# BLAS 1차 선별 시 topn에 더해 뽑는 여유 후보 수 (재채점 후 최종 topn 선택)
+RESCORE_MARGIN = 32
+
+# 다중 시드 유사도 결합 방식
+# - mean: 정규화 벡터 평균을 쿼리로 사용
+# - max:  시드별 유사도의 최댓값
+# - sum:  시드별 유사도의 합
+FUSION_MODES = ("mean", "max", "sum")
+
+
+def l2_normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (float32, norm이 0인 행은 0 벡터 유지)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(vectors / norms, dtype=np.float32)
+
+
+def top_n_indices(scores: np.ndarray, topn: int) -> np.ndarray:
+    """
+    점수 배열에서 상위 topn 인덱스 추출 (내림차순)
+
+    argpartition으로 topn개만 고른 뒤 그 안에서만 정렬 (전체 argsort 없음)
+    """
+    n = scores.shape[0]
+    if topn <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if topn < n:
+        part = np.argpartition(-scores, topn - 1)[:topn]
+    else:
+        part = np.arange(n)
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+def fuse_ranked_lists(
+    lists: Sequence[Tuple[np.ndarray, np.ndarray]],
+    fusion: str,
+    topn: int,
+    exclude: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    시드별 (ids, scores) 결과 목록을 하나로 결합 (ANN/이웃 테이블처럼 전체 유사도가 없는 경우)
+
+    목록에 없는 항목의 유사도는 0으로 간주 (mean은 sum / 시드 수)
+
+    Args:
+        lists: 시드별 (ids, scores) 배열 쌍
+        fusion: "mean" | "max" | "sum"
+        topn: 반환 개수
+        exclude: 결과에서 제외할 id (시드 자신들)
+
+    Returns:
+        (ids, scores) 점수 내림차순 배열 쌍
+    """
+    if not lists:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    ids = np.concatenate([np.asarray(i, dtype=np.int64) for i, _ in lists])
+    scores = np.concatenate([np.asarray(sc, dtype=np.float32) for _, sc in lists])
+    uniq, inverse = np.unique(ids, return_inverse=True)
+
+    if fusion == "max":
+        fused = np.full(len(uniq), -np.inf, dtype=np.float32)
+        np.maximum.at(fused, inverse, scores)
+    else:
+        fused = np.zeros(len(uniq), dtype=np.float32)
+        np.add.at(fused, inverse, scores)
+        if fusion == "mean":
+            fused /= len(lists)
+
+    if exclude is not None and len(exclude):
+        keep = ~np.isin(uniq, exclude)
+        uniq, fused = uniq[keep], fused[keep]
+
+    top = top_n_indices(fused, topn)
+    return uniq[top], fused[top]
+
+
+class ItemVectorIndex:
+    """
+    CF 검색용 Item2Vec 벡터 인덱스
+
+    - vectors: (N, D) L2 정규화된 float32 행렬
+    - song_ids: (N,) 행 번호 -> 정수 song_id
+    - 검색은 GEMV 1회 + argpartition top-N, 결과는 (row, score) numpy 배열
+    """
+
+    def __init__(self, song_ids: np.ndarray, vectors: np.ndarray, normalized: bool = False):
+        """
+        Args:
+            song_ids: (N,) 정수 song_id 배열
+            vectors: (N, D) 벡터 행렬
+            normalized: 이미 L2 정규화된 행렬이면 True
+        """
+        if len(song_ids) != vectors.shape[0]:
+            raise ValueError(
+                f"song_ids({len(song_ids)})와 vectors({vectors.shape[0]}) 길이 불일치"
+            )
+        self.song_ids = np.asarray(song_ids, dtype=np.int64)
+        self.vectors = vectors if normalized else l2_normalize_rows(vectors)
+        self._build_lookup()
+
+    def _build_lookup(self) -> None:
+        """song_id -> row 조회용 정렬 배열 (searchsorted)"""
+        order = np.argsort(self.song_ids, kind="stable")
+        self._sorted_ids = self.song_ids[order]
+        self._sorted_rows = order.astype(np.int64)
+
+    @classmethod
+    def from_keyed_vectors(cls, wv: Any) -> "ItemVectorIndex":
+        """
+        gensim KeyedVectors(또는 Word2Vec 모델)에서 인덱스 생성
+        정수로 변환되지 않는 키는 제외
+        모든 키가 정수면 벡터를 복사하지 않고, 서빙 export(l2_normalized)면 재정규화도 하지 않음 (mmap 유지)
+        """
+        wv = getattr(wv, "wv", wv)
+        rows = []
+        song_ids = []
+        for idx, key in enumerate(wv.index_to_key):
+            try:
+                sid = int(key)
+            except (ValueError, TypeError):
+                continue
+            rows.append(idx)
+            song_ids.append(sid)
+
+        skipped = len(wv.index_to_key) - len(rows)
+        if skipped:
+            logger.info(f"CF 인덱스: 정수 변환 불가 키 {skipped:,}개 제외")
+            vectors = np.asarray(wv.vectors)[np.asarray(rows, dtype=np.int64)]
+        else:
+            vectors = wv.vectors
+
+        normalized = bool(getattr(wv, "l2_normalized", False)) and vectors.dtype == np.float32
+        return cls(np.asarray(song_ids, dtype=np.int64), vectors, normalized=normalized)
+
+    def restrict_to(self, song_ids: np.ndarray) -> "ItemVectorIndex":
+        """
+        주어진 song_id 집합에 속하는 행만 남긴 부분 인덱스 생성
+        (예: vocab ∩ 메타 = 실제로 응답 가능한 곡)
+        """
+        mask = np.isin(self.song_ids, np.asarray(song_ids, dtype=np.int64))
+        if mask.all():
+            return self
+        return ItemVectorIndex(self.song_ids[mask], self.vectors[mask], normalized=True)
+
+    def __len__(self) -> int:
+        return int(self.song_ids.shape[0])
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    def row_of(self, song_id: int) -> int:
+        """song_id의 행 번호 (없으면 -1)"""
+        pos = int(np.searchsorted(self._sorted_ids, song_id))
+        if pos < len(self._sorted_ids) and self._sorted_ids[pos] == song_id:
+            return int(self._sorted_rows[pos])
+        return -1
+
+    def contains(self, song_id: int) -> bool:
+        """vocab 포함 여부"""
+        return self.row_of(song_id) >= 0
+
+    # 벡터 접근 (양자화 인덱스는 아래 메서드만 재정의)
+    def _gather(self, rows: np.ndarray) -> np.ndarray:
+        """행 벡터 gather (float32)"""
+        return self.vectors[rows]
+
+    def _gather_exact(self, rows: np.ndarray) -> np.ndarray:
+        """재채점용 행 벡터 gather"""
+        return self._gather(rows)
+
+    def _shortlist_size(self, topn: int) -> int:
+        """재채점 전 1차 선별 후보 수"""
+        return topn + RESCORE_MARGIN
+
+    def _dot(self, query: np.ndarray) -> np.ndarray:
+        """전체 행과 쿼리 내적 (N,)"""
+        return self.vectors @ query
+
+    def _dot_many(self, queries: np.ndarray) -> np.ndarray:
+        """전체 행과 쿼리 행렬 내적 (B, N)"""
+        return queries @ self.vectors.T
+
+    def _rescore(
+        self,
+        rows: np.ndarray,
+        query: np.ndarray,
+        topn: int,
+        exclude_row: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        1차 선별된 후보 행을 행 단위 내적으로 재채점 후 상위 topn 선택
+
+        BLAS GEMV/GEMM 결과는 행렬 크기에 따라 마지막 비트가 달라질 수 있으므로
+        최종 점수는 후보 집합과 무관하게 항상 같은 값이 나오는 행 단위 합으로 계산
+        (단건/배치 검색 결과가 비트 단위로 일치)
+        """
+        rows = np.sort(rows)
+        if exclude_row is not None and exclude_row >= 0:
+            rows = rows[rows != exclude_row]
+        scores = (self._gather_exact(rows) * query).sum(axis=1)
+        top = top_n_indices(scores, topn)
+        return rows[top], scores[top]
+
+    def search(
+        self,
+        query: np.ndarray,
+        topn: int,
+        exclude_row: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        쿼리 벡터(L2 정규화)와 코사인 유사도가 높은 상위 topn개 검색
+
+        Args:
+            query: (D,) 정규화된 쿼리 벡터
+            topn: 반환 개수
+            exclude_row: 결과에서 제외할 행 (시드 자신)
+
+        Returns:
+            (rows, scores): 점수 내림차순 (topn,) 배열 쌍
+        """
+        query = np.asarray(query, dtype=np.float32)
+        scores = self._dot(query)
+        if exclude_row is not None and exclude_row >= 0:
+            scores[exclude_row] = -np.inf
+
+        candidates = top_n_indices(scores, self._shortlist_size(topn))
+        return self._rescore(candidates, query, topn, exclude_row)
+
+    def search_multi(
+        self,
+        rows: Sequence[int],
+        topn: int,
+        fusion: str = "mean"
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 시드 행을 하나의 쿼리로 결합해 검색 (시드 자신들 제외)
+
+        - mean: 정규화 벡터 평균을 다시 정규화한 쿼리로 GEMV 1회
+        - max / sum: 시드 x 전체 유사도를 GEMM 1회로 계산 후 시드 축으로 결합
+
+        Returns:
+            (rows, scores): 점수 내림차순 배열 쌍
+        """
+        if fusion not in FUSION_MODES:
+            raise ValueError(f"Unknown fusion mode: {fusion}")
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        if len(rows) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        queries = self._gather_exact(rows)
+        if fusion == "mean":
+            query = queries.mean(axis=0)
+            query /= max(float(np.linalg.norm(query)), 1e-12)
+            scores = self._dot(query)
+        else:
+            sims = self._dot_many(queries)  # (B, N)
+            scores = sims.max(axis=0) if fusion == "max" else sims.sum(axis=0)
+
+        scores[rows] = -np.inf
+        top = top_n_indices(scores, min(topn, len(scores) - len(rows)))
+        return top, scores[top]
+
+    def search_batch(
+        self,
+        rows: Sequence[int],
+        topn: int,
+        block_size: int = 64
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        여러 시드 행의 유사 곡을 행렬곱(GEMM)으로 한 번에 검색 (각 시드 자신 제외)
+
+        결과는 시드별 search(vectors[row], topn, exclude_row=row)와 동일
+
+        Args:
+            rows: 시드 행 번호 목록
+            topn: 시드당 반환 개수
+            block_size: 한 번의 GEMM에 넣을 시드 수 (메모리: block_size * N * 4 bytes)
+
+        Returns:
+            시드 순서대로 (rows, scores) 배열 쌍 리스트
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        results: List[Tuple[np.ndarray, np.ndarray]] = []
+        width = min(self._shortlist_size(topn), len(self))
+
+        for start in range(0, len(rows), block_size):
+            block = rows[start:start + block_size]
+            queries = self._gather_exact(block)
+            sims = self._dot_many(queries)  # (B, N)
+            sims[np.arange(len(block)), block] = -np.inf
+
+            if width < sims.shape[1]:
+                part = np.argpartition(-sims, width - 1, axis=1)[:, :width]
+            else:
+                part = np.tile(np.arange(sims.shape[1]), (len(block), 1))
+
+            for i, row in enumerate(block.tolist()):
+                results.append(self._rescore(part[i], queries[i], topn, row))
+
+        return results
+
+    def search_by_id(self, song_id: int, topn: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        song_id 기준 유사 곡 검색 (시드 자신 제외)
+        vocab에 없으면 빈 배열 반환
+        """
+        row = self.row_of(song_id)
+        if row < 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        return self.search(self._gather_exact(np.asarray([row]))[0], topn, exclude_row=row)
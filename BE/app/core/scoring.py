@@ -99,6 +99,126 @@ def get_genre_group(code: Optional[str]) -> str:
     return "UNK"
 
 
+# =============================================================================
+# Stage1.5 Re-ranking (배열 기반)
+# =============================================================================
+
+# 장르 그룹 정수 코드: 0 = UNK, 1~4 = 특수 그룹, 5~ = 일반 그룹 (장르 코드 앞 4자리)
+SPECIAL_GENRE_GROUPS = ["TROT", "CCM", "KIDS", "GUGAK"]
+GENRE_GROUP_UNK = 0
+
+
+class GenreGroupEncoder:
+    """장르 코드 -> 장르 그룹 정수 코드 변환 (그룹 문자열 인턴)"""
+    
+    def __init__(self):
+        self.groups: List[str] = ["UNK"] + SPECIAL_GENRE_GROUPS
+        self._group_index: Dict[str, int] = {g: i for i, g in enumerate(self.groups)}
+        self._genre_cache: Dict[str, int] = {}
+    
+    def encode_group(self, group: str) -> int:
+        """장르 그룹 문자열 -> 정수 코드 (처음 보는 그룹은 새 코드 부여)"""
+        code = self._group_index.get(group)
+        if code is None:
+            code = len(self.groups)
+            self.groups.append(group)
+            self._group_index[group] = code
+        return code
+    
+    def encode_genre(self, genre_code: Optional[str]) -> int:
+        """장르 코드 -> 장르 그룹 정수 코드 (get_genre_group 결과 캐시)"""
+        key = genre_code if isinstance(genre_code, str) else ""
+        code = self._genre_cache.get(key)
+        if code is None:
+            code = self.encode_group(get_genre_group(genre_code))
+            self._genre_cache[key] = code
+        return code
+
+
+def is_special_group_code(codes: np.ndarray) -> np.ndarray:
+    """장르 그룹 코드가 특수 그룹(TROT/CCM/KIDS/GUGAK)인지"""
+    codes = np.asarray(codes)
+    return (codes >= 1) & (codes <= len(SPECIAL_GENRE_GROUPS))
+
+
+def rank_within_group(codes: np.ndarray) -> np.ndarray:
+    """
+    시퀀스 내 같은 코드끼리의 등장 순서 (0부터)
+    예: [a, b, a, a, b] -> [0, 0, 1, 2, 1]
+    """
+    n = len(codes)
+    positions = np.arange(n)
+    order = np.lexsort((positions, codes))
+    sorted_codes = codes[order]
+    is_start = np.ones(n, dtype=bool)
+    is_start[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    group_start = np.maximum.accumulate(np.where(is_start, positions, 0))
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[order] = positions - group_start
+    return ranks
+
+
+def rerank_stage1_5_arrays(
+    scores_cf: np.ndarray,
+    artist_codes: np.ndarray,
+    genre_group_codes: np.ndarray,
+    seed_group_code: int,
+    topk_final: int,
+    max_per_artist_soft: int = 3,
+    max_per_artist_final: int = 2,
+    penalty_per_extra: float = 0.05,
+    offrail_penalty_general: float = 0.008,
+    offrail_penalty_special: float = 0.03
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stage1.5 re-ranking (병렬 배열 버전, apply_stage1_5_reranking과 동일 결과)
+    
+    Args:
+        scores_cf: (N,) CF 점수
+        artist_codes: (N,) 아티스트 정수 코드
+        genre_group_codes: (N,) 장르 그룹 정수 코드 (GenreGroupEncoder)
+        seed_group_code: 시드 장르 그룹 코드
+        (나머지는 apply_stage1_5_reranking과 동일)
+    
+    Returns:
+        (selected, score_final): 입력 인덱스와 최종 점수 (score_final 내림차순, 최대 topk_final개)
+    """
+    n = len(scores_cf)
+    if n == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+    
+    scores_cf = np.asarray(scores_cf, dtype=np.float64)
+    artist_codes = np.asarray(artist_codes)
+    genre_group_codes = np.asarray(genre_group_codes)
+    
+    # 1. 아티스트 페널티 (Soft): score_cf 내림차순(안정 정렬) 내 아티스트별 등장 순서
+    order = np.argsort(-scores_cf, kind="stable")
+    artists = artist_codes[order]
+    extra = np.maximum(rank_within_group(artists) - max_per_artist_soft + 1, 0)
+    score_after_artist = scores_cf[order] - extra * penalty_per_extra
+    
+    # 2. 장르 레일가드
+    if seed_group_code == GENRE_GROUP_UNK:
+        score_after_genre = score_after_artist
+    else:
+        groups = genre_group_codes[order]
+        seed_special = bool(is_special_group_code(seed_group_code))
+        cand_special = is_special_group_code(groups)
+        penalty = np.where(
+            cand_special == seed_special,
+            offrail_penalty_special if seed_special else offrail_penalty_general,
+            offrail_penalty_general * 1.5
+        )
+        penalty[groups == seed_group_code] = 0.0
+        score_after_genre = score_after_artist - penalty
+    
+    # 3. 아티스트 하드컷: score_after_genre 내림차순(안정 정렬) 내 아티스트별 등장 순서 < 최대 곡 수
+    order2 = np.argsort(-score_after_genre, kind="stable")
+    keep = order2[rank_within_group(artists[order2]) < max_per_artist_final][:topk_final]
+    
+    return order[keep], score_after_genre[keep]
+
+
 def apply_artist_penalty_soft(
     candidates: List[Dict],
     max_per_artist_soft: int = 3,
@@ -322,15 +442,35 @@ def compute_hybrid_scores(
         audio_scores.get(sid, np.nan) for sid in song_ids
     ])
     
-    # 3. Min-Max 정규화
-    cf_normalized = minmax_normalize(cf_raw_scores)
-    audio_normalized = minmax_normalize(audio_raw_scores)
+    # 3~5. 정규화 + 결합 + 정렬
+    order, hybrid_scores = compute_hybrid_scores_arrays(cf_raw_scores, audio_raw_scores, alpha, beta)
+    return [(song_ids[i], score) for i, score in zip(order.tolist(), hybrid_scores.tolist())]
+
+
+def compute_hybrid_scores_arrays(
+    cf_scores: np.ndarray,
+    audio_scores: np.ndarray,
+    alpha: float = 0.7,
+    beta: float = 0.3
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    하이브리드 점수 계산 (후보 순서에 맞춘 배열 버전)
     
-    # 4. 하이브리드 점수 계산
-    hybrid_scores = alpha * cf_normalized + beta * audio_normalized
+    Args:
+        cf_scores: (N,) Stage1.5 score_final
+        audio_scores: (N,) 오디오 유사도 (임베딩 없는 후보는 NaN)
+        alpha: CF+메타 점수 가중치
+        beta: 오디오 유사도 가중치
     
-    # 5. 결과 생성 및 정렬
-    results = [(sid, float(score)) for sid, score in zip(song_ids, hybrid_scores)]
-    results.sort(key=lambda x: x[1], reverse=True)
+    Returns:
+        (order, hybrid_scores): 하이브리드 점수 내림차순(동점은 입력 순서) 인덱스와 점수
+    """
+    # Min-Max 정규화
+    cf_normalized = minmax_normalize(cf_scores)
+    audio_normalized = minmax_normalize(audio_scores)
+    
+    # 하이브리드 점수 계산
+    hybrid_scores = alpha * cf_normalized + beta * audio_normalized
     
-    return results
+    order = np.argsort(-hybrid_scores, kind="stable")
+    return order, hybrid_scores[order]
@@ -0,0 +1,400 @@
+"""
+VibeCurator Song Search
+곡명 + 아티스트 검색 인덱스 (문자 trigram posting list)
+
+- 정규화 텍스트(_normalize_text("{곡명} {아티스트}"))의 모든 위치에서 시작하는 문자 trigram을 posting list로 저장
+  텍스트 끝에 종결 문자 2개를 붙여 1~2글자 bigram / unigram도 trigram 키 범위로 조회 (별도 인덱스 없음)
+- 검색 결과 집합은 기존 부분 문자열 검색(query in text)과 동일
+  1~3글자: 키 범위 조회 결과가 곧 정답 집합 / 4글자 이상: trigram posting 교집합 후 부분 문자열 검증
+- 정렬: 곡명 일치 > 곡명 접두 > 아티스트 접두 > 그 외, 같은 등급은 짧은 텍스트 > 카탈로그 순서
+  곡명 일치 / 접두 행은 곡명 정렬 순서의 연속 구간 (이진 탐색), limit개 이상이면 posting 조회 생략
+"""
+
+import logging
+from typing import Callable, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .loaders import ColumnarSearchIndex, MetaRegistry, StringColumn, StringColumnBuilder, _normalize_text
+
+logger = logging.getLogger(__name__)
+
+# 문자 코드 포인트(최대 0x10FFFF) 3개를 21비트씩 int64 키 하나로
+_CHAR_BITS = 21
+_TERMINATOR = "\x00"
+
+# 매칭 등급 (작을수록 우선)
+TIER_NAME_EXACT = 0
+TIER_NAME_PREFIX = 1
+TIER_ARTIST_PREFIX = 2
+TIER_SUBSTRING = 3
+
+# 빌드 시 한 번에 코드 포인트 배열로 변환할 행 수 (임시 메모리 상한)
+_BUILD_CHUNK_ROWS = 200_000
+
+
+def _gram_keys(codepoints: np.ndarray) -> np.ndarray:
+    """(M, 3) 코드 포인트 -> (M,) int64 trigram 키"""
+    cp = codepoints.astype(np.int64)
+    return (cp[:, 0] << (2 * _CHAR_BITS)) | (cp[:, 1] << _CHAR_BITS) | cp[:, 2]
+
+
+def _head_keys(values: List[str]) -> np.ndarray:
+    """문자열 앞 3글자(부족하면 종결 문자로 채움) -> int64 키"""
+    joined = "".join(v[:3].ljust(3, _TERMINATOR) for v in values)
+    codepoints = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).reshape(-1, 3)
+    return _gram_keys(codepoints)
+
+
+def _query_key_range(query: str) -> Tuple[int, int]:
+    """1~3글자 질의 -> 해당 글자로 시작하는 trigram 키 범위 [lo, hi)"""
+    codepoints = [ord(c) for c in query.ljust(3, _TERMINATOR)]
+    lo = (codepoints[0] << (2 * _CHAR_BITS)) | (codepoints[1] << _CHAR_BITS) | codepoints[2]
+    return lo, lo + (1 << (_CHAR_BITS * (3 - len(query))))
+
+
+class SongSearchIndex:
+    """
+    곡 검색 인덱스 (행 = 카탈로그 행)
+
+    trigram posting은 CSR 형태 (정렬된 키 / offsets / 행 번호 int32, 키별 행 오름차순 중복 없음)
+    곡명 일치 / 접두 등급은 곡명 정렬 순서에서, 아티스트 접두 등급은 아티스트 앞 3글자 키와 길이로 계산
+    """
+
+    def __init__(
+        self,
+        song_ids: np.ndarray,
+        texts: StringColumn,
+        text_lens: np.ndarray,
+        name_lens: np.ndarray,
+        artist_lens: np.ndarray,
+        artist_keys: np.ndarray,
+        gram_keys: np.ndarray,
+        gram_offsets: np.ndarray,
+        gram_rows: np.ndarray
+    ):
+        self.song_ids = song_ids
+        self.texts = texts
+        self.text_lens = text_lens
+        self.name_lens = name_lens
+        self.artist_lens = artist_lens
+        self.artist_keys = artist_keys
+        self.gram_keys = gram_keys
+        self.gram_offsets = gram_offsets
+        self.gram_rows = gram_rows
+        # 행별 정렬 키 (SUBSTRING 등급, 텍스트 길이, 행): 질의별 등급만큼 빼서 사용
+        self._static = self._scores(np.arange(len(song_ids), dtype=np.int64), TIER_SUBSTRING)
+        # 곡명 접두 조회용 (곡명 오름차순 행 순서, 같은 곡명은 카탈로그 순서)
+        self._name_order = np.asarray(
+            sorted(range(len(song_ids)), key=self._name_at_row), dtype=np.int32
+        )
+        self._sorted_name_static = self._static[self._name_order]
+
+    def __len__(self) -> int:
+        return int(self.song_ids.shape[0])
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (
+            self.song_ids, self.text_lens, self.name_lens, self.artist_lens, self.artist_keys,
+            self.gram_keys, self.gram_offsets, self.gram_rows, self._static, self._name_order, self._sorted_name_static
+        )
+        return self.texts.nbytes + sum(int(a.nbytes) for a in arrays)
+
+    @classmethod
+    def build(cls, song_ids: np.ndarray, fields: Iterable[Tuple[str, str]]) -> "SongSearchIndex":
+        """
+        (곡명, 아티스트) 행 순서대로 인덱스 생성
+
+        Args:
+            song_ids: 행 -> song_id
+            fields: 행별 (song_name, artist)
+        """
+        texts = StringColumnBuilder()
+        text_lens: List[int] = []
+        name_lens: List[int] = []
+        artist_lens: List[int] = []
+        artist_heads: List[str] = []
+        key_chunks: List[np.ndarray] = []
+        row_chunks: List[np.ndarray] = []
+        chunk: List[str] = []
+
+        def flush(first_row: int) -> None:
+            keys, rows = cls._chunk_postings(chunk, first_row)
+            key_chunks.append(keys)
+            row_chunks.append(rows)
+            chunk.clear()
+
+        row = 0
+        for song_name, artist in fields:
+            song_name = song_name or ""
+            artist = artist or ""
+            text = _normalize_text(f"{song_name} {artist}")
+            name = _normalize_text(song_name)
+            artist_text = _normalize_text(artist)
+            texts.append(text)
+            text_lens.append(len(text))
+            name_lens.append(len(name))
+            artist_lens.append(len(artist_text))
+            artist_heads.append(artist_text)
+            chunk.append(text)
+            row += 1
+            if len(chunk) >= _BUILD_CHUNK_ROWS:
+                flush(row - len(chunk))
+        if chunk:
+            flush(row - len(chunk))
+
+        # 전체 (키, 행) 정렬: 청크가 행 순서이고 stable 정렬이라 키별 행은 오름차순 유지
+        keys = np.concatenate(key_chunks) if key_chunks else np.zeros(0, dtype=np.int64)
+        rows = np.concatenate(row_chunks) if row_chunks else np.zeros(0, dtype=np.int32)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        rows = rows[order]
+        del order
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.zeros(0, dtype=np.int64)
+        gram_offsets = np.append(starts, len(keys)).astype(np.int64)
+
+        index = cls(
+            song_ids=np.asarray(song_ids, dtype=np.int64),
+            texts=texts.build(),
+            text_lens=np.asarray(text_lens, dtype=np.int32),
+            name_lens=np.asarray(name_lens, dtype=np.int32),
+            artist_lens=np.asarray(artist_lens, dtype=np.int32),
+            artist_keys=_head_keys(artist_heads),
+            gram_keys=keys[starts],
+            gram_offsets=gram_offsets,
+            gram_rows=rows
+        )
+        logger.info(
+            f"검색 인덱스 생성: songs={len(index):,}, trigrams={len(index.gram_keys):,}, "
+            f"postings={len(rows):,} ({index.nbytes / 2**20:.1f}MiB)"
+        )
+        return index
+
+    @staticmethod
+    def _chunk_postings(texts: List[str], first_row: int) -> Tuple[np.ndarray, np.ndarray]:
+        """청크 텍스트 -> 행 내 중복을 제거한 (trigram 키, 행) 쌍 (키 오름차순)"""
+        # 텍스트마다 종결 문자 2개: 모든 글자 위치에서 trigram이 시작 (끝부분은 종결 문자로 채워짐)
+        joined = "".join(f"{text}{_TERMINATOR}{_TERMINATOR}" for text in texts)
+        codepoints = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32)
+        if len(codepoints) < 3:
+            # 빈 텍스트 행만 있는 청크 (종결 문자 2개뿐, trigram 없음)
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int32)
+        lens = np.fromiter((len(text) + 2 for text in texts), dtype=np.int64, count=len(texts))
+        starts = np.flatnonzero(codepoints[:-2] != 0)
+        windows = np.lib.stride_tricks.sliding_window_view(codepoints, 3)[starts]
+        keys = _gram_keys(windows)
+        rows = np.repeat(np.arange(first_row, first_row + len(texts), dtype=np.int32), lens)[starts]
+
+        # (키, 행) 정렬 후 행 내 중복 trigram 제거
+        order = np.lexsort((rows, keys))
+        keys = keys[order]
+        rows = rows[order]
+        keep = np.r_[True, (keys[1:] != keys[:-1]) | (rows[1:] != rows[:-1])] if len(keys) else np.zeros(0, dtype=bool)
+        return keys[keep], rows[keep]
+
+    def _postings(self, lo: int, hi: int) -> np.ndarray:
+        """키 범위 [lo, hi)의 posting 행 (키 순서로 이어붙인 그대로, 중복 가능)"""
+        a, b = np.searchsorted(self.gram_keys, [lo, hi])
+        return self.gram_rows[self.gram_offsets[a]:self.gram_offsets[b]]
+
+    def _short_match_rows(self, query: str) -> np.ndarray:
+        """1~3글자 query를 포함하는 행 (오름차순, 키 범위 조회 결과가 곧 정답 집합)"""
+        lo, hi = _query_key_range(query)
+        rows = self._postings(lo, hi)
+        if len(query) == 3:
+            return rows
+        # 1~2글자: 여러 키의 posting 합집합
+        mask = np.zeros(len(self), dtype=bool)
+        mask[rows] = True
+        return np.flatnonzero(mask).astype(np.int32)
+
+    def _candidate_rows(self, query: str) -> np.ndarray:
+        """4글자 이상 query의 후보 행 (모든 trigram을 포함, 부분 문자열 검증 전)"""
+        lists = []
+        for gram in {query[i:i + 3] for i in range(len(query) - 2)}:
+            lo, hi = _query_key_range(gram)
+            rows = self._postings(lo, hi)
+            if len(rows) == 0:
+                return rows
+            lists.append(rows)
+        # 짧은 posting부터 교집합
+        #   후보가 적으면 정렬된 리스트에 searchsorted로 소속 확인, 많으면 행 마스크로 확인
+        lists.sort(key=len)
+        candidates = lists[0]
+        for rows in lists[1:]:
+            if len(candidates) * 16 < len(rows):
+                pos = np.minimum(np.searchsorted(rows, candidates), len(rows) - 1)
+                candidates = candidates[rows[pos] == candidates]
+            else:
+                mask = np.zeros(len(self), dtype=bool)
+                mask[rows] = True
+                candidates = candidates[mask[candidates]]
+            if len(candidates) == 0:
+                break
+        return candidates
+
+    def _scores(self, rows: np.ndarray, tier: int) -> np.ndarray:
+        """정렬 키 (등급, 텍스트 길이, 행)를 int64 하나로"""
+        lens = np.minimum(self.text_lens[rows], (1 << 20) - 1).astype(np.int64)
+        return (np.int64(tier) << 52) | (lens << 32) | rows.astype(np.int64)
+
+    def _text_tier(self, row: int, text: str, query: str) -> int:
+        """검증된 행의 실제 등급 (텍스트는 곡명으로 시작하고 아티스트로 끝남)"""
+        n = len(query)
+        name_len = int(self.name_lens[row])
+        if n <= name_len and text.startswith(query):
+            return TIER_NAME_EXACT if n == name_len else TIER_NAME_PREFIX
+        artist_len = int(self.artist_lens[row])
+        if n <= artist_len and text.startswith(query, len(text) - artist_len):
+            return TIER_ARTIST_PREFIX
+        return TIER_SUBSTRING
+
+    @staticmethod
+    def _top(scores: np.ndarray, limit: int) -> np.ndarray:
+        """정렬 키 상위 limit개 (오름차순)"""
+        if limit <= 0:
+            return scores[:0]
+        if len(scores) > limit:
+            scores = np.partition(scores, limit - 1)[:limit]
+        return np.sort(scores)
+
+    @staticmethod
+    def _rows(scores: np.ndarray) -> np.ndarray:
+        """정렬 키 -> 행 번호"""
+        return (scores & 0xFFFFFFFF).astype(np.int64)
+
+    def _name_at_row(self, row: int) -> str:
+        """행의 정규화 곡명 (텍스트 앞부분)"""
+        return self.texts[row][:self.name_lens[row]]
+
+    def _name_bisect(self, lo: int, hi: int, before: Callable[[str], bool]) -> int:
+        """곡명 정렬 순서 [lo, hi)에서 before(곡명)이 처음 거짓이 되는 위치"""
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if before(self._name_at_row(int(self._name_order[mid]))):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _name_head(self, query: str, limit: int) -> Tuple[np.ndarray, int]:
+        """
+        곡명 일치 / 곡명 접두 행의 상위 limit개 정렬 키와 곡명 접두 행 수
+
+        곡명 정렬 순서에서 곡명이 query로 시작하는 행은 연속 구간 [a, b), 그 앞부분 [a, e)가 곡명 일치
+        """
+        n = len(query)
+        a = self._name_bisect(0, len(self), lambda name: name < query)
+        b = self._name_bisect(a, len(self), lambda name: name[:n] <= query)
+        e = self._name_bisect(a, b, lambda name: len(name) == n)
+        exact = self._top(self._sorted_name_static[a:e], limit)
+        prefix = self._top(self._sorted_name_static[e:b], limit - len(exact))
+        head = np.concatenate([
+            exact - (np.int64(TIER_SUBSTRING - TIER_NAME_EXACT) << 52),
+            prefix - (np.int64(TIER_SUBSTRING - TIER_NAME_PREFIX) << 52)
+        ])
+        return head, b - a
+
+    @classmethod
+    def _without(cls, rows: np.ndarray, head: np.ndarray) -> np.ndarray:
+        """오름차순 행 배열에서 head 정렬 키의 행 제거 (head 행은 모두 rows에 포함)"""
+        return np.delete(rows, np.searchsorted(rows, cls._rows(head)))
+
+    def _search_long(self, query: str, head: np.ndarray, limit: int) -> np.ndarray:
+        """
+        4글자 이상, 곡명 접두 외 행: 후보를 하한 정렬 키 순으로 보며 필요한 만큼만 부분 문자열 검증
+
+        하한 등급은 아티스트 앞 3글자 키와 길이로만 계산 (실제 정렬 키 >= 하한)
+        하한 오름차순으로 limit의 배수씩 부분 정렬해 검증하고,
+        검증된 상위 limit개가 다음 후보의 하한보다 작거나 같으면 중단
+        """
+        candidates = self._without(self._candidate_rows(query), head)
+        if len(candidates) == 0:
+            return np.zeros(0, dtype=np.int64)
+        n = len(query)
+        lo, _ = _query_key_range(query[:3])
+        artist_prefix = (self.artist_keys[candidates] == lo) & (self.artist_lens[candidates] >= n)
+        bounds = self._static[candidates]
+        bounds[artist_prefix] -= np.int64(TIER_SUBSTRING - TIER_ARTIST_PREFIX) << 52
+
+        verified: List[int] = []
+        step = 4 * limit
+        while len(bounds):
+            if len(bounds) > step:
+                bounds = np.partition(bounds, step - 1)
+                chunk, bounds = np.sort(bounds[:step]), bounds[step:]
+            else:
+                chunk, bounds = np.sort(bounds), bounds[:0]
+            for bound in chunk.tolist():
+                if len(verified) >= limit:
+                    verified.sort()
+                    del verified[limit:]
+                    if verified[-1] <= bound:
+                        return np.asarray(verified, dtype=np.int64)
+                row = bound & 0xFFFFFFFF
+                text = self.texts[row]
+                if query in text:
+                    tier = self._text_tier(row, text, query)
+                    verified.append((tier << 52) | (bound & ((1 << 52) - 1)))
+            step *= 4
+        return self._top(np.asarray(verified, dtype=np.int64), limit)
+
+    def _search_short(self, query: str, head: np.ndarray, limit: int) -> np.ndarray:
+        """1~3글자, 곡명 접두 외 행: 전체 매칭 집합에서 아티스트 접두 > 부분 문자열 순 상위 limit개"""
+        rows = self._without(self._short_match_rows(query), head)
+        lo, hi = _query_key_range(query)
+        artist_keys = self.artist_keys[rows]
+        scores = self._static[rows]
+        scores[(artist_keys >= lo) & (artist_keys < hi)] -= np.int64(TIER_SUBSTRING - TIER_ARTIST_PREFIX) << 52
+        return self._top(scores, limit)
+
+    def search_rows(self, query: str, limit: int) -> np.ndarray:
+        """
+        검색 (정규화된 query 기준, 결과 행 번호)
+
+        결과 집합은 `query in text`와 동일, 순서는 매칭 등급 > 텍스트 길이 > 카탈로그 순서
+        """
+        if limit <= 0:
+            return np.zeros(0, dtype=np.int64)
+        if not query:
+            # 빈 질의는 모든 곡과 매칭 (이전과 같이 카탈로그 순서)
+            return np.arange(min(limit, len(self)), dtype=np.int64)
+
+        # 곡명 일치 / 접두 행이 limit개 이상이면 그 안에서 순위 결정 (posting 조회 불필요)
+        head, name_matches = self._name_head(query, limit)
+        if name_matches >= limit:
+            return self._rows(head)
+        search_rest = self._search_long if len(query) > 3 else self._search_short
+        rest = search_rest(query, head, limit - len(head))
+        return self._rows(np.concatenate([head, rest]))
+
+    def search(self, query: str, limit: int) -> List[int]:
+        """검색 (원본 질의, 결과 song_id 목록)"""
+        rows = self.search_rows(_normalize_text(query), limit)
+        return self.song_ids[rows].tolist()
+
+
+def meta_fields(meta: MetaRegistry) -> Iterable[Tuple[str, str]]:
+    """메타 레지스트리 행 순서(song_ids)의 (song_name, artist)"""
+    if isinstance(meta.search_index, ColumnarSearchIndex):
+        return meta.search_index.fields()
+    songs = meta.songs
+    return ((songs[sid].song_name, songs[sid].artist) for sid in meta.song_ids)
+
+
+def build_search_index(meta: MetaRegistry) -> SongSearchIndex:
+    """메타 레지스트리 -> 검색 인덱스 (행 = song_ids 순서)"""
+    return SongSearchIndex.build(np.asarray(meta.song_ids, dtype=np.int64), meta_fields(meta))
+
+
+def scan_search(texts: Sequence[str], query: str, limit: int) -> List[int]:
+    """선형 부분 문자열 검색 (이전 방식, 벤치마크 / 검증 기준, 결과 행 번호 카탈로그 순서)"""
+    query = _normalize_text(query)
+    rows = []
+    for row, text in enumerate(texts):
+        if query in text:
+            rows.append(row)
+            if len(rows) >= limit:
+                break
+    return rows
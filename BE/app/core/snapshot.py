@@ -0,0 +1,444 @@
+"""
+VibeCurator Catalog Snapshot
+메타 컬럼 / 문자열 아레나 / Item2Vec 벡터 / 오디오 임베딩 / id 맵을 하나의 바이너리 파일로 묶은 스냅샷
+
+파일 형식:
+    [0:8)    magic b"VCSNAP01"
+    [8:16)   헤더 길이 (uint64 little-endian)
+    [16:..)  JSON 헤더 {"format_version", "created_at", "engine_version", "audio_model",
+                         "cf_vocab_size", "groups", "sections": {name: {dtype, shape, offset}}}
+    이후     섹션 배열 (64바이트 정렬, C-order)
+
+로드는 헤더만 읽고 섹션은 np.memmap(mode='r')으로 열기만 함 (파싱 없음, 페이지 폴트로 필요한 부분만 읽음)
+SongMeta는 조회 시점에 아레나에서 생성
+
+공유 모드(attach_shared_snapshot): 파일 잠금을 먼저 잡은 워커가 소스에서 스냅샷을 발행하고
+나머지 워커는 같은 파일을 memmap으로 attach (워커 수와 무관하게 물리 메모리 1벌)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+import numpy as np
+
+from .loaders import (
+    AudioBundle,
+    CatalogColumns,
+    ColumnarSearchIndex,
+    ColumnarSongs,
+    MetaRegistry,
+    StringColumn,
+    build_catalog_columns,
+    load_audio_embeddings,
+    load_audio_song_meta,
+    load_item2vec_model,
+    load_song_meta_melon
+)
+from .retrieval import ItemVectorIndex
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"VCSNAP01"
+SNAPSHOT_FORMAT_VERSION = 1
+_ALIGN = 64
+
+# 메타 그룹별 문자열 컬럼 (행 단위) / 코드 테이블
+_ROW_STRINGS = ("song_name", "artist", "genre")
+_CODE_TABLES = ("artist_keys", "main_genres", "genre_groups")
+
+
+def _encode_strings(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """문자열 리스트 -> (offsets int64 (M+1,), utf-8 바이트 uint8)"""
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _meta_sections(group: str, registry: MetaRegistry) -> Dict[str, np.ndarray]:
+    """MetaRegistry -> 스냅샷 섹션 배열"""
+    catalog = registry.catalog
+    if catalog is None:
+        catalog = build_catalog_columns(registry.songs, registry.song_ids)
+    songs = [registry.songs[sid] for sid in registry.song_ids]
+
+    sections = {
+        f"{group}.song_ids": catalog.song_ids,
+        f"{group}.sorted_ids": catalog.sorted_ids,
+        f"{group}.sorted_rows": catalog.sorted_rows,
+        f"{group}.artist_codes": catalog.artist_codes,
+        f"{group}.main_genre_codes": catalog.main_genre_codes,
+        f"{group}.genre_group_codes": catalog.genre_group_codes,
+        f"{group}.issue_years": catalog.issue_years,
+    }
+    columns = {
+        "song_name": [m.song_name for m in songs],
+        "artist": [m.artist for m in songs],
+        "genre": [m.genre or "" for m in songs],
+        "artist_keys": list(catalog.artist_keys),
+        "main_genres": list(catalog.main_genres),
+        "genre_groups": list(catalog.genre_groups),
+    }
+    for name, values in columns.items():
+        offsets, data = _encode_strings(values)
+        sections[f"{group}.{name}.offsets"] = offsets
+        sections[f"{group}.{name}.data"] = data
+    return sections
+
+
+def build_snapshot(
+    path: str,
+    meta: MetaRegistry,
+    meta_audio: Optional[MetaRegistry] = None,
+    cf_index: Optional[ItemVectorIndex] = None,
+    cf_vocab_size: int = 0,
+    audio: Optional[AudioBundle] = None,
+    engine_version: str = "",
+    audio_model: str = ""
+) -> int:
+    """
+    스냅샷 파일 생성 (임시 파일에 쓴 뒤 원자적 교체)
+
+    Args:
+        path: 출력 경로
+        meta: 메인 메타 (song_meta.json)
+        meta_audio: 오디오 메타 (선택)
+        cf_index: CF 검색 인덱스 (보통 vocab ∩ 메타, L2 정규화 float32)
+        cf_vocab_size: 전체 Item2Vec vocab 크기 (health 표시용)
+        audio: 오디오 임베딩 번들 (float32)
+
+    Returns:
+        파일 크기 (bytes)
+    """
+    sections: Dict[str, np.ndarray] = {}
+    groups = ["meta"]
+    sections.update(_meta_sections("meta", meta))
+    if meta_audio is not None:
+        groups.append("meta_audio")
+        sections.update(_meta_sections("meta_audio", meta_audio))
+    if cf_index is not None:
+        sections["cf.song_ids"] = cf_index.song_ids
+        sections["cf.vectors"] = np.asarray(cf_index.vectors, dtype=np.float32)
+    if audio is not None:
+        sections["audio.song_ids"] = audio.song_ids
+        sections["audio.sorted_ids"] = audio.sorted_ids
+        sections["audio.sorted_rows"] = audio.sorted_rows
+        sections["audio.vectors"] = np.asarray(audio.embeddings, dtype=np.float32)
+
+    # 섹션 오프셋은 헤더 뒤부터 배치하므로 헤더 길이를 고정점까지 반복 계산
+    layout: Dict[str, Dict[str, Any]] = {}
+    header_len = 0
+    while True:
+        offset = _align(16 + header_len)
+        for name, arr in sections.items():
+            arr = np.ascontiguousarray(arr)
+            layout[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+            offset = _align(offset + arr.nbytes)
+        header = json.dumps({
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "created_at": int(time.time()),
+            "engine_version": engine_version,
+            "audio_model": audio_model,
+            "cf_vocab_size": int(cf_vocab_size),
+            "groups": groups,
+            "sections": layout
+        }).encode("utf-8")
+        if len(header) == header_len:
+            break
+        header_len = len(header)
+
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        for name, arr in sections.items():
+            f.seek(layout[name]["offset"])
+            f.write(np.ascontiguousarray(arr).tobytes())
+        f.truncate(offset)
+    os.replace(tmp, out)
+
+    size = out.stat().st_size
+    logger.info(f"스냅샷 저장 완료: {out} ({size / 2**20:.1f}MiB, 섹션 {len(sections)}개)")
+    return size
+
+
+def build_snapshot_from_sources(
+    path: str,
+    song_meta_path: str,
+    audio_meta_path: str,
+    item2vec_path: str,
+    audio_model: str,
+    myna_path: str,
+    cnn_path: str,
+    engine_version: str = ""
+) -> int:
+    """
+    원본 소스(메타 JSON / Word2Vec / 오디오 .npz)를 로드해 스냅샷 생성
+
+    Args:
+        path: 출력 경로
+        song_meta_path: song_meta.json (필수)
+        audio_meta_path: 오디오 메타 JSON (빈 문자열이면 생략)
+        item2vec_path: Item2Vec 모델 (없으면 CF 섹션 생략)
+        audio_model / myna_path / cnn_path: 오디오 임베딩 (없으면 오디오 섹션 생략)
+
+    Returns:
+        파일 크기 (bytes)
+    """
+    meta = load_song_meta_melon(song_meta_path, demo_mode=False)
+
+    meta_audio = None
+    if audio_meta_path:
+        meta_audio = load_audio_song_meta(audio_meta_path, demo_mode=False)
+
+    cf_index = None
+    cf_vocab_size = 0
+    model = load_item2vec_model(item2vec_path)
+    if model is not None:
+        full_index = ItemVectorIndex.from_keyed_vectors(model)
+        cf_vocab_size = len(full_index)
+        cf_index = full_index.restrict_to(np.asarray(meta.song_ids, dtype=np.int64))
+        del model
+    else:
+        logger.warning("Item2Vec 없이 스냅샷 생성 (CF 섹션 없음)")
+
+    audio = load_audio_embeddings(audio_model=audio_model, myna_path=myna_path, cnn_path=cnn_path)
+    if audio is None:
+        logger.warning("오디오 임베딩 없이 스냅샷 생성 (오디오 섹션 없음)")
+
+    return build_snapshot(
+        path,
+        meta=meta,
+        meta_audio=meta_audio,
+        cf_index=cf_index,
+        cf_vocab_size=cf_vocab_size,
+        audio=audio,
+        engine_version=engine_version,
+        audio_model=audio_model
+    )
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class CatalogSnapshot:
+    """
+    memmap으로 연 스냅샷
+
+    섹션 배열은 읽기 전용 memmap이므로 같은 파일을 여는 워커들이 페이지 캐시를 공유함
+    """
+
+    def __init__(self, path: str, header: Dict[str, Any]):
+        self.path = path
+        self.header = header
+        self.format_version = int(header["format_version"])
+        self.engine_version = header.get("engine_version", "")
+        self.audio_model = header.get("audio_model", "")
+        self.cf_vocab_size = int(header.get("cf_vocab_size", 0))
+        self._sections: Dict[str, Dict[str, Any]] = header["sections"]
+
+    def has(self, name: str) -> bool:
+        return name in self._sections
+
+    def array(self, name: str) -> np.ndarray:
+        """섹션 memmap (mode='r')"""
+        spec = self._sections[name]
+        shape = tuple(spec["shape"])
+        if int(np.prod(shape)) == 0:
+            return np.empty(shape, dtype=np.dtype(spec["dtype"]))
+        return np.memmap(self.path, dtype=np.dtype(spec["dtype"]), mode="r", offset=spec["offset"], shape=shape)
+
+    def _strings(self, group: str, name: str) -> StringColumn:
+        return StringColumn(self.array(f"{group}.{name}.offsets"), self.array(f"{group}.{name}.data"))
+
+    def meta_registry(self, group: str = "meta") -> Optional[MetaRegistry]:
+        """메타 그룹 -> MetaRegistry (songs / search_index는 지연 조회)"""
+        if group not in self.header.get("groups", []):
+            return None
+        catalog = CatalogColumns(
+            song_ids=self.array(f"{group}.song_ids"),
+            artist_codes=self.array(f"{group}.artist_codes"),
+            main_genre_codes=self.array(f"{group}.main_genre_codes"),
+            genre_group_codes=self.array(f"{group}.genre_group_codes"),
+            issue_years=self.array(f"{group}.issue_years"),
+            artist_keys=self._strings(group, "artist_keys"),
+            main_genres=self._strings(group, "main_genres"),
+            genre_groups=self._strings(group, "genre_groups"),
+            sorted_ids=self.array(f"{group}.sorted_ids"),
+            sorted_rows=self.array(f"{group}.sorted_rows")
+        )
+        strings = {name: self._strings(group, name) for name in _ROW_STRINGS}
+        return MetaRegistry(
+            songs=ColumnarSongs(catalog, strings),
+            song_ids=catalog.song_ids,
+            search_index=ColumnarSearchIndex(catalog.song_ids, strings),
+            catalog=catalog
+        )
+
+    def cf_index(self) -> Optional[ItemVectorIndex]:
+        """CF 검색 인덱스 (정규화 벡터 memmap)"""
+        if not self.has("cf.vectors"):
+            return None
+        return ItemVectorIndex(self.array("cf.song_ids"), self.array("cf.vectors"), normalized=True)
+
+    def audio_bundle(self) -> Optional[AudioBundle]:
+        """오디오 임베딩 번들 (정규화 임베딩 memmap)"""
+        if not self.has("audio.vectors"):
+            return None
+        return AudioBundle(
+            song_ids=self.array("audio.song_ids"),
+            embeddings=self.array("audio.vectors"),
+            model_type=self.audio_model,
+            sorted_ids=self.array("audio.sorted_ids"),
+            sorted_rows=self.array("audio.sorted_rows")
+        )
+
+
+def load_snapshot(path: str, audio_model: str = "") -> Optional[CatalogSnapshot]:
+    """
+    스냅샷 헤더 로드 (섹션은 memmap으로 지연 로드)
+
+    Args:
+        path: 스냅샷 경로
+        audio_model: 현재 설정의 오디오 모델 (다르면 경고)
+
+    Returns:
+        CatalogSnapshot 또는 None (경로 미설정 / 파일 없음 / 형식 불일치)
+    """
+    if not path:
+        return None
+
+    file_path = Path(path)
+    if not file_path.exists():
+        logger.warning(f"스냅샷 파일 없음: {path}")
+        return None
+
+    try:
+        with open(file_path, "rb") as f:
+            magic = f.read(len(SNAPSHOT_MAGIC))
+            if magic != SNAPSHOT_MAGIC:
+                logger.error(f"스냅샷 형식 아님 (magic={magic!r}): {path}")
+                return None
+            header_len = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            header = json.loads(f.read(header_len).decode("utf-8"))
+
+        if int(header.get("format_version", 0)) != SNAPSHOT_FORMAT_VERSION:
+            logger.error(
+                f"스냅샷 버전 불일치: {header.get('format_version')} (지원: {SNAPSHOT_FORMAT_VERSION})"
+            )
+            return None
+
+        snapshot = CatalogSnapshot(str(file_path), header)
+        if audio_model and snapshot.audio_model and snapshot.audio_model != audio_model:
+            logger.warning(f"스냅샷 오디오 모델({snapshot.audio_model})이 설정({audio_model})과 다름")
+        logger.info(
+            f"스냅샷 로드 완료 (mmap): {path} "
+            f"(v{snapshot.format_version}, engine={snapshot.engine_version}, 섹션 {len(header['sections'])}개)"
+        )
+        return snapshot
+    except Exception as e:
+        logger.error(f"스냅샷 로드 실패: {e}")
+        return None
+
+
+def _source_fingerprint(sources: Dict[str, str]) -> str:
+    """스냅샷 소스 설정 + 소스 파일 (크기, mtime) 해시 (소스가 바뀌면 다른 스냅샷 파일)"""
+    h = hashlib.sha1()
+    for key, value in sorted(sources.items()):
+        h.update(f"{key}={value}".encode("utf-8"))
+        if key.endswith("_path") and value:
+            try:
+                st = os.stat(value)
+                h.update(f"|{st.st_size}|{st.st_mtime_ns}".encode("utf-8"))
+            except OSError:
+                h.update(b"|missing")
+    return h.hexdigest()[:16]
+
+
+def _publish_snapshot(target: Path, sources: Dict[str, str]) -> None:
+    """
+    별도 로더 프로세스(python -m app.cli build-snapshot)로 스냅샷 발행 (실패 시 예외)
+    fingerprint에 들어간 소스를 모두 인자로 넘김 (리로드 overrides로 바꾼 값도 로더 프로세스 환경변수와 무관하게 반영)
+    """
+    package_root = Path(__file__).resolve().parents[2]
+    cli_module = f"{__package__.rsplit('.', 1)[0]}.cli"
+    subprocess.run(
+        [
+            sys.executable, "-m", cli_module, "build-snapshot",
+            "--out", str(target),
+            "--song-meta", sources.get("song_meta_path", ""),
+            "--audio-meta", sources.get("audio_meta_path", ""),
+            "--item2vec", sources.get("item2vec_path", ""),
+            "--audio-model", sources.get("audio_model", "myna"),
+            "--myna", sources.get("myna_path", ""),
+            "--cnn", sources.get("cnn_path", ""),
+            "--engine-version", sources.get("engine_version", ""),
+        ],
+        cwd=package_root,
+        check=True
+    )
+
+
+def attach_shared_snapshot(directory: str, sources: Dict[str, str]) -> Optional[CatalogSnapshot]:
+    """
+    워커 간 공유 스냅샷 attach (없으면 발행)
+
+    {directory}/catalog-{fingerprint}.snap이 있으면 그대로 memmap, 없으면 파일 잠금을 잡은 워커가
+    별도 로더 프로세스(build-snapshot CLI)로 발행하고 나머지 워커는 잠금 해제를 기다렸다가 attach
+    (로더 프로세스가 끝나면 파싱에 쓴 힙은 반환되므로 발행한 워커도 다른 워커와 같은 상주 형태)
+    directory를 /dev/shm 아래로 두면 디스크 없이 공유 메모리에 상주
+
+    Args:
+        directory: 공유 디렉터리
+        sources: 스냅샷 소스 설정 (song_meta_path / audio_meta_path / item2vec_path / audio_model /
+                 myna_path / cnn_path / engine_version, 파일 경로는 크기 / mtime까지 fingerprint에 포함)
+
+    Returns:
+        CatalogSnapshot 또는 None (잠금 미지원 / 발행 실패, 호출 측은 워커 전용 로드로 대체)
+    """
+    if not directory:
+        return None
+    if fcntl is None:
+        logger.warning("파일 잠금(fcntl) 미지원 플랫폼: 공유 스냅샷 비활성화")
+        return None
+
+    shared_dir = Path(directory)
+    target = shared_dir / f"catalog-{_source_fingerprint(sources)}.snap"
+    try:
+        shared_dir.mkdir(parents=True, exist_ok=True)
+        with open(shared_dir / ".lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if not target.exists():
+                    logger.info(f"공유 스냅샷 발행 중: {target}")
+                    start = time.perf_counter()
+                    _publish_snapshot(target, sources)
+                    logger.info(f"공유 스냅샷 발행 완료: {time.perf_counter() - start:.1f}s")
+                    # 이전 소스의 스냅샷 정리 (이미 매핑한 프로세스는 unlink 후에도 계속 사용 가능)
+                    for stale in shared_dir.glob("catalog-*.snap"):
+                        if stale != target:
+                            stale.unlink(missing_ok=True)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+    except Exception as e:
+        logger.error(f"공유 스냅샷 발행 실패: {e}")
+        return None
+
+    return load_snapshot(str(target), sources.get("audio_model", ""))
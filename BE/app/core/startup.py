@@ -0,0 +1,772 @@
+"""
+VibeCurator Resource Startup
+리소스 병렬 로드 (스레드 풀) + 리소스별 진행 상황 / 준비 상태 추적 + 무중단 핫 리로드
+
+- 스냅샷 → (메타 / 오디오 메타 / Item2Vec / CF 이웃 / 오디오 임베딩 / ANN / Redis 병렬) → 엔진 순서
+- 앱은 로드 중에도 요청을 받음: /health는 진행 상황, /ready와 추천 API는 엔진 준비 전까지 503
+- 리로드는 새 세대를 별도 네임스페이스에 로드한 뒤 app.state에 한 번에 교체 (진행 중 요청은 이전 엔진으로 완료)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from .config import Settings, get_settings
+from .loaders import (
+    load_audio_song_meta,
+    load_song_meta_melon,
+    load_item2vec_model,
+    keyed_vector_counts,
+    load_audio_embeddings
+)
+from .neighbors import load_neighbor_table
+from .ann import load_ann_index
+from .quantization import load_quantized_index
+from .snapshot import attach_shared_snapshot, load_snapshot
+from .engine import RecommendationEngine
+from .search import build_search_index
+from .autocomplete import build_autocomplete_index, load_search_prior
+from .cache import CacheRefresher, LocalCache, RedisCache, SingleFlight
+from .executor import EngineExecutor
+from .warmup import format_progress, warm_cache, warmup_seeds
+
+logger = logging.getLogger(__name__)
+
+# 리포지토리 루트 (기본 데이터 경로 기준)
+_REPO_ROOT = Path(__file__).parent.parent.parent.parent
+
+RESOURCE_NAMES = (
+    "snapshot",
+    "meta_full",
+    "meta_audio",
+    "item2vec",
+    "cf_neighbors",
+    "audio",
+    "ann",
+    "redis",
+    "engine",
+    "autocomplete",
+)
+
+# 실패해도 경고만 남기는 보조 리소스
+_OPTIONAL_RESOURCES = frozenset({"meta_audio", "autocomplete"})
+
+# 한 세대(generation)를 이루는 app.state 속성 (핫 리로드 시 함께 교체)
+SERVING_ATTRS = (
+    "config",
+    "snapshot",
+    "meta_full",
+    "meta_full_loaded",
+    "meta_audio",
+    "meta_audio_loaded",
+    "cf_index",
+    "item2vec_loaded",
+    "neighbor_table",
+    "audio_bundle",
+    "audio_loaded",
+    "cf_ann_index",
+    "audio_ann_index",
+    "redis_cache",
+    "local_cache",
+    "single_flight",
+    "cache_refresher",
+    "engine",
+    "engine_executor",
+    "loading",
+)
+
+# 추천 결과에 영향을 주는 설정 (바뀌었는데 ENGINE_VERSION이 같으면 캐시 키가 겹침)
+_ENGINE_SETTINGS = (
+    "AUDIO_MODEL",
+    "CANDIDATE_TOPN",
+    "ALPHA_AUDIO",
+    "MAX_PER_ARTIST_SOFT",
+    "MAX_PER_ARTIST_FINAL",
+    "PENALTY_PER_EXTRA",
+    "OFFRAIL_PENALTY_GENERAL",
+    "OFFRAIL_PENALTY_SPECIAL",
+    "STAGE3_CANDIDATES",
+    "ANN_MODE",
+    "ANN_NLIST",
+    "ANN_NPROBE",
+    "ANN_CF_INDEX_PATH",
+    "ANN_AUDIO_INDEX_PATH",
+    "DEMO_MODE",
+    "SONG_META_PATH",
+    "ITEM2VEC_PATH",
+    "AUDIO_EMB_MYNA_PATH",
+    "AUDIO_EMB_CNN_PATH",
+    "SNAPSHOT_PATH",
+    "ITEM2VEC_QUANT_PATH",
+    "AUDIO_EMB_QUANT_PATH",
+    "EMB_QUANT_RESCORE",
+    "CF_NEIGHBORS_PATH",
+)
+
+
+@dataclass
+class ResourceStatus:
+    """리소스 1개의 로드 상태 (pending / loading / loaded / skipped / failed)"""
+    name: str
+    status: str = "pending"
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def elapsed_sec(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return round(end - self.started_at, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"status": self.status, "elapsed_sec": self.elapsed_sec, "error": self.error}
+
+
+class LoadingState:
+    """
+    리소스별 로드 진행 상황 + 엔진 준비 여부
+
+    phase: loading (로드 중) / ready (엔진 준비 완료) / failed (엔진 없이 종료)
+    필드는 단순 대입으로만 갱신하므로 (로더 스레드 포함) 잠금 없이 읽음
+    """
+
+    def __init__(self):
+        self.resources: Dict[str, ResourceStatus] = {name: ResourceStatus(name) for name in RESOURCE_NAMES}
+        self.phase = "loading"
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.phase == "ready"
+
+    @property
+    def finished(self) -> bool:
+        return self.phase != "loading"
+
+    @property
+    def elapsed_sec(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return round(end - self.started_at, 3)
+
+    def begin(self, name: str) -> None:
+        self.resources[name].status = "loading"
+        self.resources[name].started_at = time.perf_counter()
+
+    def finish(self, name: str, loaded: bool, error: Optional[str] = None) -> None:
+        resource = self.resources[name]
+        resource.finished_at = time.perf_counter()
+        if error is not None:
+            resource.status = "failed"
+            resource.error = error
+        else:
+            resource.status = "loaded" if loaded else "skipped"
+
+    def complete(self, ready: bool) -> None:
+        self.phase = "ready" if ready else "failed"
+        self.finished_at = time.perf_counter()
+
+    def progress(self) -> Dict[str, Dict[str, Any]]:
+        """리소스별 {status, elapsed_sec, error}"""
+        return {name: resource.to_dict() for name, resource in self.resources.items()}
+
+
+def _call_started(loading: LoadingState, name: str, fn: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+    """스레드에서 실제 실행이 시작될 때 loading 표시 (풀 대기 중에는 pending 유지)"""
+    loading.begin(name)
+    return fn(*args)
+
+
+def init_resource_state(state: Any) -> None:
+    """로드 전 app.state 기본값 (로드 중에도 /health 등이 None으로 읽을 수 있게)"""
+    state.snapshot = None
+    state.meta_full = None
+    state.meta_full_loaded = False
+    state.meta_audio = None
+    state.meta_audio_loaded = False
+    state.cf_index = None
+    state.item2vec_loaded = False
+    state.neighbor_table = None
+    state.audio_bundle = None
+    state.audio_loaded = False
+    state.cf_ann_index = None
+    state.audio_ann_index = None
+    state.redis_cache = None
+    state.local_cache = None
+    state.single_flight = None
+    state.cache_refresher = None
+    state.engine = None
+    state.engine_executor = None
+    state.loading = LoadingState()
+
+
+def resolve_meta_paths(config: Settings) -> Tuple[str, str]:
+    """메타 경로 (미설정 시 기본 경로 시도)"""
+    meta_full_path = config.SONG_META_PATH
+    if not meta_full_path:
+        default_path = _REPO_ROOT / "melon-dataset-excepttar" / "song_meta.json"
+        if default_path.exists():
+            meta_full_path = str(default_path)
+            logger.info(f"Using default song_meta path: {meta_full_path}")
+
+    meta_audio_path = config.SONG_META_AUDIO_PATH
+    if not meta_audio_path:
+        default_path = _REPO_ROOT / "recommend_model" / "audio_embedding_songs_metadata.json"
+        if default_path.exists():
+            meta_audio_path = str(default_path)
+            logger.info(f"Using default audio meta path: {meta_audio_path}")
+
+    return meta_full_path, meta_audio_path
+
+
+def _load_catalog_snapshot(config: Settings, meta_full_path: str, meta_audio_path: str) -> Optional[Any]:
+    """
+    카탈로그 스냅샷 (설정 시 메타 / Item2Vec / 오디오 임베딩을 파싱 없이 memmap으로 사용)
+    SNAPSHOT_PATH: 미리 빌드한 파일, SHARED_SNAPSHOT_DIR: 첫 워커가 발행하고 나머지 워커가 attach
+    """
+    snapshot = load_snapshot(config.SNAPSHOT_PATH, config.AUDIO_MODEL)
+    if snapshot is None and config.SHARED_SNAPSHOT_DIR and not config.DEMO_MODE:
+        snapshot = attach_shared_snapshot(config.SHARED_SNAPSHOT_DIR, {
+            "song_meta_path": meta_full_path,
+            "audio_meta_path": meta_audio_path,
+            "item2vec_path": config.ITEM2VEC_PATH,
+            "audio_model": config.AUDIO_MODEL,
+            "myna_path": config.AUDIO_EMB_MYNA_PATH,
+            "cnn_path": config.AUDIO_EMB_CNN_PATH,
+            "engine_version": config.ENGINE_VERSION
+        })
+    return snapshot
+
+
+def _with_search_index(meta: Optional[Any]) -> Optional[Any]:
+    """서빙 메타에 곡 검색 인덱스 부착 (/search)"""
+    if meta is not None:
+        meta.search = build_search_index(meta)
+    return meta
+
+
+def _load_meta_full(config: Settings, snapshot: Optional[Any], path: str) -> Optional[Any]:
+    """song_meta.json (CF 후보 필터링 / 검색용, 필수)"""
+    if snapshot is not None:
+        return _with_search_index(snapshot.meta_registry("meta"))
+    return _with_search_index(load_song_meta_melon(path, config.DEMO_MODE))
+
+
+def _load_meta_audio(config: Settings, snapshot: Optional[Any], path: str) -> Optional[Any]:
+    """audio_embedding_songs_metadata.json (선택, 보조용)"""
+    meta_audio = snapshot.meta_registry("meta_audio") if snapshot is not None else None
+    if meta_audio is None:
+        meta_audio = load_audio_song_meta(path, config.DEMO_MODE)
+    return meta_audio
+
+
+def _load_item2vec(config: Settings, snapshot: Optional[Any]) -> Tuple[Optional[Any], Optional[Any]]:
+    """
+    Item2Vec 벡터 (양자화 CF 벡터 > 스냅샷 > KeyedVectors 순, 앞의 것이 있으면 KeyedVectors 로드 생략)
+
+    Returns:
+        (cf_index, KeyedVectors) - 둘 중 하나만 채워짐
+    """
+    cf_index = load_quantized_index(config.ITEM2VEC_QUANT_PATH, config.EMB_QUANT_RESCORE)
+    if cf_index is None and snapshot is not None:
+        cf_index = snapshot.cf_index()
+    if cf_index is not None:
+        return cf_index, None
+    return None, load_item2vec_model(config.ITEM2VEC_PATH)
+
+
+def _load_audio(config: Settings, snapshot: Optional[Any]) -> Optional[Any]:
+    """오디오 임베딩 (양자화 경로가 없으면 스냅샷 우선)"""
+    if snapshot is not None and not config.AUDIO_EMB_QUANT_PATH:
+        bundle = snapshot.audio_bundle()
+        if bundle is not None:
+            return bundle
+    return load_audio_embeddings(
+        audio_model=config.AUDIO_MODEL,
+        myna_path=config.AUDIO_EMB_MYNA_PATH,
+        cnn_path=config.AUDIO_EMB_CNN_PATH,
+        quant_path=config.AUDIO_EMB_QUANT_PATH,
+        rescore_full=config.EMB_QUANT_RESCORE
+    )
+
+
+def _load_ann(config: Settings) -> Optional[Tuple[Optional[Any], Optional[Any]]]:
+    """미리 빌드한 ANN 인덱스 (선택, ivf 모드)"""
+    if config.ANN_MODE != "ivf":
+        return None
+    return (
+        load_ann_index(config.ANN_CF_INDEX_PATH, config.ANN_NPROBE),
+        load_ann_index(config.ANN_AUDIO_INDEX_PATH, config.ANN_NPROBE)
+    )
+
+
+def _build_engine(config: Settings, state: Any, item2vec_model: Optional[Any]) -> Optional[RecommendationEngine]:
+    """
+    추천 엔진 초기화 (Stage3 하이브리드)
+    meta_full(song_meta.json)을 메인 메타데이터로 사용
+    """
+    if state.meta_full is None:
+        logger.warning("Engine not initialized (no song_meta.json)")
+        return None
+    snapshot = state.snapshot
+    engine = RecommendationEngine(
+        meta_registry=state.meta_full,
+        item2vec_model=item2vec_model,
+        audio_bundle=state.audio_bundle,
+        demo_mode=config.DEMO_MODE,
+        candidate_topn=config.CANDIDATE_TOPN,
+        alpha_audio=config.ALPHA_AUDIO,
+        # Stage1.5 re-ranking 파라미터
+        max_per_artist_soft=config.MAX_PER_ARTIST_SOFT,
+        max_per_artist_final=config.MAX_PER_ARTIST_FINAL,
+        penalty_per_extra=config.PENALTY_PER_EXTRA,
+        offrail_penalty_general=config.OFFRAIL_PENALTY_GENERAL,
+        offrail_penalty_special=config.OFFRAIL_PENALTY_SPECIAL,
+        stage3_candidates=config.STAGE3_CANDIDATES,
+        neighbor_table=state.neighbor_table,
+        ann_mode=config.ANN_MODE,
+        ann_nlist=config.ANN_NLIST,
+        ann_nprobe=config.ANN_NPROBE,
+        cf_ann_index=state.cf_ann_index,
+        audio_ann_index=state.audio_ann_index,
+        cf_index=state.cf_index,
+        cf_vocab_size=snapshot.cf_vocab_size if snapshot is not None else 0
+    )
+    logger.info(f"Engine initialized with Stage3 hybrid (alpha_cf={1-config.ALPHA_AUDIO}, beta_audio={config.ALPHA_AUDIO})")
+    return engine
+
+
+def build_worker_engine(config: Settings) -> Optional[RecommendationEngine]:
+    """
+    process 백엔드 워커용 엔진 (스냅샷 memmap으로 메타 / 벡터를 부모 프로세스와 공유)
+
+    검색 / 자동완성 인덱스와 Redis는 만들지 않음 (워커는 엔진 호출만 처리)
+    """
+    snapshot = load_snapshot(config.SNAPSHOT_PATH, config.AUDIO_MODEL)
+    if snapshot is None:
+        logger.error(f"Engine worker needs a catalog snapshot: {config.SNAPSHOT_PATH!r}")
+        return None
+    state = SimpleNamespace(snapshot=snapshot, meta_full=snapshot.meta_registry("meta"))
+    state.cf_index, item2vec_model = _load_item2vec(config, snapshot)
+    state.neighbor_table = load_neighbor_table(config.CF_NEIGHBORS_PATH)
+    state.audio_bundle = _load_audio(config, snapshot)
+    state.cf_ann_index, state.audio_ann_index = _load_ann(config) or (None, None)
+    return _build_engine(config, state, item2vec_model)
+
+
+async def _start_engine_executor(
+    config: Settings,
+    state: Any,
+    engine: Optional[RecommendationEngine]
+) -> Optional[EngineExecutor]:
+    """
+    엔진 실행 백엔드 (ENGINE_BACKEND)
+
+    process 백엔드는 스냅샷(SNAPSHOT_PATH 또는 SHARED_SNAPSHOT_DIR에 발행된 파일)이 있어야 하며,
+    없거나 워커 엔진 생성에 실패하면 thread 백엔드로 대체
+    """
+    if engine is None:
+        return None
+    backend = config.ENGINE_BACKEND
+    if backend == "process" and state.snapshot is None:
+        logger.warning("ENGINE_BACKEND=process needs a catalog snapshot, falling back to thread")
+        backend = "thread"
+    settings = config.model_dump()
+    if state.snapshot is not None:
+        settings["SNAPSHOT_PATH"] = state.snapshot.path
+    options = dict(workers=config.ENGINE_WORKERS, max_queue=config.ENGINE_MAX_QUEUE, timeout_sec=config.ENGINE_TIMEOUT_SEC)
+    engine_executor = EngineExecutor(backend, settings=settings, **options)
+    try:
+        started = await engine_executor.start()
+    except Exception as e:
+        logger.error(f"Engine workers failed to start: {e}")
+        started = False
+    if not started:
+        engine_executor.shutdown()
+        logger.warning(f"Engine backend {backend} unavailable, falling back to thread")
+        engine_executor = EngineExecutor("thread", **options)
+    logger.info(f"Engine backend: {engine_executor.backend} (workers={config.ENGINE_WORKERS}, max_queue={config.ENGINE_MAX_QUEUE})")
+    return engine_executor
+
+
+def _make_local_cache(config: Settings) -> Optional[LocalCache]:
+    """프로세스 내 1차 캐시 (세대마다 새로 생성, LOCAL_CACHE_MAX_ENTRIES=0이면 None)"""
+    if config.LOCAL_CACHE_MAX_ENTRIES <= 0:
+        return None
+    return LocalCache(
+        max_entries=config.LOCAL_CACHE_MAX_ENTRIES,
+        max_bytes=config.LOCAL_CACHE_MAX_MB * 2**20,
+        ttl_sec=min(config.LOCAL_CACHE_TTL_SEC, config.CACHE_TTL_SEC)
+    )
+
+
+def _make_single_flight(config: Settings) -> Optional[SingleFlight]:
+    """동시 미스 합치기 (세대마다 새로 생성, SINGLE_FLIGHT=false면 None)"""
+    if not config.SINGLE_FLIGHT:
+        return None
+    return SingleFlight(lock_ttl_sec=config.CACHE_LOCK_TTL_SEC, lock_wait_sec=config.CACHE_LOCK_WAIT_SEC)
+
+
+def _make_cache_refresher(config: Settings) -> CacheRefresher:
+    """캐시 항목 신선도 (세대마다 새로 생성, 진행 중인 재계산은 이전 세대 엔진으로 끝남)"""
+    return CacheRefresher(
+        ttl_sec=config.CACHE_TTL_SEC,
+        stale_sec=config.CACHE_STALE_SEC,
+        jitter=config.CACHE_TTL_JITTER,
+        beta=config.CACHE_EARLY_REFRESH_BETA
+    )
+
+
+def _build_autocomplete(config: Settings, state: Any, item2vec_model: Optional[Any]) -> Optional[Any]:
+    """
+    곡명 / 아티스트 자동완성 인덱스 (meta_full에 부착)
+
+    인기도 prior: SEARCH_PRIOR_PATH > Item2Vec vocab 빈도 (KeyedVectors 로드 시) > 없음 (곡명 길이 순)
+    """
+    meta = state.meta_full
+    if meta is None:
+        return None
+    prior = load_search_prior(config.SEARCH_PRIOR_PATH)
+    if prior is None and item2vec_model is not None:
+        prior = keyed_vector_counts(item2vec_model)
+    meta.autocomplete = build_autocomplete_index(meta, prior)
+    return meta.autocomplete
+
+
+async def load_resources(state: Any, config: Settings) -> None:
+    """
+    리소스를 병렬 로드하고 app.state에 채운 뒤 엔진 생성
+
+    - 파일 I/O / mmap / numpy 로더는 스레드 풀 (결과를 프로세스 간 복사할 필요 없음)
+    - 메타 JSON 파싱은 GIL을 잡고 있어 스레드로는 겹치지 않으므로 spawn 프로세스 풀에서 파싱 후
+      컬럼형 결과만 pickle로 받음 (LOAD_PROCESSES=0이면 스레드, 스냅샷 사용 시 파싱 없음)
+      검색 인덱스는 프로세스 경계를 넘기지 않고 부모의 스레드 풀에서 생성
+    - 로드된 리소스는 끝나는 대로 state에 반영, 엔진은 마지막에 한 번 할당 (준비 상태 전환 시점)
+    - 개별 리소스 실패는 기존처럼 None으로 진행, 엔진이 없으면 phase=failed
+    """
+    loading: LoadingState = state.loading
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=config.LOAD_WORKERS, thread_name_prefix="resource-loader")
+    process_executor: Optional[ProcessPoolExecutor] = None
+
+    async def run(
+        name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        in_process: bool = False,
+        post: Optional[Callable[[Any], Any]] = None
+    ) -> Any:
+        try:
+            if in_process:
+                loading.begin(name)
+                result = await loop.run_in_executor(process_executor, fn, *args)
+                if post is not None:
+                    result = await loop.run_in_executor(executor, post, result)
+            else:
+                result = await loop.run_in_executor(executor, _call_started, loading, name, fn, args)
+        except Exception as e:
+            log = logger.warning if name in _OPTIONAL_RESOURCES else logger.error
+            log(f"Failed to load {name}: {e}")
+            loading.finish(name, False, error=str(e))
+            return None
+        loading.finish(name, result is not None)
+        return result
+
+    try:
+        # 0. 카탈로그 스냅샷 (나머지 리소스가 참조하므로 먼저)
+        meta_full_path, meta_audio_path = resolve_meta_paths(config)
+        state.snapshot = await run("snapshot", _load_catalog_snapshot, config, meta_full_path, meta_audio_path)
+        snapshot = state.snapshot
+        if snapshot is None and config.LOAD_PROCESSES > 0:
+            process_executor = ProcessPoolExecutor(
+                max_workers=config.LOAD_PROCESSES,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+
+        # 1~5. 메타 / Item2Vec / CF 이웃 / 오디오 임베딩 / ANN / Redis 병렬 로드
+        async def meta_full() -> None:
+            if process_executor is not None:
+                state.meta_full = await run(
+                    "meta_full", load_song_meta_melon, meta_full_path, config.DEMO_MODE,
+                    in_process=True, post=_with_search_index
+                )
+            else:
+                state.meta_full = await run("meta_full", _load_meta_full, config, snapshot, meta_full_path)
+            state.meta_full_loaded = state.meta_full is not None
+
+        async def meta_audio() -> None:
+            if process_executor is not None:
+                state.meta_audio = await run(
+                    "meta_audio", load_audio_song_meta, meta_audio_path, config.DEMO_MODE, in_process=True
+                )
+            else:
+                state.meta_audio = await run("meta_audio", _load_meta_audio, config, snapshot, meta_audio_path)
+            state.meta_audio_loaded = loading.resources["meta_audio"].status != "failed"
+
+        async def item2vec() -> Optional[Any]:
+            loaded = await run("item2vec", _load_item2vec, config, snapshot)
+            cf_index, item2vec_model = loaded if loaded is not None else (None, None)
+            state.cf_index = cf_index
+            state.item2vec_loaded = cf_index is not None or item2vec_model is not None
+            return item2vec_model
+
+        async def cf_neighbors() -> None:
+            state.neighbor_table = await run("cf_neighbors", load_neighbor_table, config.CF_NEIGHBORS_PATH)
+
+        async def audio() -> None:
+            state.audio_bundle = await run("audio", _load_audio, config, snapshot)
+            state.audio_loaded = state.audio_bundle is not None
+
+        async def ann() -> None:
+            indexes = await run("ann", _load_ann, config)
+            if indexes is not None:
+                state.cf_ann_index, state.audio_ann_index = indexes
+
+        async def redis() -> None:
+            # 연결 풀은 이 이벤트 루프에서 생성 (요청 핸들러와 같은 루프에서 사용)
+            state.local_cache = _make_local_cache(config)
+            state.single_flight = _make_single_flight(config)
+            state.cache_refresher = _make_cache_refresher(config)
+            loading.begin("redis")
+            state.redis_cache = RedisCache(
+                config.REDIS_URL,
+                max_connections=config.REDIS_MAX_CONNECTIONS,
+                timeout_sec=config.REDIS_TIMEOUT_SEC,
+                retry_sec=config.REDIS_RETRY_SEC
+            )
+            await state.redis_cache.connect()
+            loading.finish("redis", True)
+
+        _, _, item2vec_model, _, _, _, _ = await asyncio.gather(
+            meta_full(), meta_audio(), item2vec(), cf_neighbors(), audio(), ann(), redis()
+        )
+
+        # 6. 엔진 + 자동완성 인덱스 (KeyedVectors는 CF 인덱스 / vocab 빈도를 꺼낸 뒤 해제)
+        engine, _ = await asyncio.gather(
+            run("engine", _build_engine, config, state, item2vec_model),
+            run("autocomplete", _build_autocomplete, config, state, item2vec_model)
+        )
+        item2vec_model = None
+
+        # 7. 엔진 실행 백엔드 (process 백엔드는 워커 엔진 생성까지 대기) -> 엔진 공개 (준비 상태 전환)
+        state.engine_executor = await _start_engine_executor(config, state, engine)
+        state.engine = engine
+    except Exception as e:
+        logger.exception(f"Resource loading aborted: {e}")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if process_executor is not None:
+            process_executor.shutdown(wait=False, cancel_futures=True)
+
+    loading.complete(ready=state.engine is not None)
+
+
+async def startup_resources(state: Any, config: Settings) -> None:
+    """앱 시작 시 최초 세대 로드 (app.state에 바로 채움) -> 캐시 워밍업 시작 (CACHE_WARMUP_SEEDS)"""
+    await load_resources(state, config)
+    start_cache_warmup(state)
+    loading: LoadingState = state.loading
+    logger.info("=" * 60)
+    if loading.ready:
+        logger.info(f"VibeCurator Backend Ready! ({loading.elapsed_sec:.1f}s)")
+    else:
+        logger.error(f"VibeCurator Backend started without engine ({loading.elapsed_sec:.1f}s)")
+    logger.info("=" * 60)
+
+
+def init_reload_state(state: Any) -> None:
+    """핫 리로드 상태 기본값 (세대 번호, 마지막 리로드 진행 상황, 실행 중 리로드 / 캐시 워밍업 태스크)"""
+    state.generation = 1
+    state.reload_loading = None
+    state.reload_error = None
+    state.reload_task = None
+    state.warmup_task = None
+
+
+def swap_resources(state: Any, fresh: Any) -> None:
+    """
+    새 세대 리소스를 app.state에 교체
+
+    await 없이 이벤트 루프에서 한 번에 대입하므로, 요청 핸들러가 config / engine을 읽을 때
+    항상 같은 세대의 쌍을 봄 (캐시 키의 ENGINE_VERSION과 결과를 만든 엔진이 일치)
+    """
+    for name in SERVING_ATTRS:
+        setattr(state, name, getattr(fresh, name))
+    state.generation += 1
+
+
+# 이전 세대 Redis 풀 / 엔진 실행기 종료 태스크 (완료 전 GC 방지)
+_closing_tasks: Set[asyncio.Task] = set()
+
+
+def _close_later(generation: Any) -> None:
+    """
+    교체된(또는 리로드에 실패한) 세대의 Redis 연결 풀 / 엔진 실행기를 종료
+
+    - 교체 직전에 시작한 요청이 이전 세대 캐시 조회를 마치고 엔진 호출을 제출할 때까지 유예
+      (Redis 명령 2회: 풀 대기 + 소켓 타임아웃)
+    - 엔진 실행기는 대기열이 빌 때까지 기다린 뒤 닫음 (최대 ENGINE_DRAIN_MAX_SEC, ENGINE_TIMEOUT_SEC=0이어도
+      진행 중 요청이 취소되지 않음), 초과해도 대기 중 작업은 취소하지 않고 끝까지 실행
+    """
+    config: Settings = generation.config
+    cache: Optional[RedisCache] = generation.redis_cache
+    engine_executor: Optional[EngineExecutor] = generation.engine_executor
+    grace = 2 * cache.timeout_sec if cache is not None else 0.0
+
+    async def close() -> None:
+        await asyncio.sleep(grace)
+        if engine_executor is not None:
+            if not await engine_executor.drain(config.ENGINE_DRAIN_MAX_SEC):
+                logger.warning(
+                    f"Retired engine executor still busy after {config.ENGINE_DRAIN_MAX_SEC:g}s "
+                    f"({engine_executor.pending} pending), closing without cancelling"
+                )
+            engine_executor.shutdown(cancel_futures=False)
+        if cache is not None:
+            await cache.close()
+
+    task = asyncio.create_task(close())
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
+
+
+def start_cache_warmup(state: Any) -> None:
+    """
+    현재 세대 캐시 워밍업을 백그라운드로 시작 (CACHE_WARMUP_SEEDS > 0, 준비 상태 / 요청 처리와 무관)
+
+    배포 / ENGINE_VERSION 변경 직후 빈 캐시 네임스페이스를 인기 시드로 채움 (이전 세대 워밍업은 취소)
+    """
+    config = state.config
+    if config.CACHE_WARMUP_SEEDS <= 0 or state.engine is None or state.redis_cache is None:
+        return
+    previous = state.warmup_task
+    if previous is not None and not previous.done():
+        previous.cancel()
+    else:
+        previous = None
+    generation = SimpleNamespace(**{name: getattr(state, name) for name in SERVING_ATTRS})
+    state.warmup_task = asyncio.create_task(_run_cache_warmup(generation, previous))
+
+
+async def _run_cache_warmup(generation: Any, previous: Optional[asyncio.Task] = None) -> None:
+    """
+    워밍업 실행 (ENGINE_VERSION / AUDIO_MODEL 네임스페이스당 워커 1개)
+
+    잠금은 워밍업을 끝낸 경우에만 CACHE_TTL_SEC 동안 유지 (그 사이 재시작한 워커는 다시 워밍업하지 않음),
+    실패 / 취소되면 바로 해제해 같은 네임스페이스의 다음 워밍업이 이어서 채움
+    실시간 요청과 엔진 실행기를 나눠 쓰므로 배치는 1개씩 실행
+
+    Args:
+        previous: 취소한 이전 세대 워밍업 (잠금을 해제할 때까지 기다린 뒤 잠금 시도)
+    """
+    if previous is not None:
+        await asyncio.gather(previous, return_exceptions=True)
+    config = generation.config
+    redis_cache: RedisCache = generation.redis_cache
+    lock_key = f"lock:warmup:{config.ENGINE_VERSION}:{config.AUDIO_MODEL}"
+    token = uuid.uuid4().hex
+    if not await redis_cache.try_lock(lock_key, token, max(config.CACHE_TTL_SEC, 60)):
+        logger.info(f"Cache warm-up skipped (another worker holds {lock_key} or Redis unavailable)")
+        return
+    try:
+        seeds = await asyncio.to_thread(
+            warmup_seeds, generation, config.CACHE_WARMUP_SOURCE, config.CACHE_WARMUP_SEEDS, config.CACHE_WARMUP_LOG_PATH
+        )
+        logger.info(f"Cache warm-up started: {len(seeds):,} seeds from {config.CACHE_WARMUP_SOURCE}")
+        stats = await warm_cache(
+            generation,
+            seeds,
+            batch_size=config.CACHE_WARMUP_BATCH,
+            progress=lambda progress: logger.info(f"Cache warm-up: {format_progress(progress)}"),
+            progress_sec=10.0
+        )
+        logger.info(f"Cache warm-up complete: {stats}")
+    except asyncio.CancelledError:
+        logger.info("Cache warm-up cancelled (generation replaced or shutdown)")
+        await redis_cache.unlock(lock_key, token)
+        raise
+    except Exception as e:
+        logger.warning(f"Cache warm-up failed: {e}")
+        await redis_cache.unlock(lock_key, token)
+
+
+def _changed_engine_settings(old: Settings, new: Settings) -> Tuple[str, ...]:
+    return tuple(name for name in _ENGINE_SETTINGS if getattr(old, name) != getattr(new, name))
+
+
+async def reload_resources(state: Any, config: Settings) -> bool:
+    """
+    새 설정으로 리소스 / 엔진을 별도로 로드한 뒤 교체 (무중단)
+
+    - 로드 중에도 기존 세대가 계속 요청 처리
+    - 새 엔진 생성에 실패하면 기존 세대 유지
+    - 교체 후 이전 세대는 진행 중 요청이 참조를 놓는 즉시 해제 (memmap / 배열 참조 카운트)
+
+    Returns:
+        교체 여부
+    """
+    fresh = SimpleNamespace(config=config)
+    init_resource_state(fresh)
+    state.reload_loading = fresh.loading
+    state.reload_error = None
+    logger.info(f"Reload started: generation {state.generation + 1} (engine_version={config.ENGINE_VERSION})")
+
+    await load_resources(fresh, config)
+    if fresh.engine is None:
+        _close_later(fresh)
+        state.reload_error = "engine not built"
+        logger.error(f"Reload failed, keeping generation {state.generation} ({fresh.loading.elapsed_sec:.1f}s)")
+        return False
+
+    old_version = state.config.ENGINE_VERSION
+    changed = _changed_engine_settings(state.config, config)
+    if changed and config.ENGINE_VERSION == old_version:
+        logger.warning(
+            f"Reload changed {', '.join(changed)} without bumping ENGINE_VERSION={old_version}: "
+            f"cached results of the previous engine stay valid under the same keys until their soft TTL (CACHE_TTL_SEC) passes and they are recomputed"
+        )
+
+    previous = SimpleNamespace(redis_cache=state.redis_cache, engine_executor=state.engine_executor)
+    swap_resources(state, fresh)
+    _close_later(previous)
+    start_cache_warmup(state)
+    logger.info(
+        f"Reload complete: generation {state.generation} "
+        f"(engine_version {old_version} -> {config.ENGINE_VERSION}, {fresh.loading.elapsed_sec:.1f}s)"
+    )
+    return True
+
+
+def start_reload(state: Any, overrides: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    백그라운드 리로드 시작 (관리 API / SIGHUP)
+
+    설정은 환경변수 / .env를 다시 읽고 overrides를 덮어씀 (pydantic 검증 실패는 ValidationError)
+
+    Returns:
+        시작 여부 (최초 로드 또는 다른 리로드가 진행 중이면 False)
+    """
+    if not state.loading.finished:
+        return False
+    if state.reload_task is not None and not state.reload_task.done():
+        return False
+    config = get_settings(**(overrides or {}))
+    state.reload_task = asyncio.create_task(_run_reload(state, config))
+    return True
+
+
+async def _run_reload(state: Any, config: Settings) -> None:
+    try:
+        await reload_resources(state, config)
+    except Exception as e:
+        state.reload_error = str(e)
+        logger.exception(f"Reload aborted: {e}")
@@ -0,0 +1,214 @@
+"""
+VibeCurator Cache Warm-up
+배포 / ENGINE_VERSION 변경 직후 빈 캐시 네임스페이스를 인기 시드 추천으로 미리 채움
+
+- 시드 목록: Item2Vec vocab 빈도 순 (vocab) / 트래픽 로그 요청 수 순 (log) / 카탈로그 전체 (catalog)
+- 계산: 엔진 일괄 추천(recommend_batch, Stage1 행렬-행렬 곱)을 엔진 실행기 워커 수만큼 동시에 실행
+- 저장: 신선도 정보(soft TTL jitter 포함)를 붙여 파이프라인 SET EX (왕복 1회 / 배치)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .autocomplete import load_search_prior
+from .cache import make_recommend_cache_key, recommend_cache_depth, store_computed
+
+logger = logging.getLogger(__name__)
+
+WARMUP_SOURCES = ("vocab", "log", "catalog")
+
+
+def recommend_traffic(path: str) -> Iterator[Tuple[int, int]]:
+    """
+    트래픽 로그 -> (seed_id, k)
+
+    - 액세스 로그: 줄 안의 `/recommend?seed_id=..&k=..` 요청 경로 (k 없으면 기본값 20)
+    - JSON Lines: {"seed_id": .., "k": ..}
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("{"):
+                record = json.loads(line)
+                yield int(record["seed_id"]), int(record.get("k", 20))
+                continue
+            start = line.find("/recommend?")
+            if start < 0:
+                continue
+            query = parse_qs(urlsplit(line[start:].split()[0].rstrip('"')).query)
+            if "seed_id" in query:
+                yield int(query["seed_id"][0]), int(query.get("k", ["20"])[0])
+
+
+def warmup_seeds(state: Any, source: str, limit: int = 0, log_path: str = "") -> List[int]:
+    """
+    워밍업 시드 목록 (인기 순)
+
+    Args:
+        state: 로드가 끝난 세대 (meta_full / engine 사용)
+        source: "vocab" (Item2Vec vocab 빈도 = 자동완성 prior 순) | "log" (로그 요청 수 순) | "catalog" (메타 순서)
+        limit: 최대 시드 수 (0이면 전부, vocab은 vocab ∩ 메타 곡 수까지)
+        log_path: source="log"일 때 액세스 로그 / JSON Lines 경로
+
+    Raises:
+        ValueError: 알 수 없는 source / 시드를 고를 수 없음 (메타 없음, vocab 빈도 없음, 로그 없음)
+    """
+    meta = state.meta_full
+    if source == "log":
+        if not log_path:
+            raise ValueError("source=log needs a traffic log path")
+        counts = Counter(seed_id for seed_id, _ in recommend_traffic(log_path))
+        seeds = [seed_id for seed_id, _ in counts.most_common(limit or None)]
+    elif source == "vocab":
+        seeds = _vocab_seeds(state, limit)
+    elif source == "catalog":
+        if meta is None:
+            raise ValueError("source=catalog needs song metadata")
+        seeds = meta.song_ids[:limit or None].tolist()
+    else:
+        raise ValueError(f"Unknown warm-up source: {source}")
+    if not seeds:
+        raise ValueError(f"No warm-up seeds from source={source}")
+    return seeds
+
+
+def _vocab_seeds(state: Any, limit: int) -> List[int]:
+    """vocab 빈도 순 시드 (자동완성 인덱스의 prior 순위, 없으면 SEARCH_PRIOR_PATH)"""
+    meta = state.meta_full
+    if meta is None:
+        raise ValueError("source=vocab needs song metadata")
+    engine = state.engine
+    servable = engine.cf_servable_size if engine is not None else 0
+    limit = min(limit, servable) if limit and servable else (limit or servable)
+
+    autocomplete = getattr(meta, "autocomplete", None)
+    if autocomplete is not None and autocomplete.has_prior:
+        return autocomplete.song_ids[autocomplete.rows_by_rank[:limit or None]].tolist()
+
+    prior = load_search_prior(state.config.SEARCH_PRIOR_PATH)
+    if prior is None:
+        raise ValueError("source=vocab needs Item2Vec vocab counts (training model or SEARCH_PRIOR_PATH)")
+    song_ids, counts = prior
+    song_ids = song_ids[counts.argsort(kind="stable")[::-1]]
+    known = meta.rows_of(song_ids) >= 0
+    return song_ids[known][:limit or None].tolist()
+
+
+async def warm_cache(
+    state: Any,
+    seed_ids: List[int],
+    k: int = 20,
+    batch_size: int = 256,
+    concurrency: int = 1,
+    skip_existing: bool = True,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    progress_sec: float = 2.0
+) -> Dict[str, Any]:
+    """
+    시드 추천을 계산해 Redis에 저장 (GET /recommend와 같은 캐시 키 / 깊이 / 형식)
+
+    Args:
+        state: 로드가 끝난 세대 (config / engine / engine_executor / redis_cache / cache_refresher)
+        seed_ids: 시드 목록 (중복은 1회)
+        k: 캐시 깊이를 정할 추천 개수 (CACHE_MAX_K가 있으면 그 깊이)
+        batch_size: 엔진 일괄 추천 1회당 시드 수
+        concurrency: 동시에 실행할 배치 수 (엔진 실행기 워커 수 이하 권장)
+        skip_existing: 이미 캐시에 있는 키는 계산하지 않음 (EXISTS 파이프라인)
+        progress: 진행 상황 콜백 (progress_sec 간격 + 마지막 1회)
+
+    Returns:
+        {seeds, computed, skipped, errors, batches, elapsed_sec, seeds_per_sec}
+    """
+    config = state.config
+    engine = state.engine
+    engine_executor = state.engine_executor
+    redis_cache = state.redis_cache
+    if engine is None:
+        raise RuntimeError("Recommendation engine not initialized")
+    if redis_cache is None or not redis_cache.available:
+        raise RuntimeError("Redis not available")
+
+    depth = recommend_cache_depth(k, config.CACHE_MAX_K)
+    seed_ids = list(dict.fromkeys(seed_ids))
+    batches = [seed_ids[i:i + batch_size] for i in range(0, len(seed_ids), batch_size)]
+    stats: Dict[str, Any] = {"seeds": len(seed_ids), "done": 0, "computed": 0, "skipped": 0, "errors": 0, "batches": 0}
+    started = time.perf_counter()
+    reported, reported_done = started, -1
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    def report(final: bool = False) -> None:
+        nonlocal reported, reported_done
+        now = time.perf_counter()
+        if progress is None or (now - reported < progress_sec and not final) or stats["done"] == reported_done:
+            return
+        reported, reported_done = now, stats["done"]
+        elapsed = now - started
+        progress({**stats, "elapsed_sec": elapsed, "seeds_per_sec": stats["done"] / elapsed if elapsed > 0 else 0.0})
+
+    async def run_batch(batch: List[int]) -> None:
+        async with semaphore:
+            keys = [
+                make_recommend_cache_key(config.ENGINE_VERSION, config.AUDIO_MODEL, seed_id, depth)
+                for seed_id in batch
+            ]
+            if skip_existing:
+                exists = await redis_cache.exists_many(keys)
+                todo = [(seed_id, key) for seed_id, key, hit in zip(batch, keys, exists) if not hit]
+                stats["skipped"] += len(batch) - len(todo)
+            else:
+                todo = list(zip(batch, keys))
+
+            if todo:
+                batch_started = time.perf_counter()
+                try:
+                    if engine_executor is not None:
+                        outputs = await engine_executor.run(
+                            engine, "recommend_batch", seed_ids=[seed_id for seed_id, _ in todo], k=depth
+                        )
+                    else:
+                        outputs = engine.recommend_batch(seed_ids=[seed_id for seed_id, _ in todo], k=depth)
+                except Exception as e:
+                    logger.warning(f"Warm-up batch failed ({len(todo)} seeds): {e!r}")
+                    outputs = [e] * len(todo)
+                items = {
+                    key: (None, {"method": result["method"], "seed": result["seed"], "items": result["items"]})
+                    for (_, key), result in zip(todo, outputs)
+                    if not isinstance(result, Exception)
+                }
+                compute_sec = (time.perf_counter() - batch_started) / len(todo)
+                await store_computed(state.cache_refresher, None, redis_cache, items, compute_sec, config.CACHE_TTL_SEC)
+                stats["computed"] += len(items)
+                stats["errors"] += len(todo) - len(items)
+
+            stats["done"] += len(batch)
+            stats["batches"] += 1
+            report()
+
+    await asyncio.gather(*(run_batch(batch) for batch in batches))
+    elapsed = time.perf_counter() - started
+    report(final=True)
+    return {
+        "seeds": stats["seeds"],
+        "computed": stats["computed"],
+        "skipped": stats["skipped"],
+        "errors": stats["errors"],
+        "batches": stats["batches"],
+        "elapsed_sec": round(elapsed, 3),
+        "seeds_per_sec": round(stats["done"] / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+
+def format_progress(stats: Dict[str, Any]) -> str:
+    """진행 상황 한 줄 (done/seeds, 처리량, 남은 시간)"""
+    done, total, rate = stats["done"], stats["seeds"], stats["seeds_per_sec"]
+    eta = (total - done) / rate if rate > 0 else 0.0
+    return (
+        f"{done:,}/{total:,} seeds ({done / max(total, 1):.0%}) {rate:,.0f} seeds/s "
+        f"computed={stats['computed']:,} skipped={stats['skipped']:,} errors={stats['errors']:,} "
+        f"elapsed={stats['elapsed_sec']:.1f}s eta={eta:.0f}s"
+    )
@@ -0,0 +1,26 @@
+"""
+VibeCurator Admin Schemas
+관리 API 스키마
+"""
+
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class ReloadRequest(BaseModel):
+    """핫 리로드 요청"""
+    overrides: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="환경변수 / .env 위에 덮어쓸 설정 (예: {\"ENGINE_VERSION\": \"stage3_v2_myna\", \"PENALTY_PER_EXTRA\": 0.08})"
+    )
+
+
+class ReloadStatusResponse(BaseModel):
+    """핫 리로드 상태"""
+    generation: int  # 현재 서빙 중인 세대 (시작 시 1, 리로드 성공마다 +1)
+    engine_version: str
+    reloading: bool
+    phase: Optional[str] = None  # 마지막 리로드의 loading / ready / failed
+    elapsed_sec: Optional[float] = None
+    resources: Dict[str, Dict[str, Any]] = {}
+    error: Optional[str] = None
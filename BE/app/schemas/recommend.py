@@ -3,8 +3,8 @@ VibeCurator Recommendation Schemas
 추천 관련 스키마
 """
 
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
 
 
 class SeedInfo(BaseModel):
@@ -34,3 +34,45 @@ class RecommendResponse(BaseModel):
     seed: SeedInfo
     items: List[RecommendItem]
 
+
+
+class BatchRecommendRequest(BaseModel):
+    """일괄 추천 요청"""
+    seed_ids: List[int] = Field(..., min_length=1, description="시드 곡 ID 목록")
+    k: int = Field(default=20, ge=1, le=100, description="시드당 추천 개수")
+
+
+class BatchRecommendResult(BaseModel):
+    """일괄 추천 결과 항목 (시드 1개)"""
+    seed_id: int
+    status: int  # 200 | 404 | 503 | 500
+    detail: Optional[str] = None
+    cached: bool = False
+    method: Optional[str] = None
+    seed: Optional[SeedInfo] = None
+    items: List[RecommendItem] = []
+
+
+class BatchRecommendResponse(BaseModel):
+    """일괄 추천 응답 (입력 순서 유지)"""
+    engine_version: str
+    audio_model: str
+    results: List[BatchRecommendResult]
+
+
+class PlaylistRecommendRequest(BaseModel):
+    """플레이리스트 이어듣기 추천 요청"""
+    seed_ids: List[int] = Field(..., min_length=1, description="플레이리스트 곡 ID 목록")
+    k: int = Field(default=20, ge=1, le=100, description="추천 개수")
+    fusion: Literal["mean", "max", "sum"] = Field(default="mean", description="다중 시드 결합 방식")
+
+
+class PlaylistRecommendResponse(BaseModel):
+    """플레이리스트 이어듣기 추천 응답"""
+    engine_version: str
+    audio_model: str
+    cached: bool
+    method: str  # "demo" | "cf_only" | "hybrid"
+    fusion: str
+    seeds: List[SeedInfo]
+    items: List[RecommendItem]
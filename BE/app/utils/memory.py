@@ -0,0 +1,70 @@
+"""
+VibeCurator Memory Utilities
+프로세스 메모리 사용량 측정 유틸리티
+"""
+
+import mmap
+import sys
+from typing import Any, Dict
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def current_rss_bytes() -> int:
+    """현재 RSS (bytes, Linux /proc/self/statm, 측정 불가 시 0)"""
+    if resource is None:
+        return 0
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def peak_rss_bytes() -> int:
+    """프로세스 시작 이후 최대 RSS (bytes, 측정 불가 시 0)"""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss 단위: Linux KiB, macOS bytes
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+def rss_breakdown() -> Dict[str, int]:
+    """
+    현재 RSS의 공유 / 전용 분해 (bytes, Linux /proc/self/smaps_rollup, 측정 불가 시 빈 dict)
+
+    shared: 다른 프로세스와 함께 매핑 중인 페이지 (공유 스냅샷 memmap 등)
+    private: 이 프로세스만 쓰는 페이지 (힙, 워커 전용 사본)
+    """
+    fields = {
+        "Rss:": "rss",
+        "Shared_Clean:": "shared",
+        "Shared_Dirty:": "shared",
+        "Private_Clean:": "private",
+        "Private_Dirty:": "private",
+    }
+    result = {"rss": 0, "shared": 0, "private": 0}
+    try:
+        with open("/proc/self/smaps_rollup", "r") as f:
+            for line in f:
+                parts = line.split()
+                if parts and parts[0] in fields:
+                    result[fields[parts[0]]] += int(parts[1]) * 1024  # kB
+    except (OSError, ValueError, IndexError):
+        return {}
+    return result
+
+
+def is_memory_mapped(arr: Any) -> bool:
+    """배열이 파일 mmap 위에 있는지 (np.memmap / mmap.mmap까지 base 체인 추적)"""
+    while arr is not None:
+        if isinstance(arr, (np.memmap, mmap.mmap)):
+            return True
+        arr = getattr(arr, "base", None)
+    return False
@@ -0,0 +1,73 @@
+"""
+엔진 실행기 테스트 (교체된 세대 종료 시 진행 중 요청 보존)
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from app.core.config import Settings
+from app.core.executor import EngineExecutor
+from app.core import startup
+
+
+class SlowEngine:
+    def recommend(self, seed_id: int, k: int) -> dict:
+        time.sleep(0.2)
+        return {"seed_id": seed_id, "k": k}
+
+
+def _retired_generation(engine_executor: EngineExecutor, **overrides) -> SimpleNamespace:
+    config = Settings(ENGINE_TIMEOUT_SEC=0, **overrides)
+    return SimpleNamespace(config=config, redis_cache=None, engine_executor=engine_executor)
+
+
+def test_close_later_drains_queued_calls_without_timeout() -> None:
+    """ENGINE_TIMEOUT_SEC=0: 워커 1개에 대기 중인 호출도 취소되지 않고 이전 엔진으로 완료"""
+    async def scenario() -> None:
+        engine_executor = EngineExecutor("thread", workers=1, max_queue=8, timeout_sec=0)
+        calls = [
+            asyncio.create_task(engine_executor.run(SlowEngine(), "recommend", seed_id=seed_id, k=10))
+            for seed_id in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        assert engine_executor.pending == 3
+
+        startup._close_later(_retired_generation(engine_executor))
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        assert results == [{"seed_id": seed_id, "k": 10} for seed_id in range(3)]
+
+        await asyncio.gather(*startup._closing_tasks)
+        assert engine_executor.pending == 0
+        assert engine_executor.completed == 3
+
+    asyncio.run(scenario())
+
+
+def test_close_later_does_not_cancel_after_drain_cap() -> None:
+    """대기 상한(ENGINE_DRAIN_MAX_SEC)을 넘겨 닫아도 대기 중 호출은 취소하지 않음"""
+    async def scenario() -> None:
+        engine_executor = EngineExecutor("thread", workers=1, max_queue=8, timeout_sec=0)
+        calls = [
+            asyncio.create_task(engine_executor.run(SlowEngine(), "recommend", seed_id=seed_id, k=10))
+            for seed_id in range(3)
+        ]
+        await asyncio.sleep(0.05)
+
+        startup._close_later(_retired_generation(engine_executor, ENGINE_DRAIN_MAX_SEC=0.05))
+        await asyncio.gather(*startup._closing_tasks)
+        assert engine_executor.pending > 0
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        assert results == [{"seed_id": seed_id, "k": 10} for seed_id in range(3)]
+
+    asyncio.run(scenario())
+
+
+def test_drain_returns_immediately_when_idle() -> None:
+    async def scenario() -> None:
+        engine_executor = EngineExecutor("thread", workers=1, max_queue=8)
+        assert await engine_executor.drain(10.0)
+        engine_executor.shutdown()
+
+    asyncio.run(scenario())
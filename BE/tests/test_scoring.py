@@ -0,0 +1,119 @@
+"""
+Stage1.5 re-ranking 배열 버전(rerank_stage1_5_arrays) vs dict 버전(apply_stage1_5_reranking) 동일성 테스트
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pytest
+
+from app.core.scoring import (
+    GENRE_GROUP_UNK,
+    GenreGroupEncoder,
+    apply_stage1_5_reranking,
+    rerank_stage1_5_arrays,
+)
+
+# 일반 그룹 / 특수 그룹(TROT, CCM, KIDS, GUGAK) / UNK(빈 값, 짧은 코드) 장르 코드
+GENRES = ["GN0101", "GN0105", "GN0201", "GN0501", "GN0701", "GN1101", "GN1901", "GN2201", "GN2401", "", None, "GN"]
+SEED_GENRES = ["GN0101", "GN0201", "GN0701", "GN1901", "GN2401", "", None]
+PARAMS = [
+    {},
+    {
+        "max_per_artist_soft": 1,
+        "max_per_artist_final": 1,
+        "penalty_per_extra": 0.1,
+        "offrail_penalty_general": 0.02,
+        "offrail_penalty_special": 0.05,
+    },
+    {"max_per_artist_soft": 5, "max_per_artist_final": 3, "penalty_per_extra": 0.0},
+]
+
+
+def _random_candidates(rng: np.random.Generator, n: int) -> List[Dict]:
+    """
+    무작위 CF 후보
+
+    - 점수는 0.01 단위로 반올림해 동점(페널티 적용 후 동점 포함)이 자주 생기게 함
+    - 아티스트 수를 후보 수보다 훨씬 적게 잡아 한 아티스트 곡이 여러 개 나오게 함 (빈 / None 아티스트 포함)
+    """
+    artists = [f"artist_{i}" for i in range(max(2, n // 6))] + ["", None]
+    artist_weights = np.ones(len(artists))
+    artist_weights[0] = len(artists)  # 한 아티스트에 곡이 몰림
+    artist_weights /= artist_weights.sum()
+    return [
+        {
+            "song_id": song_id,
+            "score_cf": float(np.round(rng.uniform(0.3, 0.9), 2)),
+            "artist_key": artists[rng.choice(len(artists), p=artist_weights)],
+            "main_genre": GENRES[rng.integers(len(GENRES))],
+        }
+        for song_id in rng.permutation(10 * n)[:n].tolist()
+    ]
+
+
+def _rerank_arrays(candidates: List[Dict], seed_genre: Optional[str], topk_final: int, **params) -> List[Dict]:
+    """카탈로그와 같은 방식으로 정수 코드화한 뒤 배열 버전 실행"""
+    encoder = GenreGroupEncoder()
+    artist_index: Dict[str, int] = {}
+    artist_codes = np.array(
+        [artist_index.setdefault(c["artist_key"] or "UNKNOWN", len(artist_index)) for c in candidates],
+        dtype=np.int32
+    )
+    genre_group_codes = np.array([encoder.encode_genre(c["main_genre"]) for c in candidates], dtype=np.int32)
+    selected, score_final = rerank_stage1_5_arrays(
+        np.array([c["score_cf"] for c in candidates]),
+        artist_codes,
+        genre_group_codes,
+        seed_group_code=encoder.encode_genre(seed_genre),
+        topk_final=topk_final,
+        **params
+    )
+    return [
+        {"song_id": candidates[i]["song_id"], "score_final": float(s)}
+        for i, s in zip(selected.tolist(), score_final)
+    ]
+
+
+@pytest.mark.parametrize("params", PARAMS)
+@pytest.mark.parametrize("seed_genre", SEED_GENRES)
+def test_rerank_arrays_matches_dict_pipeline(seed_genre: Optional[str], params: Dict) -> None:
+    """시드 장르 그룹(일반 / 특수 / UNK) x 파라미터 조합마다 무작위 후보 30세트, topk_final은 N 미만 / N / N 초과"""
+    rng = np.random.default_rng([SEED_GENRES.index(seed_genre), PARAMS.index(params)])
+    for _ in range(30):
+        n = int(rng.integers(1, 80))
+        candidates = _random_candidates(rng, n)
+        for topk_final in (1, max(1, n // 2), n, n + 10):
+            expected = apply_stage1_5_reranking(
+                [dict(c) for c in candidates], seed_genre, topk_final, **params
+            )
+            actual = _rerank_arrays(candidates, seed_genre, topk_final, **params)
+
+            assert [c["song_id"] for c in actual] == [c["song_id"] for c in expected]
+            np.testing.assert_allclose(
+                [c["score_final"] for c in actual],
+                [c["score_final"] for c in expected],
+                rtol=0,
+                atol=1e-12
+            )
+
+
+def test_rerank_arrays_unknown_seed_group_has_no_genre_penalty() -> None:
+    """시드 장르 그룹이 UNK면 장르 레일가드 페널티 없음 (아티스트 페널티만)"""
+    scores = np.array([0.9, 0.8, 0.7])
+    selected, score_final = rerank_stage1_5_arrays(
+        scores,
+        artist_codes=np.array([0, 1, 2]),
+        genre_group_codes=np.array([1, 5, GENRE_GROUP_UNK]),
+        seed_group_code=GENRE_GROUP_UNK,
+        topk_final=3
+    )
+    assert selected.tolist() == [0, 1, 2]
+    np.testing.assert_array_equal(score_final, scores)
+
+
+def test_rerank_arrays_empty() -> None:
+    selected, score_final = rerank_stage1_5_arrays(
+        np.empty(0), np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32), seed_group_code=5, topk_final=10
+    )
+    assert len(selected) == 0 and len(score_final) == 0
@@ -0,0 +1,60 @@
+"""
+곡 검색 인덱스 테스트 (빈 텍스트 행 / 청크 경계, 결과 집합 = `query in text`)
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from app.core import search
+from app.core.loaders import _normalize_text
+from app.core.search import SongSearchIndex
+
+ALPHABET = ["a", "b", "가", "나", " ", "1"]
+
+
+def _build(fields: List[Tuple[str, str]]) -> SongSearchIndex:
+    return SongSearchIndex.build(np.arange(len(fields), dtype=np.int64) + 100, fields)
+
+
+@pytest.mark.parametrize("fields", [
+    [("", "")],
+    [(" ", "  ")],
+    [(None, None)],
+])
+def test_build_single_blank_row(fields: List[Tuple[str, str]]) -> None:
+    """1곡 카탈로그의 곡명 / 아티스트가 비어 있으면 trigram 없이 생성 (빈 질의만 매칭)"""
+    index = _build(fields)
+    assert len(index) == 1
+    assert len(index.gram_keys) == 0
+    assert index.search("", 10) == [100]
+    assert index.search("a", 10) == []
+    assert index.search("abcd", 10) == []
+
+
+def test_build_blank_row_at_chunk_boundary(monkeypatch: pytest.MonkeyPatch) -> None:
+    """청크 경계 뒤 마지막 청크가 빈 텍스트 행 1개뿐이어도 생성"""
+    monkeypatch.setattr(search, "_BUILD_CHUNK_ROWS", 2)
+    index = _build([("love song", "artist"), ("사랑", "가수"), ("", " ")])
+    assert index.search("love", 10) == [100]
+    assert index.search("사랑", 10) == [101]
+    assert index.search("", 10) == [100, 101, 102]
+
+
+def test_search_matches_substring_scan(monkeypatch: pytest.MonkeyPatch) -> None:
+    """작은 무작위 카탈로그(빈 행 포함, 작은 청크)에서 결과 집합이 `query in text`와 동일"""
+    monkeypatch.setattr(search, "_BUILD_CHUNK_ROWS", 3)
+    rng = np.random.default_rng(17)
+
+    def random_text(max_len: int) -> str:
+        return "".join(rng.choice(ALPHABET, size=int(rng.integers(0, max_len + 1))).tolist())
+
+    for _ in range(200):
+        fields = [(random_text(5), random_text(3)) for _ in range(int(rng.integers(1, 8)))]
+        index = _build(fields)
+        texts = [_normalize_text(f"{name} {artist}") for name, artist in fields]
+        for _ in range(5):
+            query = _normalize_text(random_text(4))
+            expected = {100 + row for row, text in enumerate(texts) if query in text}
+            assert set(index.search(query, len(fields))) == expected
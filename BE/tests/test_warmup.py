@@ -0,0 +1,293 @@
+"""
+캐시 워밍업 테스트 (fakeredis를 Redis 대체 서버로 사용)
+
+- warm_cache가 쓴 키 / 값을 GET /recommend가 그대로 캐시 적중으로 읽는지
+- 다시 실행하면 이미 있는 키는 건너뛰는지
+- 시작 훅(start_cache_warmup)의 Redis 잠금으로 워커 1개만 워밍업하는지
+- 취소 / 실패한 워밍업은 잠금을 해제해 같은 네임스페이스의 다음 워밍업이 이어서 채우는지
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import fakeredis
+import httpx
+import numpy as np
+from fastapi import FastAPI
+
+from app.api import routes_recommend
+from app.core.cache import RedisCache, make_recommend_cache_key, recommend_cache_depth
+from app.core.config import Settings
+from app.core.executor import EngineExecutor
+from app.core.startup import (
+    _make_cache_refresher,
+    init_reload_state,
+    init_resource_state,
+    start_cache_warmup,
+)
+from app.core.warmup import warm_cache, warmup_seeds
+
+SEEDS = list(range(1, 41))
+MISSING_SEED = 999
+
+
+class FakeEngine:
+    """recommend_batch만 계산 (recommend 호출 = 캐시 미스이므로 실패)"""
+
+    def __init__(self, batch_sec: float = 0.0):
+        self.batch_sec = batch_sec
+        self.batch_calls: List[List[int]] = []
+
+    def recommend_batch(self, seed_ids: List[int], k: int) -> List[Any]:
+        self.batch_calls.append(list(seed_ids))
+        time.sleep(self.batch_sec)
+        return [
+            ValueError(f"Seed not found: {seed_id}") if seed_id == MISSING_SEED else _result(seed_id, k)
+            for seed_id in seed_ids
+        ]
+
+    def recommend(self, seed_id: int, k: int) -> Dict[str, Any]:
+        raise AssertionError(f"cache miss for seed {seed_id}")
+
+    @property
+    def computed_seeds(self) -> List[int]:
+        return [seed_id for batch in self.batch_calls for seed_id in batch]
+
+
+def _result(seed_id: int, k: int) -> Dict[str, Any]:
+    song = {"song_name": f"song {seed_id}", "artist": f"artist {seed_id % 7}", "genre": "GN0101"}
+    return {
+        "method": "stage3_hybrid",
+        "seed": {"song_id": seed_id, **song},
+        "items": [
+            {"rank": rank, "song_id": seed_id * 1000 + rank, **song, "score": round(1.0 - rank / 100, 4)}
+            for rank in range(1, k + 1)
+        ],
+    }
+
+
+def _settings(**overrides: Any) -> Settings:
+    values = dict(
+        ENGINE_VERSION="stage3_test",
+        AUDIO_MODEL="myna",
+        CACHE_MAX_K=50,
+        CACHE_TTL_SEC=900,
+        CACHE_STALE_SEC=300,
+        CACHE_WARMUP_SEEDS=0,
+        CACHE_WARMUP_SOURCE="catalog",
+        CACHE_WARMUP_BATCH=16,
+        LOCAL_CACHE_MAX_ENTRIES=0,
+        SINGLE_FLIGHT=False,
+    )
+    values.update(overrides)
+    return Settings(**values)
+
+
+def _redis_cache(server: fakeredis.FakeServer) -> RedisCache:
+    """fakeredis 서버에 붙은 RedisCache (워커마다 별도 클라이언트, 같은 서버 공유)"""
+    cache = RedisCache("redis://localhost:6379/0")
+    cache._client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    return cache
+
+
+def _state(config: Settings, server: fakeredis.FakeServer) -> SimpleNamespace:
+    """로드가 끝난 세대 (엔진 실행기 없이 엔진 직접 호출)"""
+    state = SimpleNamespace(config=config)
+    init_resource_state(state)
+    init_reload_state(state)
+    state.meta_full = SimpleNamespace(song_ids=np.array(SEEDS, dtype=np.int64))
+    state.engine = FakeEngine()
+    state.redis_cache = _redis_cache(server)
+    state.cache_refresher = _make_cache_refresher(config)
+    return state
+
+
+def _app(state: SimpleNamespace) -> FastAPI:
+    app = FastAPI()
+    app.include_router(routes_recommend.router)
+    for name, value in vars(state).items():
+        setattr(app.state, name, value)
+    return app
+
+
+def test_warm_cache_writes_entries_served_by_recommend() -> None:
+    async def scenario() -> None:
+        server = fakeredis.FakeServer()
+        config = _settings()
+        state = _state(config, server)
+
+        stats = await warm_cache(state, SEEDS + [MISSING_SEED], k=20, batch_size=16, concurrency=2)
+        assert stats["seeds"] == len(SEEDS) + 1
+        assert stats["computed"] == len(SEEDS)
+        assert stats["errors"] == 1
+        assert stats["skipped"] == 0
+
+        # k와 무관하게 CACHE_MAX_K 깊이 키에 TTL과 함께 저장
+        client = state.redis_cache._client
+        depth = max(20, config.CACHE_MAX_K)
+        for seed_id in SEEDS:
+            key = make_recommend_cache_key(config.ENGINE_VERSION, config.AUDIO_MODEL, seed_id, depth)
+            ttl = await client.ttl(key)
+            assert 0 < ttl <= config.CACHE_TTL_SEC + config.CACHE_STALE_SEC
+        assert not await client.exists(
+            make_recommend_cache_key(config.ENGINE_VERSION, config.AUDIO_MODEL, SEEDS[0], 20)
+        )
+        assert not await client.exists(
+            make_recommend_cache_key(config.ENGINE_VERSION, config.AUDIO_MODEL, MISSING_SEED, depth)
+        )
+
+        # GET /recommend가 엔진 호출 없이 캐시 적중으로 응답 (k별로 앞부분만)
+        transport = httpx.ASGITransport(app=_app(state))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            for seed_id, k in ((SEEDS[0], 10), (SEEDS[-1], 20), (SEEDS[5], 50)):
+                response = await http.get("/recommend", params={"seed_id": seed_id, "k": k})
+                assert response.status_code == 200
+                body = response.json()
+                expected = _result(seed_id, depth)
+                assert body["cached"] is True
+                assert body["engine_version"] == config.ENGINE_VERSION
+                assert body["method"] == expected["method"]
+                assert body["seed"] == expected["seed"]
+                assert body["items"] == expected["items"][:k]
+
+    asyncio.run(scenario())
+
+
+def test_warm_cache_skips_existing_keys() -> None:
+    async def scenario() -> None:
+        server = fakeredis.FakeServer()
+        config = _settings()
+        state = _state(config, server)
+
+        await warm_cache(state, SEEDS, k=20, batch_size=16)
+        assert sorted(state.engine.computed_seeds) == SEEDS
+
+        # 두 번째 실행: 전부 건너뜀 (엔진 호출 없음)
+        state.engine.batch_calls.clear()
+        stats = await warm_cache(state, SEEDS, k=20, batch_size=16)
+        assert stats["skipped"] == len(SEEDS)
+        assert stats["computed"] == 0
+        assert state.engine.batch_calls == []
+
+        # 빠진 키만 다시 계산
+        depth = max(20, config.CACHE_MAX_K)
+        await state.redis_cache._client.delete(
+            make_recommend_cache_key(config.ENGINE_VERSION, config.AUDIO_MODEL, SEEDS[3], depth)
+        )
+        stats = await warm_cache(state, SEEDS, k=20, batch_size=16)
+        assert stats["skipped"] == len(SEEDS) - 1
+        assert stats["computed"] == 1
+        assert state.engine.computed_seeds == [SEEDS[3]]
+
+        # skip_existing=False면 모두 다시 계산
+        state.engine.batch_calls.clear()
+        stats = await warm_cache(state, SEEDS, k=20, batch_size=16, skip_existing=False)
+        assert stats["computed"] == len(SEEDS)
+        assert sorted(state.engine.computed_seeds) == SEEDS
+
+    asyncio.run(scenario())
+
+
+def test_warmup_seeds_catalog_limit() -> None:
+    state = _state(_settings(), fakeredis.FakeServer())
+    assert warmup_seeds(state, "catalog", limit=5) == SEEDS[:5]
+    assert warmup_seeds(state, "catalog") == SEEDS
+
+
+def test_startup_warmup_lock_allows_one_worker() -> None:
+    async def scenario() -> None:
+        server = fakeredis.FakeServer()
+        config = _settings(CACHE_WARMUP_SEEDS=len(SEEDS))
+        workers = [_state(config, server) for _ in range(2)]
+
+        for state in workers:
+            start_cache_warmup(state)
+        await asyncio.gather(*(state.warmup_task for state in workers))
+
+        # 같은 ENGINE_VERSION / AUDIO_MODEL 네임스페이스는 잠금을 잡은 워커 1개만 계산
+        computed = [state.engine.computed_seeds for state in workers]
+        assert sorted(len(seeds) for seeds in computed) == [0, len(SEEDS)]
+        client = workers[0].redis_cache._client
+        lock_key = f"lock:warmup:{config.ENGINE_VERSION}:{config.AUDIO_MODEL}"
+        assert await client.exists(lock_key)
+        assert 0 < await client.pttl(lock_key) <= config.CACHE_TTL_SEC * 1000
+
+        # 다른 네임스페이스(새 ENGINE_VERSION)는 별도 잠금이라 다시 워밍업
+        fresh = _state(_settings(CACHE_WARMUP_SEEDS=len(SEEDS), ENGINE_VERSION="stage3_test_v2"), server)
+        start_cache_warmup(fresh)
+        await fresh.warmup_task
+        assert sorted(fresh.engine.computed_seeds) == SEEDS
+
+    asyncio.run(scenario())
+
+
+def _lock_key(config: Settings) -> str:
+    return f"lock:warmup:{config.ENGINE_VERSION}:{config.AUDIO_MODEL}"
+
+
+async def _warmed_seeds(state: SimpleNamespace) -> List[int]:
+    config = state.config
+    depth = recommend_cache_depth(20, config.CACHE_MAX_K)
+    keys = [make_recommend_cache_key(config.ENGINE_VERSION, config.AUDIO_MODEL, seed_id, depth) for seed_id in SEEDS]
+    exists = await state.redis_cache.exists_many(keys)
+    return [seed_id for seed_id, hit in zip(SEEDS, exists) if hit]
+
+
+def test_cancelled_warmup_releases_lock_for_next_generation() -> None:
+    """
+    같은 ENGINE_VERSION으로 세대 교체(핫 리로드) -> 진행 중 워밍업 취소 후 새 세대가 나머지를 워밍업
+
+    취소된 워밍업은 CancelledError로 끝나고 잠금을 해제, 새 세대는 이미 채워진 키를 건너뜀
+    """
+    async def scenario() -> None:
+        server = fakeredis.FakeServer()
+        config = _settings(CACHE_WARMUP_SEEDS=len(SEEDS), CACHE_WARMUP_BATCH=8)
+        state = _state(config, server)
+        state.engine = FakeEngine(batch_sec=0.05)
+        state.engine_executor = EngineExecutor("thread", workers=1, max_queue=8)
+
+        start_cache_warmup(state)
+        first = state.warmup_task
+        while len(state.engine.batch_calls) < 2:
+            await asyncio.sleep(0.01)
+
+        # 세대 교체: 새 엔진 / 실행기, 같은 네임스페이스
+        old_engine = state.engine
+        state.engine = FakeEngine()
+        state.engine_executor = EngineExecutor("thread", workers=1, max_queue=8)
+        start_cache_warmup(state)
+        await state.warmup_task
+
+        assert first.cancelled()
+        warmed_before = set(old_engine.computed_seeds)
+        assert 0 < len(warmed_before) < len(SEEDS)
+        assert await _warmed_seeds(state) == SEEDS
+        # 새 세대는 이전 워밍업이 끝내지 못한 시드만 계산
+        assert set(state.engine.computed_seeds) >= set(SEEDS) - warmed_before
+        assert len(state.engine.computed_seeds) < len(SEEDS)
+        # 성공한 워밍업만 잠금 유지
+        assert await state.redis_cache._client.exists(_lock_key(config))
+
+    asyncio.run(scenario())
+
+
+def test_failed_warmup_releases_lock() -> None:
+    async def scenario() -> None:
+        server = fakeredis.FakeServer()
+        config = _settings(CACHE_WARMUP_SEEDS=len(SEEDS))
+        broken = _state(config, server)
+        broken.meta_full = None  # 시드 목록 없음 -> ValueError
+
+        start_cache_warmup(broken)
+        await broken.warmup_task
+        assert not await broken.redis_cache._client.exists(_lock_key(config))
+
+        state = _state(config, server)
+        start_cache_warmup(state)
+        await state.warmup_task
+        assert sorted(state.engine.computed_seeds) == SEEDS
+        assert await state.redis_cache._client.exists(_lock_key(config))
+
+    asyncio.run(scenario())